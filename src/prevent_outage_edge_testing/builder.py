@@ -13,9 +13,8 @@ Note: Generated test plans are starting points and should be reviewed.
 No tool can guarantee complete coverage of all failure modes.
 """
 
-import hashlib
 import re
-from datetime import datetime
+import secrets
 from typing import Any
 
 from jinja2 import Environment, BaseLoader
@@ -35,6 +34,12 @@ from prevent_outage_edge_testing.registry import PackRegistry, get_global_regist
 
 console = Console()
 
+# Shared by all builders so loader/cache setup happens once per process
+_JINJA_ENV = Environment(loader=BaseLoader(), auto_reload=False)
+
+# Characters replaced with "-" when deriving ids from test names
+_SAFE_NAME_RE = re.compile(r"[^a-z0-9]")
+
 
 class MatchResult(BaseModel):
     """Result of matching a description against knowledge packs."""
@@ -95,7 +100,7 @@ class TestPlanBuilder:
     ) -> None:
         self.registry = registry or get_global_registry()
         self.config = config or BuilderConfig()
-        self._jinja_env = Environment(loader=BaseLoader())
+        self._jinja_env = _JINJA_ENV
 
     def _extract_keywords(self, text: str) -> set[str]:
         """Extract relevant keywords from text."""
@@ -173,10 +178,8 @@ class TestPlanBuilder:
 
     def _generate_test_id(self, prefix: str, name: str) -> str:
         """Generate a unique test ID."""
-        hash_input = f"{prefix}-{name}-{datetime.utcnow().isoformat()}"
-        short_hash = hashlib.md5(hash_input.encode()).hexdigest()[:8]
-        safe_name = re.sub(r"[^a-z0-9]", "-", name.lower())[:30]
-        return f"{prefix}-{safe_name}-{short_hash}"
+        safe_name = _SAFE_NAME_RE.sub("-", name.lower())[:30]
+        return f"{prefix}-{safe_name}-{secrets.token_hex(4)}"
 
     def _adapt_test_template(
         self, template: TestCase, context: dict[str, Any]
@@ -13,19 +13,28 @@ Commands:
 
 import json
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Final, Iterable, Mapping, Optional
 
 import typer
 import yaml
+from pydantic import TypeAdapter
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.tree import Tree
 
 from prevent_outage_edge_testing.builder import TestPlanBuilder, BuilderConfig
+from prevent_outage_edge_testing.core import jsonio
 from prevent_outage_edge_testing.extractors import get_extractor_registry
-from prevent_outage_edge_testing.models import ExtractorMode, Severity
+from prevent_outage_edge_testing.models import (
+    ExtractorMode,
+    ObservabilityRecipe,
+    Severity,
+    TestPlan,
+)
 from prevent_outage_edge_testing.registry import PackRegistry, get_global_registry
 
 app = typer.Typer(
@@ -33,7 +42,16 @@ app = typer.Typer(
     help="Prevent Outage Edge Testing - Knowledge packs and test plan builder",
     no_args_is_help=True,
 )
-console = Console()
+# Auto-highlighting is disabled: all styling here is explicit markup
+console = Console(highlight=False)
+
+# Rich style per severity, shared by the pack and plan views
+_SEVERITY_COLOR: Final[Mapping[Severity, str]] = MappingProxyType({
+    Severity.CRITICAL: "red",
+    Severity.HIGH: "yellow",
+    Severity.MEDIUM: "blue",
+    Severity.LOW: "dim",
+})
 
 # Sub-command groups
 packs_app = typer.Typer(help="Manage knowledge packs")
@@ -47,6 +65,45 @@ app.add_typer(extractors_app, name="extractors")
 app.add_typer(export_app, name="export")
 
 
+# Validates either a single recipe object or a list of recipes in one pass
+_RECIPES_ADAPTER: TypeAdapter[list[ObservabilityRecipe] | ObservabilityRecipe] = TypeAdapter(
+    list[ObservabilityRecipe] | ObservabilityRecipe
+)
+
+
+def _load_plan(plan_file: Path) -> TestPlan:
+    """Load a test plan, validating JSON bytes directly without a dict roundtrip."""
+    if plan_file.suffix in (".yaml", ".yml"):
+        return TestPlan.model_validate(yaml.safe_load(plan_file.read_text()))
+    return TestPlan.model_validate_json(plan_file.read_bytes())
+
+
+def _load_recipes(recipes_file: Path) -> list[ObservabilityRecipe]:
+    """Load one or more observability recipes from a JSON/YAML file."""
+    if recipes_file.suffix in (".yaml", ".yml"):
+        recipes = _RECIPES_ADAPTER.validate_python(yaml.safe_load(recipes_file.read_text()))
+    else:
+        recipes = _RECIPES_ADAPTER.validate_json(recipes_file.read_bytes())
+    return recipes if isinstance(recipes, list) else [recipes]
+
+
+# When stdout is piped, tables are emitted as plain tab-separated rows
+_IS_TTY = console.is_terminal
+
+
+def _write_plain(rows: Iterable[tuple[str, ...]]) -> None:
+    """Write rows as tab-separated lines in a single stdout write."""
+    sys.stdout.write("".join("\t".join(row) + "\n" for row in rows))
+    sys.stdout.flush()
+
+
+def _truncate(text: str, width: int) -> str:
+    """Clip text to width characters, marking the cut with an ellipsis."""
+    if len(text) <= width:
+        return text
+    return text[: width - 3] + "..."
+
+
 # ============== Packs Commands ==============
 
 
@@ -74,6 +131,13 @@ def packs_list(
         console.print("[yellow]No packs found. Load packs with 'poet packs load'[/yellow]")
         return
 
+    if not _IS_TTY:
+        _write_plain(
+            (p.id, p.name, p.version, str(len(p.failure_modes)), ",".join(p.tags))
+            for p in packs
+        )
+        return
+
     table = Table(title="Knowledge Packs")
     table.add_column("ID", style="cyan")
     table.add_column("Name", style="green")
@@ -87,7 +151,7 @@ def packs_list(
             pack.name,
             pack.version,
             str(len(pack.failure_modes)),
-            ", ".join(pack.tags[:3]),
+            ", ".join(islice(pack.tags, 3)),
         )
 
     console.print(table)
@@ -112,14 +176,9 @@ def packs_show(pack_id: str = typer.Argument(..., help="Pack ID to show")) -> No
     # Failure modes
     fm_branch = tree.add("[bold]Failure Modes[/bold]")
     for fm in pack.failure_modes:
-        severity_color = {
-            Severity.CRITICAL: "red",
-            Severity.HIGH: "yellow",
-            Severity.MEDIUM: "blue",
-            Severity.LOW: "dim",
-        }.get(fm.severity, "white")
+        severity_color = _SEVERITY_COLOR.get(fm.severity, "white")
         fm_node = fm_branch.add(f"[{severity_color}]{fm.name}[/{severity_color}]")
-        fm_node.add(f"[dim]{fm.description[:80]}...[/dim]")
+        fm_node.add(f"[dim]{_truncate(fm.description, 80)}[/dim]")
 
     # Test templates
     if pack.test_templates:
@@ -208,6 +267,11 @@ def build_plan(
         else:
             output.write_text(json.dumps(plan_dict, indent=2, default=str))
         console.print(f"[green]Test plan written to {output}[/green]")
+    elif not _IS_TTY:
+        _write_plain(
+            (tc.name, tc.priority.value, tc.failure_mode_id or "-", ",".join(tc.tags))
+            for tc in plan.test_cases
+        )
     else:
         # Display summary
         console.print()
@@ -220,17 +284,12 @@ def build_plan(
         table.add_column("Tags")
 
         for tc in plan.test_cases:
-            priority_color = {
-                Severity.CRITICAL: "red",
-                Severity.HIGH: "yellow",
-                Severity.MEDIUM: "blue",
-                Severity.LOW: "dim",
-            }.get(tc.priority, "white")
+            priority_color = _SEVERITY_COLOR.get(tc.priority, "white")
             table.add_row(
-                tc.name[:40],
+                _truncate(tc.name, 40),
                 f"[{priority_color}]{tc.priority.value}[/{priority_color}]",
                 tc.failure_mode_id or "-",
-                ", ".join(tc.tags[:2]),
+                ", ".join(islice(tc.tags, 2)),
             )
 
         console.print(table)
@@ -251,15 +310,7 @@ def build_observability(
         raise typer.Exit(1)
 
     # Load plan
-    content = plan_file.read_text()
-    if plan_file.suffix in (".yaml", ".yml"):
-        plan_data = yaml.safe_load(content)
-    else:
-        plan_data = json.loads(content)
-
-    from prevent_outage_edge_testing.models import TestPlan
-
-    plan = TestPlan.model_validate(plan_data)
+    plan = _load_plan(plan_file)
 
     # Get recipes
     builder = TestPlanBuilder()
@@ -372,6 +423,10 @@ def extractors_run(
 # ============== Export Commands ==============
 
 
+# Write buffer for generated export files; coalesces per-line writes
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+
 @export_app.command("pytest")
 def export_pytest(
     plan_file: Path = typer.Argument(..., help="Test plan JSON/YAML file"),
@@ -384,15 +439,7 @@ def export_pytest(
         console.print(f"[red]File not found: {plan_file}[/red]")
         raise typer.Exit(1)
 
-    content = plan_file.read_text()
-    if plan_file.suffix in (".yaml", ".yml"):
-        plan_data = yaml.safe_load(content)
-    else:
-        plan_data = json.loads(content)
-
-    from prevent_outage_edge_testing.models import TestPlan
-
-    plan = TestPlan.model_validate(plan_data)
+    plan = _load_plan(plan_file)
 
     # Generate pytest file
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -444,10 +491,33 @@ def export_pytest(
         lines.append("")
         lines.append("")
 
-    test_file.write_text("\n".join(lines))
+    # Stream lines through a large buffer instead of joining one big string
+    with open(test_file, "wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+        # Newline-separated like "\n".join(lines): no trailing newline
+        f.writelines(
+            (b"\n" if i else b"") + line.encode("utf-8") for i, line in enumerate(lines)
+        )
     console.print(f"[green]Generated pytest file: {test_file}[/green]")
 
 
+# Grafana skeletons; per-panel/dashboard fields are overlaid, key order is kept
+_GRAFANA_PANEL_TMPL: dict[str, Any] = {
+    "id": 0,
+    "title": "",
+    "type": "timeseries",
+    "targets": [],
+    "gridPos": {},
+}
+_GRAFANA_DASHBOARD_TMPL: dict[str, Any] = {
+    "title": "",
+    "uid": None,
+    "panels": [],
+    "schemaVersion": 38,
+    "version": 1,
+    "refresh": "30s",
+}
+
+
 @export_app.command("grafana")
 def export_grafana(
     recipes_file: Path = typer.Argument(..., help="Observability recipes JSON/YAML"),
@@ -460,51 +530,31 @@ def export_grafana(
         console.print(f"[red]File not found: {recipes_file}[/red]")
         raise typer.Exit(1)
 
-    content = recipes_file.read_text()
-    if recipes_file.suffix in (".yaml", ".yml"):
-        recipes_data = yaml.safe_load(content)
-    else:
-        recipes_data = json.loads(content)
-
-    from prevent_outage_edge_testing.models import ObservabilityRecipe
-
-    if isinstance(recipes_data, list):
-        recipes = [ObservabilityRecipe.model_validate(r) for r in recipes_data]
-    else:
-        recipes = [ObservabilityRecipe.model_validate(recipes_data)]
+    recipes = _load_recipes(recipes_file)
 
     # Generate basic Grafana dashboard
-    panels = []
-    panel_id = 1
-
-    for recipe in recipes:
-        for metric in recipe.metrics:
-            panels.append(
-                {
-                    "id": panel_id,
-                    "title": metric.name,
-                    "type": "timeseries" if metric.type != "gauge" else "gauge",
-                    "targets": [
-                        {
-                            "expr": metric.name,
-                            "legendFormat": "{{" + ",".join(metric.labels) + "}}",
-                        }
-                    ],
-                    "gridPos": {"h": 8, "w": 12, "x": (panel_id - 1) % 2 * 12, "y": ((panel_id - 1) // 2) * 8},
-                }
-            )
-            panel_id += 1
+    metrics = [metric for recipe in recipes for metric in recipe.metrics]
+    panels = [
+        {
+            **_GRAFANA_PANEL_TMPL,
+            "id": i + 1,
+            "title": metric.name,
+            "type": "gauge" if metric.type == "gauge" else "timeseries",
+            "targets": [
+                {"expr": metric.name, "legendFormat": "{{" + ",".join(metric.labels) + "}}"}
+            ],
+            "gridPos": {"h": 8, "w": 12, "x": i % 2 * 12, "y": i // 2 * 8},
+        }
+        for i, metric in enumerate(metrics)
+    ]
 
     dashboard = {
+        **_GRAFANA_DASHBOARD_TMPL,
         "title": f"Generated Dashboard - {recipes[0].name if recipes else 'Unknown'}",
-        "uid": None,
         "panels": panels,
-        "schemaVersion": 38,
-        "version": 1,
-        "refresh": "30s",
     }
 
-    output.write_text(json.dumps(dashboard, indent=2))
+    output.write_bytes(jsonio.dumps(dashboard, indent=True))
     console.print(f"[green]Generated Grafana dashboard: {output}[/green]")
 
 
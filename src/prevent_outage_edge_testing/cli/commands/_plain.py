@@ -0,0 +1,12 @@
+# src/prevent_outage_edge_testing/cli/commands/_plain.py
+"""Tab-separated output used by commands when stdout is not a terminal."""
+
+from typing import Iterable
+
+# Tabs/newlines inside a cell would break tab-separated rows when piped
+_PLAIN_CELL = str.maketrans({"\t": " ", "\n": " ", "\r": " "})
+
+
+def plain_row(cells: Iterable[object]) -> str:
+    """Format cells as one tab-separated line, flattening tabs/newlines in each."""
+    return "\t".join(str(cell).translate(_PLAIN_CELL) for cell in cells) + "\n"
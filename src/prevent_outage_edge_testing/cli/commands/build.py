@@ -9,15 +9,16 @@ Outputs:
 - observability/: Monitoring recipes (optional)
 """
 
+import functools
 import hashlib
+import os
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from time import localtime, strftime
+from typing import Iterable, Optional
 
 import typer
-import yaml
-from jinja2 import Environment, PackageLoader, select_autoescape
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -43,7 +44,7 @@ def build_command(
         None, "--obligations", help="Obligation patterns to include (e.g., 'cache.*')"
     ),
     packs_filter: Optional[str] = typer.Option(
-        None, "--packs", help="Specific packs to use (comma-separated)"
+        None, "--packs", help="Specific packs to use (comma-separated, globs allowed)"
     ),
     output_dir: Path = typer.Option(
         Path("generated"), "--output", "-o", help="Output directory"
@@ -92,13 +93,15 @@ def build_command(
             raise typer.Exit(1)
         # For now, extract paths from OpenAPI as description
         console.print(f"[yellow]OpenAPI support is experimental[/yellow]")
-        description = f"OpenAPI spec: {openapi.name}\n\n" + openapi.read_text()[:2000]
+        # Only the head of the spec is used, so don't read the whole file
+        with openapi.open(encoding="utf-8") as fh:
+            description = f"OpenAPI spec: {openapi.name}\n\n" + fh.read(2000)
         input_mode = "openapi"
     elif jira_file:
         if not jira_file.exists():
             console.print(f"[red]File not found: {jira_file}[/red]")
             raise typer.Exit(1)
-        description = jira_file.read_text()
+        description = jira_file.read_bytes().decode("utf-8")
         input_mode = "file"
     elif jira_text:
         description = jira_text
@@ -110,7 +113,8 @@ def build_command(
     else:
         console.print("[yellow]Enter feature description (Ctrl+D to end):[/yellow]")
         import sys
-        description = sys.stdin.read()
+        # One bulk read + decode instead of incremental text-mode decoding
+        description = sys.stdin.buffer.read().decode("utf-8", errors="replace")
         input_mode = "stdin"
     
     if not description.strip() and input_mode not in ("direct",):
@@ -120,15 +124,22 @@ def build_command(
     # Load config
     config = load_config()
     
+    # No spinner (or its refresh thread) when nobody is watching
+    show_progress = console.is_terminal and not os.environ.get("CI")
+    
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        disable=not show_progress,
     ) as progress:
         # Load packs
         task = progress.add_task("Loading knowledge packs...", total=None)
         loader = PackLoader(config.packs_paths if config else [Path("packs")])
-        packs = loader.load_all()
+        pack_patterns = (
+            [p.strip() for p in packs_filter.split(",") if p.strip()] if packs_filter else None
+        )
+        packs = loader.load_all(pack_patterns)
         progress.update(task, completed=True)
         
         # Build test plan
@@ -151,19 +162,22 @@ def build_command(
         progress.update(task, completed=True)
         
         # Generate starter tests
-        task = progress.add_task("Generating starter tests...", total=None)
         tests_dir = output_dir / "tests"
-        tests_dir.mkdir(exist_ok=True)
-        _write_starter_tests(tests_dir, result)
-        progress.update(task, completed=True)
+        if result.plan.test_cases:
+            task = progress.add_task("Generating starter tests...", total=None)
+            tests_dir.mkdir(exist_ok=True)
+            _write_starter_tests(tests_dir, result)
+            progress.update(task, completed=True)
         
         # Generate snippets
         if include_snippets and result.snippets:
             task = progress.add_task("Copying code snippets...", total=None)
             snippets_dir = output_dir / "snippets"
             snippets_dir.mkdir(exist_ok=True)
-            for snippet in result.snippets:
-                (snippets_dir / snippet.filename).write_text(snippet.content)
+            _write_files(
+                (snippets_dir / snippet.filename, snippet.content)
+                for snippet in result.snippets
+            )
             progress.update(task, completed=True)
         
         # Generate observability recipes
@@ -171,9 +185,10 @@ def build_command(
             task = progress.add_task("Generating observability recipes...", total=None)
             recipes_dir = output_dir / "observability"
             recipes_dir.mkdir(exist_ok=True)
-            for recipe in result.recipes:
-                recipe_path = recipes_dir / f"{recipe.id}.md"
-                recipe_path.write_text(recipe.to_markdown())
+            _write_files(
+                (recipes_dir / f"{recipe.id}.md", recipe.to_markdown())
+                for recipe in result.recipes
+            )
             progress.update(task, completed=True)
     
     # Show explanation if requested
@@ -192,87 +207,112 @@ def build_command(
     
     console.print(f"\n[bold]Output:[/bold]")
     console.print(f"  📄 {testplan_path}")
-    console.print(f"  🧪 {tests_dir}/")
+    if result.plan.test_cases:
+        console.print(f"  🧪 {tests_dir}/")
     if include_snippets and result.snippets:
         console.print(f"  📝 {output_dir}/snippets/")
     if include_recipes and result.recipes:
         console.print(f"  📊 {output_dir}/observability/")
 
 
+_MAX_WRITE_WORKERS = 8
+
+
+def _write_files(files: Iterable[tuple[Path, str]]) -> None:
+    """Write (path, text) pairs as UTF-8, overlapping the writes on a few threads."""
+    payloads = [(path, text.encode("utf-8")) for path, text in files]
+    if not payloads:
+        return
+    with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(payloads))) as pool:
+        # list() re-raises the first write error, if any
+        list(pool.map(lambda item: item[0].write_bytes(item[1]), payloads))
+
+
+# Runs of characters that cannot appear in a generated Python identifier
+_SAFE_IDENT_RE = re.compile(r"[^a-z0-9]+")
+
+# Generated files are streamed through one buffered handle
+_WRITE_BUFFER_SIZE = 1 << 16
+
+# Per-test-case TESTPLAN.md block; step/assertion fields are newline-terminated lists
+_TESTCASE_MD_TMPL = (
+    "### {i}. {name}\n"
+    "\n"
+    "**Priority:** {priority}\n"
+    "**Failure Mode:** `{failure_mode}`\n"
+    "\n"
+    "{description}\n"
+    "\n"
+    "**Setup:**\n"
+    "{setup}\n"
+    "**Execution:**\n"
+    "{execution}\n"
+    "**Assertions:**\n"
+    "{assertions}"
+)
+
+
 def _write_testplan_md(path: Path, result, description: str) -> None:
     """Write the TESTPLAN.md file."""
-    lines = [
-        f"# {result.plan.title}",
-        "",
-        f"> Generated by POET on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        "",
-        "## Source Description",
-        "",
-        "```",
-        description.strip(),
-        "```",
-        "",
-        "## Failure Modes Covered",
-        "",
-    ]
-    
-    for fm_id in result.plan.failure_modes_covered:
-        lines.append(f"- `{fm_id}`")
-    
-    lines.extend([
-        "",
-        "## Test Cases",
-        "",
-    ])
-    
-    for i, tc in enumerate(result.plan.test_cases, 1):
-        lines.extend([
-            f"### {i}. {tc.name}",
-            "",
-            f"**Priority:** {tc.priority.value}",
-            f"**Failure Mode:** `{tc.failure_mode_id or 'N/A'}`",
-            "",
-            tc.description,
-            "",
-            "**Setup:**",
-        ])
-        for step in tc.setup_steps:
-            lines.append(f"1. {step}")
+    plan = result.plan
+    with path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        # Bound once; the loops below run per failure mode / test case
+        write = f.write
+        render = _TESTCASE_MD_TMPL.format_map
+        write(
+            f"# {plan.title}\n"
+            "\n"
+            f"> Generated by POET on {strftime('%Y-%m-%d %H:%M:%S', localtime())}\n"
+            "\n"
+            "## Source Description\n"
+            "\n"
+            "```\n"
+            f"{description.strip()}\n"
+            "```\n"
+            "\n"
+            "## Failure Modes Covered\n"
+            "\n"
+        )
+        for fm_id in plan.failure_modes_covered:
+            write(f"- `{fm_id}`\n")
         
-        lines.extend(["", "**Execution:**"])
-        for step in tc.execution_steps:
-            lines.append(f"1. {step}")
+        write("\n## Test Cases\n\n")
         
-        lines.extend(["", "**Assertions:**"])
-        for assertion in tc.assertions:
-            lines.append(f"- [ ] {assertion.description}")
+        for i, tc in enumerate(plan.test_cases, 1):
+            write(render({
+                "i": i,
+                "name": tc.name,
+                "priority": tc.priority.value,
+                "failure_mode": tc.failure_mode_id or "N/A",
+                "description": tc.description,
+                "setup": "".join(f"1. {step}\n" for step in tc.setup_steps),
+                "execution": "".join(f"1. {step}\n" for step in tc.execution_steps),
+                "assertions": "".join(f"- [ ] {a.description}\n" for a in tc.assertions),
+            }))
+            write("\n")
         
-        lines.append("")
-    
-    lines.extend([
-        "## Coverage Notes",
-        "",
-        result.plan.coverage_notes or "_No additional notes._",
-        "",
-        "---",
-        "",
-        "_This test plan is a starting point. Review and customize before use._",
-        "_POET does not guarantee complete coverage of all failure modes._",
-    ])
-    
-    path.write_text("\n".join(lines))
+        write(
+            "## Coverage Notes\n"
+            "\n"
+            f"{plan.coverage_notes or '_No additional notes._'}\n"
+            "\n"
+            "---\n"
+            "\n"
+            "_This test plan is a starting point. Review and customize before use._\n"
+            "_POET does not guarantee complete coverage of all failure modes._"
+        )
 
 
 def _print_explanation(result, description: str) -> None:
     """Print pack selection explanation."""
-    from rich.table import Table
     from rich.tree import Tree
     
     console.print()
     console.print(Panel("[bold]Pack Selection Explanation[/bold]", style="cyan"))
     
-    # Extract keywords from description
-    keywords = _extract_keywords(description)
+    # Extract keywords from description (lowercased once for both scanners)
+    desc_lower = description.lower()
+    keywords = _extract_keywords(desc_lower)
     
     # Show matched keywords
     console.print("\n[bold]Matched Keywords:[/bold]")
@@ -301,7 +341,7 @@ def _print_explanation(result, description: str) -> None:
     
     # Show assumptions
     console.print("\n[bold]Assumptions Detected:[/bold]")
-    assumptions = _detect_assumptions(description)
+    assumptions = _detect_assumptions(desc_lower)
     if assumptions:
         for assumption in assumptions:
             console.print(f"  • {assumption}")
@@ -319,62 +359,99 @@ def _print_explanation(result, description: str) -> None:
         console.print("  [dim]No specific obligations matched[/dim]")
 
 
-def _extract_keywords(description: str) -> dict[str, list[str]]:
-    """Extract domain keywords from description."""
-    keyword_map = {
-        "cache": ["edge-http-cache-correctness"],
-        "caching": ["edge-http-cache-correctness"],
-        "stale": ["edge-http-cache-correctness"],
-        "vary": ["edge-http-cache-correctness"],
-        "ttl": ["edge-http-cache-correctness"],
-        "routing": ["edge-http-cache-correctness"],
-        "backend": ["edge-http-cache-correctness"],
-        "latency": ["edge-latency-regression-observability"],
-        "p99": ["edge-latency-regression-observability"],
-        "timeout": ["edge-latency-regression-observability", "fault-injection-io"],
-        "performance": ["edge-latency-regression-observability"],
-        "fault": ["fault-injection-io"],
-        "injection": ["fault-injection-io"],
-        "failure": ["fault-injection-io"],
-        "retry": ["fault-injection-io"],
-        "circuit": ["fault-injection-io"],
-    }
-    
-    found = {}
-    desc_lower = description.lower()
-    for keyword, packs in keyword_map.items():
-        if keyword in desc_lower:
-            found[keyword] = packs
-    return found
+# Domain keyword -> packs it points at, in display order
+_KEYWORD_PACKS: dict[str, list[str]] = {
+    "cache": ["edge-http-cache-correctness"],
+    "caching": ["edge-http-cache-correctness"],
+    "stale": ["edge-http-cache-correctness"],
+    "vary": ["edge-http-cache-correctness"],
+    "ttl": ["edge-http-cache-correctness"],
+    "routing": ["edge-http-cache-correctness"],
+    "backend": ["edge-http-cache-correctness"],
+    "latency": ["edge-latency-regression-observability"],
+    "p99": ["edge-latency-regression-observability"],
+    "timeout": ["edge-latency-regression-observability", "fault-injection-io"],
+    "performance": ["edge-latency-regression-observability"],
+    "fault": ["fault-injection-io"],
+    "injection": ["fault-injection-io"],
+    "failure": ["fault-injection-io"],
+    "retry": ["fault-injection-io"],
+    "circuit": ["fault-injection-io"],
+}
 
+# All keywords in one pass; the lookahead reports overlapping hits like `in` does
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, _KEYWORD_PACKS)) + "))"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _extract_keywords(desc_lower: str) -> dict[str, list[str]]:
+    """Extract domain keywords from an already-lowercased description (cached; read-only)."""
+    hits = set(_KEYWORD_RE.findall(desc_lower))
+    return {kw: packs for kw, packs in _KEYWORD_PACKS.items() if kw in hits}
+
+
+# Description token -> assumption it implies, in display order
+# ("api" also covers "/api/")
+_ASSUMPTION_TOKENS: dict[str, str] = {
+    "nginx": "Proxy type: NGINX",
+    "haproxy": "Proxy type: HAProxy",
+    "envoy": "Proxy type: Envoy",
+    "redis": "Cache backend: Redis",
+    "production": "Environment: Production",
+    "staging": "Environment: Staging",
+    "api": "Scope: API endpoints",
+    "cdn": "Scope: CDN/Edge",
+}
+
+_ASSUMPTION_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, _ASSUMPTION_TOKENS)) + "))"
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _detect_assumptions(desc_lower: str) -> list[str]:
+    """Detect assumptions from an already-lowercased description (cached; read-only)."""
+    hits = set(_ASSUMPTION_RE.findall(desc_lower))
+    return [msg for token, msg in _ASSUMPTION_TOKENS.items() if token in hits]
 
-def _detect_assumptions(description: str) -> list[str]:
-    """Detect assumptions from description."""
-    assumptions = []
-    desc_lower = description.lower()
-    
-    if "nginx" in desc_lower:
-        assumptions.append("Proxy type: NGINX")
-    if "haproxy" in desc_lower:
-        assumptions.append("Proxy type: HAProxy")
-    if "envoy" in desc_lower:
-        assumptions.append("Proxy type: Envoy")
-    if "redis" in desc_lower:
-        assumptions.append("Cache backend: Redis")
-    if "production" in desc_lower:
-        assumptions.append("Environment: Production")
-    if "staging" in desc_lower:
-        assumptions.append("Environment: Staging")
-    if "api" in desc_lower or "/api/" in desc_lower:
-        assumptions.append("Scope: API endpoints")
-    if "cdn" in desc_lower:
-        assumptions.append("Scope: CDN/Edge")
-    
-    return assumptions
+
+# Per-test-case starter test function; step fields are "\n    # ..." comment runs
+_STARTER_TEST_TMPL = (
+    "\n"
+    "@pytest.mark.{priority}\n"
+    "def test_{func_name}(test_config):\n"
+    '    """\n'
+    "    {name}\n"
+    "    \n"
+    "    {description}\n"
+    "    \n"
+    "    Failure Mode: {failure_mode}\n"
+    '    """\n'
+    "    # === SETUP ==={setup}\n"
+    "    \n"
+    "    # === EXECUTION ==={execution}\n"
+    "    \n"
+    "    # === ASSERTIONS ==={assertions}\n"
+    "    \n"
+    "    # === CLEANUP ==={cleanup}\n"
+    "    \n"
+    '    pytest.skip("Generated test - implement before use")\n'
+    "\n"
+)
+
+
+def _comment_lines(steps: list[str]) -> str:
+    """Render steps as indented comment lines, each preceded by a newline."""
+    return "".join(f"\n    # {step}" for step in steps)
 
 
 def _write_starter_tests(tests_dir: Path, result) -> None:
-    """Write starter pytest files."""
+    """Write starter pytest files (nothing is written for an empty plan)."""
+    if not result.plan.test_cases:
+        return
+    
     # Write conftest.py
     conftest = tests_dir / "conftest.py"
     conftest.write_text('''# conftest.py - Generated by POET
@@ -405,69 +482,42 @@ def mock_service():
 ''')
     
     # Write test file
-    safe_title = re.sub(r"[^a-z0-9]+", "_", result.plan.title.lower())[:50]
+    plan = result.plan
+    safe_title = _SAFE_IDENT_RE.sub("_", plan.title.lower())[:50]
     test_file = tests_dir / f"test_{safe_title}.py"
     
-    lines = [
-        f'# test_{safe_title}.py - Generated by POET',
-        '# Starter tests for: ' + result.plan.title,
-        '"""',
-        f'Auto-generated tests for: {result.plan.title}',
-        f'Generated: {datetime.now().isoformat()}',
-        '',
-        'WARNING: These are starter tests. Review and implement before use.',
-        'POET does not guarantee complete coverage of all failure modes.',
-        '"""',
-        '',
-        'import pytest',
-        '',
-        '',
-    ]
-    
-    for tc in result.plan.test_cases:
-        func_name = re.sub(r"[^a-z0-9]+", "_", tc.name.lower())[:60]
-        lines.extend([
-            f'@pytest.mark.{tc.priority.value}',
-            f'def test_{func_name}(test_config):',
-            f'    """',
-            f'    {tc.name}',
-            f'    ',
-            f'    {tc.description}',
-            f'    ',
-            f'    Failure Mode: {tc.failure_mode_id or "N/A"}',
-            f'    """',
-            f'    # === SETUP ===',
-        ])
-        for step in tc.setup_steps:
-            lines.append(f'    # {step}')
-        
-        lines.extend([
-            f'    ',
-            f'    # === EXECUTION ===',
-        ])
-        for step in tc.execution_steps:
-            lines.append(f'    # {step}')
-        
-        lines.extend([
-            f'    ',
-            f'    # === ASSERTIONS ===',
-        ])
-        for assertion in tc.assertions:
-            lines.append(f'    # TODO: {assertion.description}')
-            lines.append(f'    # assert {assertion.expression}')
-        
-        lines.extend([
-            f'    ',
-            f'    # === CLEANUP ===',
-        ])
-        for step in tc.cleanup_steps:
-            lines.append(f'    # {step}')
+    with test_file.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        # Bound once; the loop below runs per test case
+        write = f.write
+        render = _STARTER_TEST_TMPL.format_map
+        sanitize = _SAFE_IDENT_RE.sub
+        write(
+            f'# test_{safe_title}.py - Generated by POET\n'
+            f'# Starter tests for: {plan.title}\n'
+            '"""\n'
+            f'Auto-generated tests for: {plan.title}\n'
+            f'Generated: {strftime("%Y-%m-%dT%H:%M:%S", localtime())}\n'
+            '\n'
+            'WARNING: These are starter tests. Review and implement before use.\n'
+            'POET does not guarantee complete coverage of all failure modes.\n'
+            '"""\n'
+            '\n'
+            'import pytest\n'
+            '\n'
+        )
         
-        lines.extend([
-            f'    ',
-            f'    pytest.skip("Generated test - implement before use")',
-            '',
-            '',
-        ])
-    
-    test_file.write_text('\n'.join(lines))
+        for tc in plan.test_cases:
+            write(render({
+                "priority": tc.priority.value,
+                "func_name": sanitize("_", tc.name.lower())[:60],
+                "name": tc.name,
+                "description": tc.description,
+                "failure_mode": tc.failure_mode_id or "N/A",
+                "setup": _comment_lines(tc.setup_steps),
+                "execution": _comment_lines(tc.execution_steps),
+                "assertions": "".join(
+                    f"\n    # TODO: {a.description}\n    # assert {a.expression}"
+                    for a in tc.assertions
+                ),
+                "cleanup": _comment_lines(tc.cleanup_steps),
+            }))
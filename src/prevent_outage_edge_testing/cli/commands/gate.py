@@ -9,17 +9,15 @@ Usage:
     poet gate report                  # Show latest report
 """
 
+import os
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
-from rich.tree import Tree
 
-from prevent_outage_edge_testing.gates.runner import GateRunner
-from prevent_outage_edge_testing.gates.reporter import ReportGenerator
+from prevent_outage_edge_testing.core import jsonio
 from prevent_outage_edge_testing.gates.models import GateStatus
 
 app = typer.Typer(help="Run release gates and generate reports")
@@ -53,6 +51,10 @@ def _status_icon(status) -> str:
 @app.command("list")
 def list_gates() -> None:
     """List all available release gates."""
+    from rich.table import Table
+    
+    from prevent_outage_edge_testing.gates.runner import GateRunner
+    
     gates = GateRunner.available_gates()
     
     table = Table(title="Available Release Gates")
@@ -105,7 +107,10 @@ def run_gates(
         poet gate run --gate contract --gate cache  # Run specific gates
         poet gate run --all --fail-fast        # Stop on first failure
     """
-    import json as json_lib
+    from rich.tree import Tree
+    
+    from prevent_outage_edge_testing.gates.reporter import ReportGenerator
+    from prevent_outage_edge_testing.gates.runner import GateRunner
     
     if not all_gates and not gate:
         console.print("[red]Error: Specify --all or --gate <id>[/red]")
@@ -134,7 +139,12 @@ def run_gates(
         console.print()
     
     # Run gates
-    with console.status("[bold blue]Running gates...[/bold blue]") if not json_only else nullcontext():
+    show_status = not json_only and console.is_terminal and not os.environ.get("CI")
+    with (
+        console.status("[bold blue]Running gates...[/bold blue]")
+        if show_status
+        else nullcontext()
+    ):
         report = runner.run_all(gate_ids=gate_ids, fail_fast=fail_fast)
     
     # Generate reports
@@ -142,7 +152,7 @@ def run_gates(
     json_path, html_path = reporter.save_all(report)
     
     if json_only:
-        console.print(json_lib.dumps(report.to_dict(), indent=2))
+        console.print(jsonio.dumps(report.to_dict(), indent=True).decode())
         raise typer.Exit(0 if report.overall_status == GateStatus.PASSED else 1)
     
     # Print results per gate
@@ -201,8 +211,6 @@ def show_report(
     ),
 ) -> None:
     """Show the latest gate report."""
-    import json as json_lib
-    
     reports_dir = output_dir or Path(".poet/reports")
     latest_json = reports_dir / "latest.json"
     latest_html = reports_dir / "latest.html"
@@ -211,11 +219,10 @@ def show_report(
         console.print("[yellow]No reports found. Run 'poet gate run --all' first.[/yellow]")
         raise typer.Exit(1)
     
-    with open(latest_json) as f:
-        data = json_lib.load(f)
+    data = jsonio.loads(latest_json.read_bytes())
     
     if json_output:
-        console.print(json_lib.dumps(data, indent=2))
+        console.print(jsonio.dumps(data, indent=True).decode())
         return
     
     # Display summary
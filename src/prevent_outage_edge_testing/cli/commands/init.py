@@ -10,6 +10,7 @@ The config file stores:
 - User preferences
 """
 
+import functools
 import os
 import platform
 import shutil
@@ -20,13 +21,23 @@ import yaml
 from rich.console import Console
 from rich.panel import Panel
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+
 from prevent_outage_edge_testing.core.config import PoetConfig, SystemProfile
 
 console = Console()
 
 
+@functools.cache
 def detect_system_profile() -> SystemProfile:
-    """Detect system capabilities for privileged operations."""
+    """
+    Detect system capabilities for privileged operations.
+    
+    The result is cached for the life of the process; treat it as read-only.
+    """
     system = platform.system()
     
     # Check DTrace availability (macOS, Solaris)
@@ -99,30 +110,23 @@ def init_command(
         default_output_dir=Path("generated"),
     )
     
-    # Write config
+    # Write config; JSON mode already renders Path fields as plain strings
     config_dict = config.model_dump(mode="json")
-    # Convert Path objects to strings for YAML
-    def path_to_str(obj):
-        if isinstance(obj, dict):
-            return {k: path_to_str(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [path_to_str(v) for v in obj]
-        elif isinstance(obj, Path):
-            return str(obj)
-        return obj
-    
-    config_dict = path_to_str(config_dict)
     
     with open(path, "w") as f:
-        yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            config_dict, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False
+        )
     
     console.print(f"\n[green]✓ Created config at {path}[/green]")
     
     # Create directories
     for pack_path in config.packs_paths:
-        if not pack_path.exists():
-            pack_path.mkdir(parents=True, exist_ok=True)
-            console.print(f"[dim]Created directory: {pack_path}[/dim]")
+        try:
+            pack_path.mkdir(parents=True)
+        except FileExistsError:
+            continue
+        console.print(f"[dim]Created directory: {pack_path}[/dim]")
     
     console.print("\n[bold]Next steps:[/bold]")
     console.print("  1. Run [cyan]poet packs list[/cyan] to see available packs")
@@ -15,23 +15,21 @@ Commands:
 - poet learn show                 : Display learned patterns summary
 """
 
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.table import Table
-from rich.tree import Tree
 
+from prevent_outage_edge_testing.cli.commands._plain import plain_row
 from prevent_outage_edge_testing.learner.analyzer import (
     TestAnalyzer,
-    analyze_test_file,
+    analyze_many,
     discover_test_files,
 )
 from prevent_outage_edge_testing.learner.extractor import PatternExtractor
-from prevent_outage_edge_testing.learner.models import LearnedPatterns, FixtureRole
+from prevent_outage_edge_testing.learner.models import LearnedPatterns
 from prevent_outage_edge_testing.learner.storage import (
     save_patterns,
     load_patterns,
@@ -39,6 +37,12 @@ from prevent_outage_edge_testing.learner.storage import (
     get_patterns_path,
 )
 
+if TYPE_CHECKING:
+    from rich.text import Text
+
+    # One table row; cells may carry Rich styling (plain output uses str())
+    _Row = tuple[str | Text, ...]
+
 console = Console()
 
 # Create subcommand app for learn
@@ -77,6 +81,8 @@ def learn_from_tests(
         poet learn from-tests ./tests/test_cache.py -v
         poet learn from-tests ./tests/ --replace
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+    
     if not path.exists():
         console.print(f"[red]Error: Path not found: {path}[/red]")
         raise typer.Exit(1)
@@ -106,14 +112,13 @@ def learn_from_tests(
         console=console,
     ) as progress:
         task = progress.add_task("Parsing test files...", total=len(test_files))
-        
-        for test_file in test_files:
-            result = analyze_test_file(test_file)
-            if result:
-                parsed_files.append(result)
-            else:
-                parse_errors.append(test_file)
-            progress.advance(task)
+        results = analyze_many(test_files, lambda: progress.advance(task))
+    
+    for test_file, result in zip(test_files, results, strict=True):
+        if result:
+            parsed_files.append(result)
+        else:
+            parse_errors.append(test_file)
     
     if parse_errors and verbose:
         console.print(f"[yellow]Warning: Could not parse {len(parse_errors)} files[/yellow]")
@@ -172,8 +177,10 @@ def learn_show(
         raise typer.Exit(1)
     
     if json_output:
-        import json
-        console.print(json.dumps(patterns.model_dump(mode="json"), indent=2, default=str))
+        # Serialized by pydantic-core without an intermediate dict, written raw
+        # (Rich would re-wrap and markup-scan the JSON)
+        sys.stdout.write(patterns.model_dump_json(indent=2))
+        sys.stdout.write("\n")
         return
     
     if section:
@@ -184,6 +191,9 @@ def learn_show(
 
 def _display_learn_summary(patterns: LearnedPatterns, verbose: bool) -> None:
     """Display summary after learning."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
     
     # Summary panel
     summary_text = (
@@ -210,13 +220,13 @@ def _display_learn_summary(patterns: LearnedPatterns, verbose: bool) -> None:
         table.add_column("Confidence", justify="right")
         table.add_column("Usages", justify="right")
         
-        sorted_fixtures = sorted(patterns.fixtures, key=lambda f: f.confidence, reverse=True)[:8]
+        sorted_fixtures = patterns.fixtures_by_confidence[:8]
         for f in sorted_fixtures:
             conf_color = "green" if f.confidence > 0.7 else "yellow" if f.confidence > 0.4 else "red"
             table.add_row(
                 f.name,
                 f.inferred_role.value,
-                f"[{conf_color}]{f.confidence:.0%}[/{conf_color}]",
+                Text(f"{f.confidence:.0%}", style=conf_color),
                 str(f.usages),
             )
         console.print(table)
@@ -224,7 +234,7 @@ def _display_learn_summary(patterns: LearnedPatterns, verbose: bool) -> None:
     # Show risk rules
     if patterns.risk_rules:
         console.print("\n[bold]Pack Recommendations:[/bold]")
-        for rule in sorted(patterns.risk_rules, key=lambda r: r.confidence, reverse=True)[:5]:
+        for rule in patterns.risk_rules_by_confidence[:5]:
             packs = ", ".join(rule.recommended_packs)
             console.print(f"  • [cyan]{rule.description}[/cyan]")
             console.print(f"    → Recommend: [green]{packs}[/green] (confidence: {rule.confidence:.0%})")
@@ -233,7 +243,7 @@ def _display_learn_summary(patterns: LearnedPatterns, verbose: bool) -> None:
         # Show assertion patterns
         if patterns.assertion_templates:
             console.print("\n[bold]Assertion Patterns:[/bold]")
-            for template in sorted(patterns.assertion_templates, key=lambda t: t.occurrences, reverse=True)[:5]:
+            for template in patterns.assertion_templates_by_occurrences[:5]:
                 console.print(f"  • [{template.pattern_type}] {template.occurrences}x occurrences")
                 if template.expected_values:
                     console.print(f"    Expected values: {', '.join(template.expected_values[:5])}")
@@ -241,6 +251,67 @@ def _display_learn_summary(patterns: LearnedPatterns, verbose: bool) -> None:
 
 def _display_full_summary(patterns: LearnedPatterns) -> None:
     """Display full summary of learned patterns."""
+    from rich.text import Text
+    
+    if not console.is_terminal:
+        _print_plain_stats(patterns)
+    else:
+        _print_rich_stats(patterns)
+    
+    # Fixtures table
+    if patterns.fixtures:
+        console.print("\n")
+        rows: list[_Row] = []
+        for f in patterns.fixtures_by_confidence[:10]:
+            indicators = ", ".join(f.role_indicators[:2]) if f.role_indicators else "-"
+            conf_color = "green" if f.confidence > 0.7 else "yellow" if f.confidence > 0.4 else "dim"
+            rows.append((
+                f.name,
+                f.inferred_role.value,
+                Text(f"{f.confidence:.0%}", style=conf_color),
+                f.scope,
+                indicators[:40],
+            ))
+        _print_rows(
+            "Fixtures with Inferred Roles",
+            [
+                ("Name", {"style": "cyan"}),
+                ("Inferred Role", {"style": "green"}),
+                ("Confidence", {"justify": "right"}),
+                ("Scope", {}),
+                ("Indicators", {}),
+            ],
+            rows,
+        )
+    
+    # Risk rules
+    if patterns.risk_rules:
+        console.print("\n")
+        rows = []
+        for rule in patterns.risk_rules_by_confidence:
+            evidence = ", ".join(rule.derived_from[:2])
+            rows.append((
+                rule.description[:50],
+                f"{rule.confidence:.0%}",
+                ", ".join(rule.recommended_packs),
+                evidence[:40],
+            ))
+        _print_rows(
+            "Derived Risk Rules (Pack Recommendations)",
+            [
+                ("Rule", {"style": "cyan"}),
+                ("Confidence", {"justify": "right"}),
+                ("Recommended Packs", {"style": "green"}),
+                ("Evidence", {}),
+            ],
+            rows,
+        )
+
+
+def _print_rich_stats(patterns: LearnedPatterns) -> None:
+    """Print the summary header panel and statistics tree."""
+    from rich.panel import Panel
+    from rich.tree import Tree
     
     # Header
     console.print(Panel(
@@ -267,47 +338,56 @@ def _display_full_summary(patterns: LearnedPatterns) -> None:
     patterns_branch.add(f"Endpoints: {len(patterns.endpoints)}")
     
     console.print(tree)
+
+
+def _print_plain_stats(patterns: LearnedPatterns) -> None:
+    """Print summary statistics as tab-separated key/value lines."""
+    write = sys.stdout.write
+    for key, value in (
+        ("created", patterns.created_at.strftime("%Y-%m-%d %H:%M")),
+        ("updated", patterns.updated_at.strftime("%Y-%m-%d %H:%M")),
+        ("source_paths", len(patterns.source_paths)),
+        ("files_analyzed", patterns.total_files_analyzed),
+        ("test_functions", patterns.total_test_functions),
+        ("test_classes", patterns.total_test_classes),
+        ("signals", len(patterns.signals)),
+        ("fixtures", len(patterns.fixtures)),
+        ("assertion_templates", len(patterns.assertion_templates)),
+        ("timing_assertions", len(patterns.timing_assertions)),
+        ("observability_patterns", len(patterns.observability_patterns)),
+        ("fault_injection_patterns", len(patterns.fault_injection_patterns)),
+        ("endpoints", len(patterns.endpoints)),
+    ):
+        write(plain_row((key, value)))
+
+
+def _print_rows(
+    title: str,
+    columns: list[tuple[str, dict[str, Any]]],
+    rows: Sequence["_Row"],
+) -> None:
+    """
+    Print rows as a Rich table, or as tab-separated text when output is piped.
     
-    # Fixtures table
-    if patterns.fixtures:
-        console.print("\n")
-        table = Table(title="Fixtures with Inferred Roles")
-        table.add_column("Name", style="cyan")
-        table.add_column("Inferred Role", style="green")
-        table.add_column("Confidence", justify="right")
-        table.add_column("Scope")
-        table.add_column("Indicators")
-        
-        for f in sorted(patterns.fixtures, key=lambda x: x.confidence, reverse=True)[:10]:
-            indicators = ", ".join(f.role_indicators[:2]) if f.role_indicators else "-"
-            conf_color = "green" if f.confidence > 0.7 else "yellow" if f.confidence > 0.4 else "dim"
-            table.add_row(
-                f.name,
-                f.inferred_role.value,
-                f"[{conf_color}]{f.confidence:.0%}[/{conf_color}]",
-                f.scope,
-                indicators[:40],
-            )
-        console.print(table)
+    The plain form is a "# title" line, a header line, then one line per row;
+    no Table is built, so scripts skip Rich's layout and styling work.
+    """
+    if not console.is_terminal:
+        write = sys.stdout.write
+        write(f"# {title}\n")
+        write(plain_row(name for name, _ in columns))
+        for row in rows:
+            write(plain_row(row))
+        return
     
-    # Risk rules
-    if patterns.risk_rules:
-        console.print("\n")
-        table = Table(title="Derived Risk Rules (Pack Recommendations)")
-        table.add_column("Rule", style="cyan")
-        table.add_column("Confidence", justify="right")
-        table.add_column("Recommended Packs", style="green")
-        table.add_column("Evidence")
-        
-        for rule in sorted(patterns.risk_rules, key=lambda r: r.confidence, reverse=True):
-            evidence = ", ".join(rule.derived_from[:2])
-            table.add_row(
-                rule.description[:50],
-                f"{rule.confidence:.0%}",
-                ", ".join(rule.recommended_packs),
-                evidence[:40],
-            )
-        console.print(table)
+    from rich.table import Table
+    
+    table = Table(title=title)
+    for name, options in columns:
+        table.add_column(name, **options)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
 
 
 def _display_section(patterns: LearnedPatterns, section: str) -> None:
@@ -320,134 +400,166 @@ def _display_section(patterns: LearnedPatterns, section: str) -> None:
             console.print("[yellow]No signals found.[/yellow]")
             return
         
-        table = Table(title="Signals")
-        table.add_column("Value", style="cyan")
-        table.add_column("Category", style="green")
-        table.add_column("Occurrences", justify="right")
-        table.add_column("Sources")
-        
-        for s in sorted(patterns.signals, key=lambda x: x.occurrences, reverse=True)[:20]:
+        rows: list[_Row] = []
+        for s in patterns.signals_by_occurrences[:20]:
             sources = ", ".join(Path(p).name for p in s.source_files[:2])
-            table.add_row(s.value[:50], s.category, str(s.occurrences), sources)
-        console.print(table)
+            rows.append((s.value[:50], s.category, str(s.occurrences), sources))
+        _print_rows(
+            "Signals",
+            [
+                ("Value", {"style": "cyan"}),
+                ("Category", {"style": "green"}),
+                ("Occurrences", {"justify": "right"}),
+                ("Sources", {}),
+            ],
+            rows,
+        )
     
     elif section == "fixtures":
         if not patterns.fixtures:
             console.print("[yellow]No fixtures found.[/yellow]")
             return
         
-        table = Table(title="Extracted Fixtures")
-        table.add_column("Name", style="cyan")
-        table.add_column("Role", style="green")
-        table.add_column("Confidence", justify="right")
-        table.add_column("Scope")
-        table.add_column("Usages", justify="right")
-        table.add_column("Indicators")
-        
-        for f in sorted(patterns.fixtures, key=lambda x: x.confidence, reverse=True):
+        rows = []
+        for f in patterns.fixtures_by_confidence:
             indicators = "; ".join(f.role_indicators[:2])
-            table.add_row(
+            rows.append((
                 f.name, f.inferred_role.value, f"{f.confidence:.0%}",
                 f.scope, str(f.usages), indicators[:50]
-            )
-        console.print(table)
+            ))
+        _print_rows(
+            "Extracted Fixtures",
+            [
+                ("Name", {"style": "cyan"}),
+                ("Role", {"style": "green"}),
+                ("Confidence", {"justify": "right"}),
+                ("Scope", {}),
+                ("Usages", {"justify": "right"}),
+                ("Indicators", {}),
+            ],
+            rows,
+        )
     
     elif section == "assertions":
         if not patterns.assertion_templates:
             console.print("[yellow]No assertion templates found.[/yellow]")
             return
         
-        table = Table(title="Assertion Templates")
-        table.add_column("Type", style="cyan")
-        table.add_column("Template", style="green")
-        table.add_column("Occurrences", justify="right")
-        table.add_column("Expected Values")
-        
-        for t in sorted(patterns.assertion_templates, key=lambda x: x.occurrences, reverse=True):
+        rows = []
+        for t in patterns.assertion_templates_by_occurrences:
             values = ", ".join(t.expected_values[:3])
-            table.add_row(t.pattern_type, t.template[:60], str(t.occurrences), values)
-        console.print(table)
+            rows.append((t.pattern_type, t.template[:60], str(t.occurrences), values))
+        _print_rows(
+            "Assertion Templates",
+            [
+                ("Type", {"style": "cyan"}),
+                ("Template", {"style": "green"}),
+                ("Occurrences", {"justify": "right"}),
+                ("Expected Values", {}),
+            ],
+            rows,
+        )
     
     elif section == "timing":
         if not patterns.timing_assertions:
             console.print("[yellow]No timing assertions found.[/yellow]")
             return
         
-        table = Table(title="Timing/Performance Assertions")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Comparison")
-        table.add_column("Threshold", justify="right")
-        table.add_column("Occurrences", justify="right")
-        
+        rows = []
         for t in patterns.timing_assertions:
             threshold = f"{t.threshold_value} {t.threshold_unit}" if t.threshold_value else "-"
-            table.add_row(t.metric_type, t.comparison, threshold, str(t.occurrences))
-        console.print(table)
+            rows.append((t.metric_type, t.comparison, threshold, str(t.occurrences)))
+        _print_rows(
+            "Timing/Performance Assertions",
+            [
+                ("Metric", {"style": "cyan"}),
+                ("Comparison", {}),
+                ("Threshold", {"justify": "right"}),
+                ("Occurrences", {"justify": "right"}),
+            ],
+            rows,
+        )
     
     elif section == "observability":
         if not patterns.observability_patterns:
             console.print("[yellow]No observability patterns found.[/yellow]")
             return
         
-        table = Table(title="Observability Tool Usage")
-        table.add_column("Tool", style="cyan")
-        table.add_column("Pattern", style="green")
-        table.add_column("File")
-        table.add_column("Line", justify="right")
-        
+        rows = []
         for p in patterns.observability_patterns:
             file_name = Path(p.source_file).name if p.source_file else "-"
-            table.add_row(p.tool_type, p.pattern[:40], file_name, str(p.line_number))
-        console.print(table)
+            rows.append((p.tool_type, p.pattern[:40], file_name, str(p.line_number)))
+        _print_rows(
+            "Observability Tool Usage",
+            [
+                ("Tool", {"style": "cyan"}),
+                ("Pattern", {"style": "green"}),
+                ("File", {}),
+                ("Line", {"justify": "right"}),
+            ],
+            rows,
+        )
     
     elif section in ("faults", "fault-injection"):
         if not patterns.fault_injection_patterns:
             console.print("[yellow]No fault injection patterns found.[/yellow]")
             return
         
-        table = Table(title="Fault Injection Patterns")
-        table.add_column("Fault Type", style="cyan")
-        table.add_column("Occurrences", justify="right")
-        table.add_column("Sources")
-        
-        for f in sorted(patterns.fault_injection_patterns, key=lambda x: x.occurrences, reverse=True):
+        rows = []
+        for f in patterns.fault_injection_patterns_by_occurrences:
             sources = ", ".join(Path(p).name for p in f.source_files[:3])
-            table.add_row(f.fault_type, str(f.occurrences), sources)
-        console.print(table)
+            rows.append((f.fault_type, str(f.occurrences), sources))
+        _print_rows(
+            "Fault Injection Patterns",
+            [
+                ("Fault Type", {"style": "cyan"}),
+                ("Occurrences", {"justify": "right"}),
+                ("Sources", {}),
+            ],
+            rows,
+        )
     
     elif section == "endpoints":
         if not patterns.endpoints:
             console.print("[yellow]No endpoints found.[/yellow]")
             return
         
-        table = Table(title="Endpoints")
-        table.add_column("Type", style="cyan")
-        table.add_column("Value", style="green")
-        table.add_column("Occurrences", justify="right")
-        table.add_column("Parameterized")
-        
-        for e in sorted(patterns.endpoints, key=lambda x: x.occurrences, reverse=True)[:20]:
+        rows = []
+        for e in patterns.endpoints_by_occurrences[:20]:
             param = "Yes" if e.is_parameterized else "No"
-            table.add_row(e.pattern_type, e.value[:60], str(e.occurrences), param)
-        console.print(table)
+            rows.append((e.pattern_type, e.value[:60], str(e.occurrences), param))
+        _print_rows(
+            "Endpoints",
+            [
+                ("Type", {"style": "cyan"}),
+                ("Value", {"style": "green"}),
+                ("Occurrences", {"justify": "right"}),
+                ("Parameterized", {}),
+            ],
+            rows,
+        )
     
     elif section == "rules":
         if not patterns.risk_rules:
             console.print("[yellow]No risk rules derived.[/yellow]")
             return
         
-        table = Table(title="Risk Rules (Pack Recommendations)")
-        table.add_column("ID", style="dim")
-        table.add_column("Description", style="cyan")
-        table.add_column("Confidence", justify="right")
-        table.add_column("Recommended Packs", style="green")
-        table.add_column("Derived From")
-        
-        for r in sorted(patterns.risk_rules, key=lambda x: x.confidence, reverse=True):
+        rows = []
+        for r in patterns.risk_rules_by_confidence:
             derived = ", ".join(r.derived_from[:2])
             packs = ", ".join(r.recommended_packs)
-            table.add_row(r.rule_id, r.description[:40], f"{r.confidence:.0%}", packs, derived[:40])
-        console.print(table)
+            rows.append((r.rule_id, r.description[:40], f"{r.confidence:.0%}", packs, derived[:40]))
+        _print_rows(
+            "Risk Rules (Pack Recommendations)",
+            [
+                ("ID", {"style": "dim"}),
+                ("Description", {"style": "cyan"}),
+                ("Confidence", {"justify": "right"}),
+                ("Recommended Packs", {"style": "green"}),
+                ("Derived From", {}),
+            ],
+            rows,
+        )
     
     else:
         console.print(f"[red]Unknown section: {section}[/red]")
@@ -7,23 +7,33 @@ Commands:
 - poet obligations show <id> : Show obligation details
 """
 
+import functools
+import hashlib
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.markdown import Markdown
-import yaml
+
+from prevent_outage_edge_testing.cli.commands._plain import plain_row
+from prevent_outage_edge_testing.core import jsonio
 
 console = Console()
 
 obligations_app = typer.Typer(help="Browse and inspect obligations")
 
+# Rich styles for the risk / safe-in-prod columns; unknown risks render green.
+_RISK_STYLE = {"high": "red", "medium": "yellow", "low": "green"}
+_SAFE_STYLE = {True: ("green", "✓"), False: ("red", "✗")}
+
 
+@functools.lru_cache(maxsize=1)
 def get_obligations_dir() -> Path:
-    """Get the obligations directory."""
+    """Get the obligations directory (resolved once per process)."""
     # Try relative to package first, then current directory
     pkg_dir = Path(__file__).parent.parent.parent.parent.parent / "obligations"
     if pkg_dir.exists():
@@ -36,22 +46,163 @@ def get_obligations_dir() -> Path:
     return pkg_dir  # Return default even if not found
 
 
-def load_obligation(filepath: Path) -> dict:
+def _load_yaml(stream: bytes) -> Any:
+    """Parse a YAML document; PyYAML (and libyaml) is imported on first use."""
+    from prevent_outage_edge_testing.core.config import load_yaml
+    
+    return load_yaml(stream)
+
+
+def load_obligation(filepath: Path) -> dict[str, Any]:
     """Load an obligation YAML file."""
-    with open(filepath) as f:
-        return yaml.safe_load(f)
+    # Obligation files are small: one read, then let the parser decode the bytes
+    data: dict[str, Any] = _load_yaml(filepath.read_bytes())
+    return data
+
+
+_MAX_LOAD_WORKERS = 16
+
+
+def _iter_yaml_files(root: str) -> Iterator[str]:
+    """Yield paths of *.yaml files under root, recursively, without following symlinked dirs."""
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_yaml_files(entry.path)
+        elif entry.name.endswith(".yaml") and entry.is_file():
+            yield entry.path
+
 
+def find_all_obligations(obligations_dir: Path) -> list[tuple[str, Path, dict[str, Any]]]:
+    """Find all obligation YAML files, returning (id, path, parsed data) sorted by id."""
+    return list(_find_all_obligations_cached(str(obligations_dir.resolve())))
 
-def find_all_obligations(obligations_dir: Path) -> list[tuple[str, Path]]:
-    """Find all obligation YAML files."""
-    obligations = []
-    for yaml_file in obligations_dir.rglob("*.yaml"):
+
+@functools.lru_cache(maxsize=8)
+def _find_all_obligations_cached(
+    obligations_dir: str,
+) -> tuple[tuple[str, Path, dict[str, Any]], ...]:
+    """Scan one obligations directory (keyed by resolved path) once per process."""
+    paths = [Path(p) for p in _iter_yaml_files(obligations_dir)]
+    if not paths:
+        return ()
+    # Small-file reads are syscall-bound; overlap them on a few threads
+    with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(paths))) as pool:
+        loaded = list(pool.map(_try_load_obligation, paths))
+    obligations = [
+        (data["id"], yaml_file, data)
+        for yaml_file, data in zip(paths, loaded, strict=True)
+        if data is not None
+    ]
+    return tuple(sorted(obligations, key=lambda x: x[0]))
+
+
+def _try_load_obligation(filepath: Path) -> Optional[dict[str, Any]]:
+    """Load an obligation, or None if it is unreadable or has no id."""
+    try:
+        data = load_obligation(filepath)
+        return data if isinstance(data, dict) and "id" in data else None
+    except Exception:
+        return None
+
+
+# Top-level `id:` line; lets lookups skip parsing files that can't match
+_ID_LINE_RE = re.compile(rb"""^id:[ \t]*["']?([\w.\-]+)["']?[ \t]*(?:#.*)?\r?$""", re.M)
+
+
+def find_obligation_by_id(
+    obligations_dir: Path, obligation_id: str
+) -> Optional[tuple[Path, dict[str, Any]]]:
+    """
+    Return (path, data) for the first obligation with this exact id, stopping early.
+    
+    Files whose top-level `id:` line names another obligation are skipped without
+    a YAML parse; files without a recognizable id line are parsed in full.
+    """
+    for path_str in _iter_yaml_files(str(obligations_dir)):
+        yaml_file = Path(path_str)
         try:
-            data = load_obligation(yaml_file)
-            if "id" in data:
-                obligations.append((data["id"], yaml_file))
+            raw = yaml_file.read_bytes()
+        except OSError:
+            continue
+        m = _ID_LINE_RE.search(raw)
+        if m and m.group(1).decode() != obligation_id:
+            continue
+        try:
+            data = _load_yaml(raw)
         except Exception:
+            continue
+        if isinstance(data, dict) and data.get("id") == obligation_id:
+            return yaml_file, data
+    return None
+
+
+# Summary fields kept in the index; enough to render `poet obligations list`
+OBLIGATIONS_INDEX_VERSION = 1
+_INDEX_FIELDS = ("id", "title", "risk", "safe_in_prod")
+
+
+def get_obligations_index_path(obligations_dir: Path) -> Path:
+    """Get the JSON index path for an obligations directory (one per directory)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    key = hashlib.sha1(str(obligations_dir.resolve()).encode()).hexdigest()[:12]
+    return Path(cache_home) / "poet" / f"obligations-{key}.v{OBLIGATIONS_INDEX_VERSION}.json"
+
+
+def load_obligations_index(obligations_dir: Path) -> list[tuple[str, Path, dict[str, Any]]]:
+    """
+    Like find_all_obligations, but data holds only the summary fields.
+    
+    Summaries come from a JSON index keyed by file path and mtime; only new
+    or modified YAML files are parsed, and the index is rewritten if any were.
+    Index read/write failures fall back to parsing (the index is best-effort).
+    """
+    index_path = get_obligations_index_path(obligations_dir)
+    try:
+        cached = jsonio.loads(index_path.read_bytes()).get("files", {})
+    except Exception:
+        cached = {}
+    
+    files: dict[str, dict[str, Any]] = {}
+    changed = False
+    for key in _iter_yaml_files(str(obligations_dir)):
+        yaml_file = Path(key)
+        try:
+            mtime_ns = yaml_file.stat().st_mtime_ns
+        except OSError:
+            continue
+        entry = cached.get(key)
+        if entry is None or entry.get("mtime_ns") != mtime_ns:
+            changed = True
+            try:
+                data = load_obligation(yaml_file)
+            except Exception:
+                data = None
+            if not isinstance(data, dict) or "id" not in data:
+                entry = {"mtime_ns": mtime_ns, "summary": None}
+            else:
+                summary = {k: data[k] for k in _INDEX_FIELDS if k in data}
+                entry = {"mtime_ns": mtime_ns, "summary": summary}
+        files[key] = entry
+    
+    if changed or files.keys() != cached.keys():
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(jsonio.dumps({"files": files}))
+            os.replace(tmp_path, index_path)
+        except OSError:
             pass
+    
+    obligations = [
+        (entry["summary"]["id"], Path(key), entry["summary"])
+        for key, entry in files.items()
+        if entry["summary"] is not None
+    ]
     return sorted(obligations, key=lambda x: x[0])
 
 
@@ -74,24 +225,35 @@ def list_obligations(
         console.print(f"[red]Obligations directory not found: {obligations_dir}[/red]")
         raise typer.Exit(1)
     
-    obligations = find_all_obligations(obligations_dir)
+    obligations = load_obligations_index(obligations_dir)
     
     if not obligations:
         console.print("[yellow]No obligations found.[/yellow]")
         raise typer.Exit(1)
     
-    # Filter by domain if specified
+    # Group by domain
+    by_domain: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+    for oid, _, data in obligations:
+        by_domain.setdefault(oid.split(".", 1)[0], []).append((oid, data))
+    
+    # Filter by domain if specified; only that domain's group needs scanning
+    # (the prefix check still applies so "cache.key" narrows within "cache")
     if domain:
-        obligations = [(oid, path) for oid, path in obligations if oid.startswith(f"{domain}.")]
+        top = domain.split(".", 1)[0]
+        prefix = f"{domain}."
+        by_domain = {top: [ob for ob in by_domain.get(top, ()) if ob[0].startswith(prefix)]}
+    total = sum(len(rows) for rows in by_domain.values())
     
-    # Group by domain
-    by_domain: dict[str, list[tuple[str, dict]]] = {}
-    for oid, path in obligations:
-        data = load_obligation(path)
-        domain_name = oid.split(".")[0]
-        if domain_name not in by_domain:
-            by_domain[domain_name] = []
-        by_domain[domain_name].append((oid, data))
+    if not console.is_terminal:
+        # Piped: tab-separated rows, skipping Rich table layout entirely
+        write = sys.stdout.write
+        for domain_name in sorted(by_domain.keys()):
+            for oid, data in by_domain[domain_name]:
+                safe = "yes" if data.get("safe_in_prod") else "no"
+                write(plain_row((oid, data.get("title", ""), data.get("risk", "?"), safe)))
+        return
+    
+    from rich.table import Table
     
     # Display table
     table = Table(title="Obligations")
@@ -103,9 +265,8 @@ def list_obligations(
     for domain_name in sorted(by_domain.keys()):
         for oid, data in by_domain[domain_name]:
             risk = data.get("risk", "?")
-            risk_style = "red" if risk == "high" else "yellow" if risk == "medium" else "green"
-            safe = "✓" if data.get("safe_in_prod", False) else "✗"
-            safe_style = "green" if data.get("safe_in_prod", False) else "red"
+            risk_style = _RISK_STYLE.get(risk, "green")
+            safe_style, safe = _SAFE_STYLE[bool(data.get("safe_in_prod"))]
             
             table.add_row(
                 oid,
@@ -115,7 +276,7 @@ def list_obligations(
             )
     
     console.print(table)
-    console.print(f"\n[dim]Total: {len(obligations)} obligations[/dim]")
+    console.print(f"\n[dim]Total: {total} obligations[/dim]")
     console.print("[dim]Run 'poet obligations show <id>' for details[/dim]")
 
 
@@ -136,16 +297,17 @@ def show_obligation(
         console.print(f"[red]Obligations directory not found: {obligations_dir}[/red]")
         raise typer.Exit(1)
     
-    # Find the obligation
-    obligations = find_all_obligations(obligations_dir)
-    matching = [(oid, path) for oid, path in obligations if oid == obligation_id]
+    # Find the obligation (exact match stops at the first hit)
+    found = find_obligation_by_id(obligations_dir, obligation_id)
     
-    if not matching:
+    if found is None:
         # Try partial match
-        matching = [(oid, path) for oid, path in obligations if obligation_id in oid]
+        matching = [
+            oid for oid, _, _ in find_all_obligations(obligations_dir) if obligation_id in oid
+        ]
         if matching:
             console.print(f"[yellow]Did you mean one of these?[/yellow]")
-            for oid, _ in matching:
+            for oid in matching:
                 console.print(f"  - {oid}")
             raise typer.Exit(1)
         
@@ -153,8 +315,9 @@ def show_obligation(
         console.print("[dim]Run 'poet obligations list' to see all obligations[/dim]")
         raise typer.Exit(1)
     
-    _, path = matching[0]
-    data = load_obligation(path)
+    from rich.panel import Panel
+    
+    _, data = found
     
     # Build display
     title = data.get("title", obligation_id)
@@ -163,7 +326,7 @@ def show_obligation(
     safe_in_prod = data.get("safe_in_prod", False)
     
     # Header panel
-    risk_color = "red" if risk == "high" else "yellow" if risk == "medium" else "green"
+    risk_color = _RISK_STYLE.get(risk, "green")
     safe_text = "[green]Yes[/green]" if safe_in_prod else "[red]No[/red]"
     
     header = f"""[bold]{title}[/bold]
@@ -7,22 +7,40 @@ Commands for managing knowledge packs:
 - validate: Check pack schema and required files
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.tree import Tree
 
 from prevent_outage_edge_testing.core.config import load_config
-from prevent_outage_edge_testing.packs.loader import PackLoader
-from prevent_outage_edge_testing.packs.validator import PackValidator
 
 app = typer.Typer(help="Manage knowledge packs")
 console = Console()
 
+_MAX_VALIDATE_WORKERS = 8
+
+# Failure-mode severity -> Rich color in 'packs show'. Severity is a str enum,
+# so members look up their string keys directly.
+_SEVERITY_COLORS = {
+    "critical": "red",
+    "high": "yellow",
+    "medium": "blue",
+    "low": "dim",
+}
+
+
+def _resolve_paths(path: Optional[Path]) -> list[Path]:
+    """Pack search paths: --path if given, else the configured paths."""
+    if path:
+        return [path]
+    # load_config() serves an unchanged .poet.yaml from its in-process cache
+    config = load_config()
+    return config.packs_paths if config else [Path("packs")]
+
 
 @app.command("list")
 def list_packs(
@@ -34,8 +52,11 @@ def list_packs(
     ),
 ) -> None:
     """List all available knowledge packs."""
-    config = load_config()
-    paths = [path] if path else (config.packs_paths if config else [Path("packs")])
+    from rich.table import Table
+    
+    from prevent_outage_edge_testing.packs.loader import PackLoader
+    
+    paths = _resolve_paths(path)
     
     loader = PackLoader(paths)
     packs = loader.load_all()
@@ -47,8 +68,8 @@ def list_packs(
     
     # Filter by tags if specified
     if tags:
-        tag_set = set(t.strip() for t in tags.split(","))
-        packs = [p for p in packs if tag_set & set(p.tags)]
+        tag_set = {t.strip() for t in tags.split(",")}
+        packs = [p for p in packs if not tag_set.isdisjoint(p.tags)]
     
     table = Table(title="Knowledge Packs")
     table.add_column("ID", style="cyan", no_wrap=True)
@@ -65,7 +86,7 @@ def list_packs(
             pack.version,
             str(len(pack.recipes)),
             str(len(pack.snippets)),
-            ", ".join(pack.tags[:3]) + ("..." if len(pack.tags) > 3 else ""),
+            ", ".join(islice(pack.tags, 3)) + ("..." if len(pack.tags) > 3 else ""),
         )
     
     console.print(table)
@@ -80,8 +101,12 @@ def show_pack(
     ),
 ) -> None:
     """Show detailed information about a specific pack."""
-    config = load_config()
-    paths = [path] if path else (config.packs_paths if config else [Path("packs")])
+    from rich.panel import Panel
+    from rich.tree import Tree
+    
+    from prevent_outage_edge_testing.packs.loader import PackLoader
+    
+    paths = _resolve_paths(path)
     
     loader = PackLoader(paths)
     pack = loader.load_pack(pack_id)
@@ -100,17 +125,12 @@ def show_pack(
     if pack.failure_modes:
         fm_branch = tree.add("[bold]Failure Modes[/bold]")
         for fm in pack.failure_modes:
-            severity_color = {
-                "critical": "red",
-                "high": "yellow", 
-                "medium": "blue",
-                "low": "dim",
-            }.get(fm.severity.value, "white")
+            severity_color = _SEVERITY_COLORS.get(fm.severity, "white")
             fm_node = fm_branch.add(
                 f"[{severity_color}]● {fm.name}[/{severity_color}] ({fm.severity.value})"
             )
             if fm.symptoms:
-                fm_node.add(f"[dim]Symptoms: {', '.join(fm.symptoms[:2])}...[/dim]")
+                fm_node.add(f"[dim]Symptoms: {', '.join(islice(fm.symptoms, 2))}...[/dim]")
     
     # Recipes
     if pack.recipes:
@@ -150,26 +170,41 @@ def validate_packs(
     ),
 ) -> None:
     """Validate all packs for schema compliance and required files."""
-    config = load_config()
-    paths = [path] if path else (config.packs_paths if config else [Path("packs")])
+    from rich.panel import Panel
+    
+    from prevent_outage_edge_testing.packs.validator import PackValidator
+    
+    paths = _resolve_paths(path)
     
     validator = PackValidator()
     all_valid = True
     total_errors = 0
     total_warnings = 0
     
+    pack_dirs: list[Path] = []
     for pack_path in paths:
-        if not pack_path.exists():
+        # DirEntry.is_dir() answers from the directory listing, so plain
+        # entries cost no extra stat() each; a missing path is just skipped
+        try:
+            entries = list(os.scandir(pack_path))
+        except FileNotFoundError:
             continue
         
-        for pack_dir in pack_path.iterdir():
-            if not pack_dir.is_dir():
+        for entry in entries:
+            if entry.name.startswith("."):
                 continue
-            if pack_dir.name.startswith("."):
+            if not entry.is_dir():
                 continue
-            
+            pack_dirs.append(Path(entry.path))
+    
+    # Packs validate independently (file reads + YAML + pydantic), so run them
+    # on a few threads; results come back in listing order and all printing
+    # stays on this thread
+    with ThreadPoolExecutor(max_workers=min(_MAX_VALIDATE_WORKERS, len(pack_dirs) or 1)) as pool:
+        results = pool.map(validator.validate, pack_dirs)
+        
+        for pack_dir, result in zip(pack_dirs, results, strict=True):
             console.print(f"\n[bold]Validating:[/bold] {pack_dir.name}")
-            result = validator.validate(pack_dir)
             
             if result.errors:
                 all_valid = False
@@ -13,33 +13,79 @@ Usage:
     poet learn show                        # Display learned patterns summary
 """
 
-from pathlib import Path
-from typing import Optional
+import importlib
+from typing import TYPE_CHECKING, Optional, cast
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.tree import Tree
+from typer.core import TyperGroup
 
 from prevent_outage_edge_testing import __version__
-from prevent_outage_edge_testing.cli.commands import build, init, learn, packs, gate, obligations
+
+if TYPE_CHECKING:
+    # The click types TyperGroup is declared against. typer depends on click
+    # for most supported releases; newer ones vendor it as typer._click.
+    try:
+        from click import Command, Context  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        from typer._click import (  # type: ignore[import-not-found, no-redef, unused-ignore]
+            Command,
+            Context,
+        )
+
+# Sub-command name -> (module, attribute, help). Modules are imported only
+# when their command is resolved, so `poet packs list` doesn't pay for the
+# learn/gate/obligations imports. Typer sub-apps get registered as groups,
+# plain functions as commands; order here is the order shown in --help.
+_COMMANDS_MODULE = "prevent_outage_edge_testing.cli.commands"
+_LAZY_COMMANDS: dict[str, tuple[str, str, Optional[str]]] = {
+    "init": ("init", "init_command", None),
+    "build": ("build", "build_command", None),
+    "packs": ("packs", "app", "Manage knowledge packs"),
+    "learn": ("learn", "learn_app", "Learn patterns from existing tests"),
+    "gate": ("gate", "app", "Run release gates and generate reports"),
+    "obligations": ("obligations", "obligations_app", "Browse and inspect obligations"),
+}
+
+
+def _load_command(name: str) -> "Command":
+    """Import a sub-command's module and convert it to a click command."""
+    module_name, attr, help_text = _LAZY_COMMANDS[name]
+    target = getattr(importlib.import_module(f"{_COMMANDS_MODULE}.{module_name}"), attr)
+    
+    # Register on a throwaway parent exactly as it used to be registered on
+    # `app`, so names, help and markup come out the same
+    holder = typer.Typer(rich_markup_mode="rich")
+    holder.callback()(lambda: None)
+    if isinstance(target, typer.Typer):
+        holder.add_typer(target, name=name, help=help_text)
+    else:
+        holder.command(name)(target)
+    group = cast(TyperGroup, typer.main.get_command(holder))
+    return group.commands[name]
+
+
+class _LazyGroup(TyperGroup):
+    """Top-level group that resolves sub-commands on first use."""
+    
+    def list_commands(self, ctx: "Context") -> list[str]:
+        eager = [c for c in super().list_commands(ctx) if c not in _LAZY_COMMANDS]
+        return [*_LAZY_COMMANDS, *eager]
+    
+    def get_command(self, ctx: "Context", cmd_name: str) -> Optional["Command"]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in _LAZY_COMMANDS:
+            command = _load_command(cmd_name)
+            self.add_command(command, cmd_name)
+        return command
+
 
 app = typer.Typer(
     name="poet",
+    cls=_LazyGroup,
     help="POET - Portable Obligation Evidence Testing",
     no_args_is_help=True,
     rich_markup_mode="rich",
 )
-console = Console()
-
-# Register sub-commands
-app.add_typer(packs.app, name="packs", help="Manage knowledge packs")
-app.add_typer(learn.learn_app, name="learn", help="Learn patterns from existing tests")
-app.add_typer(gate.app, name="gate", help="Run release gates and generate reports")
-app.add_typer(obligations.obligations_app, name="obligations", help="Browse and inspect obligations")
-app.command("init")(init.init_command)
-app.command("build")(build.build_command)
 
 
 @app.callback(invoke_without_command=True)
@@ -48,6 +94,9 @@ def main(
     version: bool = typer.Option(False, "--version", "-v", help="Show version and exit"),
 ) -> None:
     """POET - Prevent Outage Edge Testing CLI."""
+    from rich.console import Console
+    
+    console = Console()
     if version:
         console.print(f"[bold]poet[/bold] version {__version__}")
         raise typer.Exit()
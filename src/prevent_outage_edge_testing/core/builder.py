@@ -10,10 +10,11 @@ TestPlanBuilder generates test plans by:
 This is the core AI-assisted builder functionality.
 """
 
-import hashlib
 import re
+import secrets
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
 
 from prevent_outage_edge_testing.packs.models import (
@@ -26,7 +27,38 @@ from prevent_outage_edge_testing.packs.models import (
 )
 
 
-@dataclass
+# Coverage note for plans where no knowledge pack matched
+_NO_MATCH_NOTES = (
+    "No matching knowledge packs found for this description. "
+    "Consider adding custom packs or using more specific keywords."
+)
+
+# Characters replaced with "-" when deriving ids from test names
+_SAFE_NAME_RE = re.compile(r"[^a-z0-9]")
+
+
+def _compile_keyword_matcher(
+    keywords: list[str],
+) -> tuple[re.Pattern[str], dict[str, tuple[str, ...]]]:
+    """
+    Build a single-pass substring matcher for keywords.
+    
+    Returns a regex whose zero-width lookahead reports the longest keyword
+    starting at each position (so overlapping hits like "trace" inside
+    "dtrace" are still found), plus a map from each keyword to the shorter
+    keywords that are its prefixes, which the regex can't report at the
+    same position.
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+    prefixes = {
+        kw: tuple(other for other in keywords if other != kw and kw.startswith(other))
+        for kw in keywords
+    }
+    return pattern, prefixes
+
+
+@dataclass(slots=True)
 class TestAssertion:
     """A single test assertion."""
     description: str
@@ -34,7 +66,7 @@ class TestAssertion:
     expected: bool = True
 
 
-@dataclass 
+@dataclass(slots=True)
 class TestCase:
     """A generated test case."""
     id: str
@@ -47,9 +79,11 @@ class TestCase:
     assertions: list[TestAssertion] = field(default_factory=list)
     cleanup_steps: list[str] = field(default_factory=list)
     tags: list[str] = field(default_factory=list)
+    # Sort rank for priority (0 = critical); stamped by TestPlanBuilder
+    priority_rank: int = field(default=2, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class TestPlan:
     """A complete test plan."""
     id: str
@@ -62,7 +96,7 @@ class TestPlan:
     coverage_notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildResult:
     """Result of the build process."""
     plan: TestPlan
@@ -105,33 +139,41 @@ class TestPlanBuilder:
         "failure": ["fault-injection-io"],
     }
     
+    _KEYWORD_RE, _KEYWORD_PREFIXES = _compile_keyword_matcher(list(KEYWORD_MAP))
+    
+    # Test case ordering, most severe first; unknown priorities sort as medium
+    _PRIORITY_ORDER: dict[Severity, int] = {
+        Severity.CRITICAL: 0,
+        Severity.HIGH: 1,
+        Severity.MEDIUM: 2,
+        Severity.LOW: 3,
+    }
+    
     def __init__(self, packs: list[KnowledgePack]) -> None:
         self.packs = {p.id: p for p in packs}
     
     def _extract_keywords(self, text: str) -> set[str]:
         """Extract relevant keywords from description text."""
-        text_lower = text.lower()
-        found = set()
-        for keyword in self.KEYWORD_MAP:
-            if keyword in text_lower:
-                found.add(keyword)
+        if not text:
+            return set()
+        found = set(self._KEYWORD_RE.findall(text.lower()))
+        for keyword in list(found):
+            found.update(self._KEYWORD_PREFIXES[keyword])
         return found
     
     def _match_packs(self, keywords: set[str]) -> list[KnowledgePack]:
         """Find packs matching the extracted keywords."""
-        matched_ids: set[str] = set()
-        for kw in keywords:
-            if kw in self.KEYWORD_MAP:
-                matched_ids.update(self.KEYWORD_MAP[kw])
+        # keywords come from _extract_keywords, so every one is a KEYWORD_MAP key
+        matched_ids: set[str] = set().union(*(self.KEYWORD_MAP[kw] for kw in keywords))
         
-        return [self.packs[pid] for pid in matched_ids if pid in self.packs]
+        packs = self.packs
+        return [pack for pid in matched_ids if (pack := packs.get(pid)) is not None]
     
     def _generate_test_id(self, prefix: str, name: str) -> str:
         """Generate a unique test ID."""
-        hash_input = f"{prefix}-{name}-{datetime.utcnow().isoformat()}"
-        short_hash = hashlib.md5(hash_input.encode()).hexdigest()[:8]
-        safe_name = re.sub(r"[^a-z0-9]", "-", name.lower())[:30]
-        return f"{prefix}-{safe_name}-{short_hash}"
+        safe_name = _SAFE_NAME_RE.sub("-", name.lower())[:30]
+        # 32 random bits, same width as the old md5(name + timestamp) prefix
+        return f"{prefix}-{safe_name}-{secrets.token_hex(4)}"
     
     def _template_to_test_case(self, template: TestTemplate) -> TestCase:
         """Convert a test template to a test case."""
@@ -141,6 +183,8 @@ class TestPlanBuilder:
             description=template.description,
             failure_mode_id=template.failure_mode_id,
             priority=template.priority,
+            priority_rank=self._PRIORITY_ORDER.get(template.priority, 2),
+            # Copies: templates belong to the process-wide pack cache
             setup_steps=template.setup_steps.copy(),
             execution_steps=template.execution_steps.copy(),
             assertions=[
@@ -152,7 +196,7 @@ class TestPlanBuilder:
                 for a in template.assertions
             ],
             cleanup_steps=template.cleanup_steps.copy(),
-            tags=template.tags.copy() + ["generated"],
+            tags=[*template.tags, "generated"],
         )
     
     def _generate_basic_test(self, fm: FailureMode) -> TestCase:
@@ -163,6 +207,7 @@ class TestPlanBuilder:
             description=f"Verify system handles: {fm.description}",
             failure_mode_id=fm.id,
             priority=fm.severity,
+            priority_rank=self._PRIORITY_ORDER.get(fm.severity, 2),
             setup_steps=[
                 "# TODO: Configure test environment",
                 f"# Target failure mode: {fm.id}",
@@ -182,6 +227,30 @@ class TestPlanBuilder:
             tags=fm.tags + ["generated", "needs-implementation"],
         )
     
+    def _make_plan(
+        self,
+        title: Optional[str],
+        jira_key: Optional[str],
+        test_cases: list[TestCase],
+        failure_modes_covered: list[str],
+        coverage_notes: str,
+    ) -> TestPlan:
+        """Create the TestPlan wrapper around generated test cases."""
+        plan_title = title or f"Test Plan for {jira_key or 'Feature'}"
+        return TestPlan(
+            id=self._generate_test_id("plan", plan_title),
+            title=plan_title,
+            description="Auto-generated test plan from feature description analysis.",
+            jira_key=jira_key,
+            test_cases=test_cases,
+            failure_modes_covered=failure_modes_covered,
+            coverage_notes=coverage_notes,
+        )
+    
+    def _empty_plan(self, title: Optional[str], jira_key: Optional[str]) -> TestPlan:
+        """Create the plan for a description that matched no packs."""
+        return self._make_plan(title, jira_key, [], [], _NO_MATCH_NOTES)
+    
     def build(
         self,
         description: str,
@@ -201,40 +270,43 @@ class TestPlanBuilder:
         """
         # Extract keywords and match packs
         keywords = self._extract_keywords(description)
+        if not keywords:
+            return BuildResult(
+                plan=self._empty_plan(title, jira_key),
+                matched_packs=[],
+                recipes=[],
+                snippets=[],
+            )
         matched_packs = self._match_packs(keywords)
         
         # Collect test cases
         test_cases: list[TestCase] = []
-        failure_modes_covered: list[str] = []
+        failure_modes_covered: set[str] = set()
         recipes: list[Recipe] = []
         snippets: list[Snippet] = []
         
         for pack in matched_packs:
-            # Add test templates
+            # Add test templates, noting which failure modes they cover
+            template_fm_ids: set[str] = set()
             for template in pack.test_templates:
                 test_cases.append(self._template_to_test_case(template))
-                if template.failure_mode_id:
-                    failure_modes_covered.append(template.failure_mode_id)
+                fm_id = template.failure_mode_id
+                if fm_id:
+                    template_fm_ids.add(fm_id)
+                    failure_modes_covered.add(fm_id)
             
             # Generate tests for failure modes without templates
-            template_fm_ids = {t.failure_mode_id for t in pack.test_templates}
             for fm in pack.failure_modes:
                 if fm.id not in template_fm_ids:
                     test_cases.append(self._generate_basic_test(fm))
-                    failure_modes_covered.append(fm.id)
+                    failure_modes_covered.add(fm.id)
             
             # Collect recipes and snippets
             recipes.extend(pack.recipes)
             snippets.extend(pack.snippets)
         
         # Sort by priority
-        priority_order = {
-            Severity.CRITICAL: 0,
-            Severity.HIGH: 1,
-            Severity.MEDIUM: 2,
-            Severity.LOW: 3,
-        }
-        test_cases.sort(key=lambda tc: priority_order.get(tc.priority, 2))
+        test_cases.sort(key=attrgetter("priority_rank"))
         
         # Build coverage notes
         if matched_packs:
@@ -242,24 +314,13 @@ class TestPlanBuilder:
                 f"Matched {len(matched_packs)} knowledge packs: "
                 f"{', '.join(p.id for p in matched_packs)}.\n"
                 f"Generated {len(test_cases)} test cases covering "
-                f"{len(set(failure_modes_covered))} failure modes."
+                f"{len(failure_modes_covered)} failure modes."
             )
         else:
-            coverage_notes = (
-                "No matching knowledge packs found for this description. "
-                "Consider adding custom packs or using more specific keywords."
-            )
+            coverage_notes = _NO_MATCH_NOTES
         
-        # Create plan
-        plan_title = title or f"Test Plan for {jira_key or 'Feature'}"
-        plan = TestPlan(
-            id=self._generate_test_id("plan", plan_title),
-            title=plan_title,
-            description="Auto-generated test plan from feature description analysis.",
-            jira_key=jira_key,
-            test_cases=test_cases,
-            failure_modes_covered=list(set(failure_modes_covered)),
-            coverage_notes=coverage_notes,
+        plan = self._make_plan(
+            title, jira_key, test_cases, list(failure_modes_covered), coverage_notes
         )
         
         return BuildResult(
@@ -11,11 +11,16 @@ The config file (.poet.yaml) stores:
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import yaml
 from pydantic import BaseModel, Field
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class SystemProfile(BaseModel):
     """Detected system capabilities."""
@@ -61,9 +66,14 @@ class PoetConfig(BaseModel):
     )
 
 
-# Global config cache
-_cached_config: Optional[PoetConfig] = None
-_config_path: Optional[Path] = None
+# Parsed configs keyed by resolved file path, with the (st_mtime_ns, st_size)
+# they were parsed at; an edited file is re-read on the next load_config()
+_config_cache: dict[Path, tuple[tuple[int, int], PoetConfig]] = {}
+
+
+def load_yaml(data: bytes | str) -> Any:
+    """Parse one YAML document with the fastest available safe loader."""
+    return yaml.load(data, Loader=_YamlLoader)
 
 
 def load_config(path: Optional[Path] = None) -> Optional[PoetConfig]:
@@ -75,14 +85,9 @@ def load_config(path: Optional[Path] = None) -> Optional[PoetConfig]:
     2. Current directory (.poet.yaml)
     3. Home directory (~/.poet.yaml)
     
-    Returns None if no config found.
+    Returns None if no config found. Parsed configs are cached per file and
+    reused until the file's mtime or size changes.
     """
-    global _cached_config, _config_path
-    
-    # Use cached config if same path
-    if _cached_config and (path is None or path == _config_path):
-        return _cached_config
-    
     # Search for config file
     search_paths = []
     if path:
@@ -94,36 +99,33 @@ def load_config(path: Optional[Path] = None) -> Optional[PoetConfig]:
     
     config_file = None
     for p in search_paths:
-        if p.exists():
-            config_file = p
-            break
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        config_file = p
+        break
     
     if not config_file:
         return None
     
-    # Load and parse config
-    with open(config_file) as f:
-        data = yaml.safe_load(f)
+    key = config_file.resolve()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
     
-    # Convert string paths back to Path objects
-    if "packs_paths" in data:
-        data["packs_paths"] = [Path(p) for p in data["packs_paths"]]
-    if "knowledge_index_path" in data:
-        data["knowledge_index_path"] = Path(data["knowledge_index_path"])
-    if "default_output_dir" in data:
-        data["default_output_dir"] = Path(data["default_output_dir"])
+    # Load and parse config; libyaml decodes the raw bytes itself
+    data = load_yaml(config_file.read_bytes())
     
+    # Pydantic coerces the string paths back to Path fields
     config = PoetConfig.model_validate(data)
     
-    # Cache config
-    _cached_config = config
-    _config_path = config_file
+    _config_cache[key] = (stamp, config)
     
     return config
 
 
 def clear_config_cache() -> None:
     """Clear the cached configuration."""
-    global _cached_config, _config_path
-    _cached_config = None
-    _config_path = None
+    _config_cache.clear()
@@ -0,0 +1,38 @@
+# src/prevent_outage_edge_testing/core/jsonio.py
+# JSON encode/decode helpers with optional orjson acceleration.
+"""
+Thin wrappers around orjson with a stdlib `json` fallback.
+
+orjson is an optional dependency (`pip install prevent-outage-edge-testing[fast]`).
+Both paths work on bytes so callers can use `Path.read_bytes()` /
+`Path.write_bytes()` directly and skip an intermediate str decode/encode.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, optionally indented by two spaces."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, default=default, ensure_ascii=False
+    ).encode("utf-8")
@@ -14,8 +14,9 @@ This helps POET generate more contextually relevant tests.
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Any, ClassVar, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -55,6 +56,9 @@ class LearnedPattern(BaseModel):
         return f"# {self.pattern_type.value}: {self.name}"
 
 
+_IndexT = TypeVar("_IndexT", bound="KnowledgeIndex")
+
+
 class KnowledgeIndex(BaseModel):
     """Local knowledge index storing learned patterns."""
     
@@ -64,43 +68,91 @@ class KnowledgeIndex(BaseModel):
     patterns: list[LearnedPattern] = Field(default_factory=list)
     sources: list[str] = Field(default_factory=list, description="Source paths scanned")
     
+    # Lookup indexes over `patterns`, built on first use. add_pattern() is
+    # the only supported way to change `patterns`: editing the list in place
+    # leaves the indexes stale until invalidate_indexes() is called.
+    # Returned lists are shared; treat them as read-only.
+    _INDEX_ATTRS: ClassVar[tuple[str, ...]] = ("_by_type", "_high_confidence", "_suggestion_names")
+    
+    @cached_property
+    def _by_type(self) -> dict[PatternType, list[LearnedPattern]]:
+        by_type: dict[PatternType, list[LearnedPattern]] = {}
+        for p in self.patterns:
+            by_type.setdefault(p.pattern_type, []).append(p)
+        return by_type
+    
+    @cached_property
+    def _high_confidence(self) -> dict[float, list[LearnedPattern]]:
+        # Filled per threshold by get_high_confidence_patterns
+        return {}
+    
+    @cached_property
+    def _suggestion_names(self) -> list[tuple[str, LearnedPattern]]:
+        return [(p.name.lower(), p) for p in self.get_high_confidence_patterns()]
+    
+    def __copy__(self: _IndexT) -> _IndexT:
+        # The shallow copy would share `patterns` and the cached indexes, so
+        # add_pattern() on either side would leave the other one stale
+        copied = super().__copy__()
+        copied.__dict__["patterns"] = list(self.patterns)
+        copied.invalidate_indexes()
+        return copied
+    
+    def __deepcopy__(self: _IndexT, memo: Optional[dict[int, Any]] = None) -> _IndexT:
+        copied = super().__deepcopy__(memo)
+        copied.invalidate_indexes()
+        return copied
+    
+    def add_pattern(self, pattern: LearnedPattern) -> None:
+        """Append a pattern and drop the lookup indexes."""
+        self.patterns.append(pattern)
+        self.invalidate_indexes()
+    
+    def invalidate_indexes(self) -> None:
+        """Drop the lookup indexes so they are rebuilt from `patterns`."""
+        for name in self._INDEX_ATTRS:
+            self.__dict__.pop(name, None)
+    
     def get_patterns_by_type(self, pattern_type: PatternType) -> list[LearnedPattern]:
         """Get all patterns of a specific type."""
-        return [p for p in self.patterns if p.pattern_type == pattern_type]
+        return self._by_type.get(pattern_type, [])
     
     def get_high_confidence_patterns(self, min_confidence: float = 0.7) -> list[LearnedPattern]:
         """Get patterns above a confidence threshold."""
-        return [p for p in self.patterns if p.confidence >= min_confidence]
+        found = self._high_confidence.get(min_confidence)
+        if found is None:
+            found = [p for p in self.patterns if p.confidence >= min_confidence]
+            self._high_confidence[min_confidence] = found
+        return found
     
     def get_suggestions_for_failure_mode(self, failure_mode_id: str) -> list[str]:
         """Get code suggestions relevant to a failure mode."""
-        suggestions = []
-        
         # Map failure mode keywords to pattern types
         keywords = failure_mode_id.lower().split("-")
         
-        for pattern in self.get_high_confidence_patterns():
-            if any(kw in pattern.name.lower() for kw in keywords):
+        suggestions = []
+        for name_lower, pattern in self._suggestion_names:
+            if any(kw in name_lower for kw in keywords):
                 suggestions.append(pattern.to_suggestion())
+                if len(suggestions) == 5:  # Limit suggestions
+                    break
         
-        return suggestions[:5]  # Limit suggestions
+        return suggestions
 
 
 def load_knowledge_index(path: Path) -> Optional[KnowledgeIndex]:
     """Load knowledge index from JSON file."""
-    if not path.exists():
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
         return None
     
-    import json
-    with open(path) as f:
-        data = json.load(f)
-    
-    return KnowledgeIndex.model_validate(data)
+    # pydantic-core parses the bytes straight into the model, no dict in between
+    return KnowledgeIndex.model_validate_json(raw)
 
 
 def save_knowledge_index(index: KnowledgeIndex, path: Path) -> None:
     """Save knowledge index to JSON file."""
-    import json
-    
-    with open(path, "w") as f:
-        json.dump(index.model_dump(mode="json"), f, indent=2, default=str)
+    # pydantic-core encodes straight to JSON (datetimes as ISO 8601), with no
+    # intermediate dict or per-value default= callback
+    path.write_text(index.model_dump_json(indent=2), encoding="utf-8")
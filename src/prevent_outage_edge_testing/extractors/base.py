@@ -9,12 +9,19 @@ Extractors can run in two modes:
 - SIMULATOR: Safe fallback that generates synthetic data for testing logic
 """
 
+import functools
+import heapq
+import itertools
+import re
+import threading
 from abc import ABC, abstractmethod
-from datetime import datetime
+from array import array
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Iterable, Iterator, Sequence, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from prevent_outage_edge_testing.models import ExtractorMode
 
@@ -37,12 +44,77 @@ class ExtractorResult(BaseModel):
     started_at: datetime
     ended_at: datetime | None = None
     data: list[dict[str, Any]] = Field(default_factory=list)
+    # Pre-encoded export (e.g. Prometheus text) when output_format != "dict"
+    payload: bytes | None = None
     error: str | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    # Lazily produced items for results from stop(stream=True)
+    _stream: Iterator[dict[str, Any]] | None = PrivateAttr(default=None)
+
+    def iter_data(self) -> Iterator[dict[str, Any]]:
+        """
+        Yield the collected items.
+
+        For streamed results the items are produced on demand from the
+        buffers stop() swapped out, and can only be iterated once.
+        """
+        if self._stream is None:
+            yield from self.data
+            return
+        stream, self._stream = self._stream, None
+        yield from stream
+
 
 T = TypeVar("T")
 
+# Newest samples kept per extractor run; older ones are dropped
+DEFAULT_MAX_SAMPLES = 100_000
+
+_EPOCH = datetime(1970, 1, 1)
+_PROM_NAME_RE = re.compile(r"[^a-zA-Z0-9_:]")
+_PROM_LABEL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+
+def _resolve_ns_timestamps(
+    items: Iterable[dict[str, Any]], fields: tuple[str, ...]
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield items with integer time.time_ns() values in the given fields
+    replaced, in place, by naive UTC datetimes. Samples from one tick
+    share a timestamp, so each distinct value is converted once.
+    """
+    converted: dict[int, datetime] = {}
+    for item in items:
+        for field in fields:
+            value = item.get(field)
+            if type(value) is int:
+                stamp = converted.get(value)
+                if stamp is None:
+                    stamp = converted[value] = _EPOCH + timedelta(
+                        microseconds=value // 1000
+                    )
+                item[field] = stamp
+        yield item
+
+
+def _detach_shared(items: Iterable[dict[str, Any]], field: str) -> Iterator[dict[str, Any]]:
+    """
+    Yield items with the dict in ``field`` replaced, in place, by a copy.
+
+    Collectors share one dict across many items and keep using it, so each
+    distinct dict is copied once per result rather than once per item.
+    """
+    # id -> (original, copy); holding the original keeps its id from being reused
+    copies: dict[int, tuple[dict[str, Any], dict[str, Any]]] = {}
+    for item in items:
+        shared = item[field]
+        entry = copies.get(id(shared))
+        if entry is None:
+            entry = copies[id(shared)] = (shared, dict(shared))
+        item[field] = entry[1]
+        yield item
+
 
 class BaseExtractor(ABC, Generic[T]):
     """
@@ -51,18 +123,37 @@ class BaseExtractor(ABC, Generic[T]):
     Subclasses must implement both privileged and simulator modes.
     The extractor will automatically fall back to simulator mode
     if privileged mode is not available.
+
+    Collected items live in a ring buffer holding the newest
+    ``max_samples`` entries; anything pushed out is counted and reported
+    as ``dropped_count`` in the result metadata.
     """
 
+    # Subclasses whose collectors only ever store dump-shaped dicts set this
+    # so stop() can copy the buffer without per-item _serialize_item calls.
+    _raw_dicts: bool = False
+    # Datetime fields that raw dicts may carry as time.time_ns() integers
+    _ns_time_fields: tuple[str, ...] = ()
+    # Encodings besides "dict" this extractor can render in stop()
+    _payload_formats: tuple[str, ...] = ()
+
+    # "dict" returns ExtractorResult.data; other formats fill .payload
+    output_format: str = "dict"
+
     def __init__(
         self,
         extractor_id: str,
         mode: ExtractorMode = ExtractorMode.SIMULATOR,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
     ) -> None:
         self.extractor_id = extractor_id
         self.mode = mode
         self.status = ExtractorStatus.IDLE
         self._started_at: datetime | None = None
-        self._data: list[T] = []
+        self._max_samples = max_samples
+        self._data: deque[T | dict[str, Any]] = deque(maxlen=max_samples)
+        self._data_lock = threading.Lock()
+        self._reset_buffers()
 
     @property
     @abstractmethod
@@ -96,17 +187,29 @@ class BaseExtractor(ABC, Generic[T]):
         """Stop simulator mode collection."""
         ...
 
-    def can_run_privileged(self) -> bool:
-        """Check if privileged mode is available on this system."""
+    @classmethod
+    def can_run_privileged(cls, refresh: bool = False) -> bool:
+        """
+        Check if privileged mode is available on this system.
+
+        A classmethod so callers can probe a type without instantiating it.
+        Implementations may memoize expensive probes; pass ``refresh=True``
+        to re-run them.
+        """
         return False  # Override in subclasses
 
     def start(self) -> None:
         """Start the extractor."""
         if self.status == ExtractorStatus.RUNNING:
             return
+        if self.output_format != "dict" and self.output_format not in self._payload_formats:
+            raise ValueError(
+                f"{self.name} does not support output format {self.output_format!r}"
+            )
 
         self._started_at = datetime.utcnow()
-        self._data = []
+        with self._data_lock:
+            self._reset_buffers()
         self.status = ExtractorStatus.RUNNING
 
         try:
@@ -123,8 +226,15 @@ class BaseExtractor(ABC, Generic[T]):
             self.status = ExtractorStatus.ERROR
             raise RuntimeError(f"Failed to start extractor: {e}") from e
 
-    def stop(self) -> ExtractorResult:
-        """Stop the extractor and return results."""
+    def stop(self, stream: bool = False) -> ExtractorResult:
+        """
+        Stop the extractor and return results.
+
+        With ``stream=True`` the result's ``data`` is left empty and items
+        are serialized on demand through ``result.iter_data()``, so large
+        runs are never materialized as one list. The buffers are swapped
+        out here, so restarting the extractor does not affect the stream.
+        """
         ended_at = datetime.utcnow()
 
         try:
@@ -138,18 +248,57 @@ class BaseExtractor(ABC, Generic[T]):
             self.status = ExtractorStatus.ERROR
             error = str(e)
 
-        return ExtractorResult(
+        # Swap the buffers out so late collector writes cannot race the dump
+        with self._data_lock:
+            collected, dropped = self._take_buffers()
+
+        payload = None
+        items: Iterator[dict[str, Any]] | None = None
+        data: list[dict[str, Any]] = []
+        if self.output_format != "dict":
+            payload = self._encode_payload(collected)
+        else:
+            if self._raw_dicts:
+                items = _resolve_ns_timestamps(collected, self._ns_time_fields)
+            else:
+                items = map(self._serialize_item, collected)
+            if not stream:
+                data = list(items)
+                items = None
+
+        result = ExtractorResult(
             extractor_id=self.extractor_id,
             mode=self.mode,
             status=self.status,
             started_at=self._started_at or ended_at,
             ended_at=ended_at,
-            data=[self._serialize_item(d) for d in self._data],
+            data=data,
+            payload=payload,
             error=error,
-            metadata={"name": self.name, "description": self.description},
+            metadata={
+                "name": self.name,
+                "description": self.description,
+                "dropped_count": dropped,
+            },
         )
-
-    def _serialize_item(self, item: T) -> dict[str, Any]:
+        result._stream = items
+        return result
+
+    def _reset_buffers(self) -> None:
+        """Empty the sample buffers. Called with _data_lock held."""
+        self._data.clear()
+        self._dropped = 0
+
+    def _take_buffers(self) -> tuple[Iterable[Any], int]:
+        """
+        Swap out the collected items and dropped count for stop().
+        Called with _data_lock held.
+        """
+        collected, self._data = self._data, deque(maxlen=self._max_samples)
+        dropped, self._dropped = self._dropped, 0
+        return collected, dropped
+
+    def _serialize_item(self, item: T | dict[str, Any]) -> dict[str, Any]:
         """Serialize a data item to dict. Override for custom types."""
         if isinstance(item, BaseModel):
             return item.model_dump()
@@ -157,9 +306,37 @@ class BaseExtractor(ABC, Generic[T]):
             return item
         return {"value": item}
 
-    def add_data(self, item: T) -> None:
-        """Add a data item to the collection."""
-        self._data.append(item)
+    def _encode_payload(self, items: Iterable[Any]) -> bytes:
+        """Render collected items in output_format. Override with _payload_formats."""
+        raise ValueError(f"Unsupported output format: {self.output_format!r}")
+
+    def add_data(self, item: T | dict[str, Any]) -> None:
+        """
+        Add a data item to the collection.
+
+        Collectors on hot paths may pass a plain dict shaped like the
+        model's ``model_dump()`` instead of a model instance; it is stored
+        as-is and skips per-sample validation. Extractors with
+        ``_raw_dicts`` set may store their ``_ns_time_fields`` as
+        ``time.time_ns()`` integers; stop() converts them to datetimes.
+
+        Subclasses that still want model instances from already-parsed,
+        trusted input should build them with ``Model.model_construct(...)``
+        and pass every field explicitly: it skips validation, and default
+        factories only run for fields left out.
+        """
+        with self._data_lock:
+            if len(self._data) == self._max_samples:
+                self._dropped += 1
+            self._data.append(item)
+
+    def add_batch(self, items: Sequence[T | dict[str, Any]]) -> None:
+        """Add several data items at once, taking the lock a single time."""
+        with self._data_lock:
+            overflow = len(self._data) + len(items) - self._max_samples
+            if overflow > 0:
+                self._dropped += overflow
+            self._data.extend(items)
 
 
 class MetricSample(BaseModel):
@@ -171,8 +348,191 @@ class MetricSample(BaseModel):
     labels: dict[str, str] = Field(default_factory=dict)
 
 
+@functools.lru_cache(maxsize=1024)
+def _prom_metric_name(name: str) -> str:
+    """Map a dotted metric name onto the Prometheus name charset."""
+    return _PROM_NAME_RE.sub("_", name)
+
+
+def _prom_labels(labels: dict[str, str]) -> str:
+    """Render a label set as ``{k="v",...}``, or "" when empty."""
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{_prom_metric_name(k)}="{str(v).translate(_PROM_LABEL_ESCAPES)}"'
+        for k, v in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _sample_ns(sample: MetricSample | dict[str, Any]) -> int:
+    """A buffered sample's timestamp as time.time_ns(), for ordering."""
+    ts = sample.timestamp if isinstance(sample, MetricSample) else sample["timestamp"]
+    if type(ts) is int:
+        return ts
+    offset = ts.utcoffset()
+    if offset is not None:
+        ts = ts.replace(tzinfo=None) - offset
+    return (ts - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
 class MetricExtractor(BaseExtractor[MetricSample]):
-    """Base class for metric extractors."""
+    """
+    Base class for metric extractors.
+
+    Besides add_data/add_batch, collectors can push samples with
+    add_samples(), which packs them column-wise into typed arrays (value,
+    timestamp, interned name id, interned label-set id) instead of keeping
+    a dict per sample; they are expanded back to dicts only in stop().
+
+    ``max_samples`` caps both buffers together: when they overflow, the
+    oldest samples by timestamp are dropped from whichever buffer holds
+    them, and stop() returns the two merged in timestamp order.
+    """
+
+    _ns_time_fields = ("timestamp",)
+    _payload_formats = ("prom",)
+
+    def _reset_buffers(self) -> None:
+        super()._reset_buffers()
+        self._values = array("d")
+        self._stamps = array("q")
+        self._name_ids = array("I")
+        self._label_ids = array("I")
+        self._names: list[str] = []
+        self._name_index: dict[str, int] = {}
+        # Label sets are interned by identity; the list keeps them alive
+        self._label_sets: list[dict[str, str]] = []
+        self._label_index: dict[int, int] = {}
+
+    def _trim_samples(self, limit: int, incoming: int = 0) -> None:
+        """
+        Drop the oldest buffered samples so that both buffers together, plus
+        ``incoming`` samples about to be appended, fit in max_samples. Nothing
+        is dropped until that sum exceeds limit. Called with _data_lock held.
+        """
+        data, stamps = self._data, self._stamps
+        total = len(data) + len(stamps)
+        overflow = min(total, total + incoming - self._max_samples)
+        if total + incoming <= limit or overflow <= 0:
+            return
+        packed_overflow = overflow
+        if data:
+            # Walk both buffers oldest-first to split the overflow between them
+            packed_overflow = 0
+            for _ in range(overflow):
+                if packed_overflow < len(stamps) and (
+                    not data or stamps[packed_overflow] <= _sample_ns(data[0])
+                ):
+                    packed_overflow += 1
+                else:
+                    data.popleft()
+        if packed_overflow:
+            for column in (self._values, stamps, self._name_ids, self._label_ids):
+                del column[:packed_overflow]
+        self._dropped += overflow
+
+    def add_data(self, item: MetricSample | dict[str, Any]) -> None:
+        with self._data_lock:
+            # Make room first so the deque's maxlen never evicts on its own
+            self._trim_samples(self._max_samples, 1)
+            self._data.append(item)
+
+    def add_batch(self, items: Sequence[MetricSample | dict[str, Any]]) -> None:
+        with self._data_lock:
+            self._trim_samples(self._max_samples, len(items))
+            # A batch larger than max_samples keeps only its newest items
+            excess = len(items) - self._max_samples
+            if excess > 0:
+                self._dropped += excess
+            self._data.extend(items)
+
+    def add_samples(
+        self,
+        timestamp_ns: int,
+        labels: dict[str, str],
+        samples: Iterable[tuple[str, float]],
+    ) -> None:
+        """
+        Append (name, value) samples that share a time.time_ns() stamp and label set.
+
+        ``labels`` is interned by identity: pass the same dict for every call
+        with the same label set, and do not mutate it afterwards. Results get
+        their own copy of each label set.
+        """
+        with self._data_lock:
+            label_id = self._label_index.get(id(labels))
+            if label_id is None:
+                label_id = self._label_index[id(labels)] = len(self._label_sets)
+                self._label_sets.append(labels)
+            names, name_index = self._names, self._name_index
+            name_ids, values = array("I"), array("d")
+            for name, value in samples:
+                name_id = name_index.get(name)
+                if name_id is None:
+                    name_id = name_index[name] = len(names)
+                    names.append(name)
+                name_ids.append(name_id)
+                values.append(value)
+            count = len(name_ids)
+            self._name_ids.extend(name_ids)
+            self._values.extend(values)
+            self._stamps.extend(array("q", [timestamp_ns]) * count)
+            self._label_ids.extend(array("I", [label_id]) * count)
+            # Trim in slack-sized steps so the memmove is amortised
+            self._trim_samples(self._max_samples + self._max_samples // 8)
+
+    def _take_buffers(self) -> tuple[Iterable[Any], int]:
+        self._trim_samples(self._max_samples)
+        collected, dropped = super()._take_buffers()
+        # One copy per label set, so results never alias the collectors' dicts
+        names, label_sets = self._names, [dict(labels) for labels in self._label_sets]
+        has_packed = len(self._values) > 0
+        # Expanded lazily; the swapped-out columns stay alive with the generator
+        packed = (
+            {
+                "name": names[name_id],
+                "value": value,
+                "timestamp": stamp,
+                "labels": label_sets[label_id],
+            }
+            for value, stamp, name_id, label_id in zip(
+                self._values, self._stamps, self._name_ids, self._label_ids, strict=True
+            )
+        )
+        self._reset_buffers()
+        if not collected or not has_packed:
+            return itertools.chain(collected, packed), dropped
+        return heapq.merge(collected, packed, key=_sample_ns), dropped
+
+    def _encode_payload(self, items: Iterable[Any]) -> bytes:
+        """Render samples as Prometheus text exposition lines."""
+        # Collectors share one labels dict per run, so render each set once.
+        # Buffered dicts stay alive for the whole loop, so their ids are
+        # stable; a model's model_dump() labels are freed (and their id
+        # reused) right away, so those are rendered every time.
+        label_cache: dict[int, str] = {}
+        lines = []
+        for item in items:
+            if isinstance(item, BaseModel):
+                sample = item.model_dump()
+                rendered = _prom_labels(sample["labels"])
+            else:
+                sample = item
+                labels = sample["labels"]
+                cached = label_cache.get(id(labels))
+                if cached is None:
+                    cached = label_cache[id(labels)] = _prom_labels(labels)
+                rendered = cached
+            ts = sample["timestamp"]
+            if type(ts) is int:
+                ts_ms = ts // 1_000_000
+            else:
+                ts_ms = int(ts.replace(tzinfo=timezone.utc).timestamp() * 1000)
+            lines.append(
+                f"{_prom_metric_name(sample['name'])}{rendered} {sample['value']} {ts_ms}\n"
+            )
+        return "".join(lines).encode("utf-8")
 
     @property
     def description(self) -> str:
@@ -192,6 +552,8 @@ class LogEntry(BaseModel):
 class LogExtractor(BaseExtractor[LogEntry]):
     """Base class for log extractors."""
 
+    _ns_time_fields = ("timestamp",)
+
     @property
     def description(self) -> str:
         return "Collects log entries from the system"
@@ -214,6 +576,8 @@ class TraceSpan(BaseModel):
 class TraceExtractor(BaseExtractor[TraceSpan]):
     """Base class for trace extractors."""
 
+    _ns_time_fields = ("start_time", "end_time")
+
     @property
     def description(self) -> str:
         return "Collects distributed trace spans"
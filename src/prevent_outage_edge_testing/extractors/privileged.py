@@ -12,27 +12,317 @@ These extractors use:
 Each extractor provides:
 - A "real" implementation for systems where it's possible
 - Automatic fallback to simulator mode if privileges are unavailable
+
+Collectors run as coroutines on one shared asyncio event loop thread
+rather than a thread per extractor.
 """
 
+import asyncio
+import concurrent.futures
+import ctypes
+import ctypes.util
+import functools
+import itertools
 import os
 import platform
+import random
+import re
 import shutil
+import struct
 import subprocess
 import threading
 import time
-from datetime import datetime
-from typing import Any
+import uuid
+from collections import deque
+from multiprocessing import shared_memory
+from typing import IO, Any, AsyncIterator, Callable, Coroutine, Iterable
 
 from prevent_outage_edge_testing.extractors.base import (
-    LogEntry,
+    DEFAULT_MAX_SAMPLES,
     LogExtractor,
     MetricExtractor,
-    MetricSample,
     TraceExtractor,
-    TraceSpan,
+    _detach_shared,
 )
 from prevent_outage_edge_testing.models import ExtractorMode
 
+# Bytes requested per read on a collector pipe
+_READ_CHUNK = 65536
+# One printa() row of the default DTrace script: "  probefunc   count"
+_DTRACE_ROW_RE = re.compile(r"\s*(\S+)\s+(\d+)\s*$")
+# Seconds stop() waits for a collector to notice it should exit
+_JOIN_TIMEOUT = 2.0
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _collector_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop shared by all collectors.
+
+    The loop runs on a single daemon thread started on first use, so any
+    number of running extractors costs one thread instead of one each.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="poet-collectors", daemon=True
+            ).start()
+            _loop = loop
+    return _loop
+
+
+def _spawn(coro: Coroutine[Any, Any, None]) -> "concurrent.futures.Future[None]":
+    """Schedule a collector coroutine on the shared loop."""
+    return asyncio.run_coroutine_threadsafe(coro, _collector_loop())
+
+
+def _spawn_blocking(collect: Callable[[], None], name: str) -> "concurrent.futures.Future[None]":
+    """
+    Run a blocking poll loop on its own daemon thread.
+
+    Blocking pollers cannot live on the shared loop, and the loop's default
+    executor threads are joined at interpreter exit, so an extractor that
+    is never stopped would hang shutdown. The returned future completes when
+    collect() returns, so _join() treats it like any other collector.
+    """
+    future: concurrent.futures.Future[None] = concurrent.futures.Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            collect()
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
+
+def _join(collector: "concurrent.futures.Future[None]") -> bool:
+    """
+    Wait for a collector to finish, cancelling it if it overruns.
+
+    Returns False if the collector may still be running: a future whose
+    collector has already started cannot be cancelled.
+    """
+    try:
+        collector.result(timeout=_JOIN_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        collector.cancel()
+        return collector.done()
+    except concurrent.futures.CancelledError:
+        pass
+    return True
+
+
+def _signal(event: asyncio.Event) -> None:
+    """Set a collector's stop event from any thread."""
+    _collector_loop().call_soon_threadsafe(event.set)
+
+
+async def _sleep_until(deadline: float, stop: asyncio.Event) -> None:
+    """Sleep until a time.monotonic() deadline, waking early once stop is set."""
+    try:
+        await asyncio.wait_for(stop.wait(), max(0.0, deadline - time.monotonic()))
+    except asyncio.TimeoutError:
+        pass
+
+
+async def _aiter_line_batches(
+    pipe: IO[bytes], running: Callable[[], bool]
+) -> AsyncIterator[list[str]]:
+    """
+    Yield complete lines from a child process pipe in batches.
+
+    Reads the pipe in large chunks instead of one readline() per event,
+    decoding once per batch and carrying any partial trailing line over to
+    the next read. Stops when running() turns false or the pipe hits EOF;
+    an unterminated last line is yielded on its own at EOF.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=_READ_CHUNK)
+    transport, _ = await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), pipe
+    )
+    residue = b""
+    try:
+        while running():
+            chunk = await reader.read(_READ_CHUNK)
+            if not chunk:
+                if residue:
+                    yield [residue.decode("utf-8", "replace")]
+                return
+            head, sep, residue = (residue + chunk).rpartition(b"\n")
+            if sep:
+                yield head.decode("utf-8", "replace").split("\n")
+    finally:
+        transport.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _which(cmd: str) -> str | None:
+    """shutil.which, memoized per process."""
+    return shutil.which(cmd)
+
+
+@functools.lru_cache(maxsize=1)
+def _dtrace_probe_available() -> bool:
+    """Check if DTrace is installed and we may list syscall probes."""
+    if platform.system() not in ("Darwin", "SunOS"):
+        return False
+    if not _which("dtrace"):
+        return False
+    # Check if we have dtrace permissions (root or dtrace group)
+    try:
+        result = subprocess.run(
+            ["dtrace", "-l", "-n", "syscall:::entry"],
+            capture_output=True,
+            timeout=5,
+        )
+        return result.returncode == 0
+    except (subprocess.TimeoutExpired, OSError):
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _has_cap_bpf() -> bool:
+    """Check if current process has CAP_BPF."""
+    try:
+        # Try to read capabilities
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("CapEff:"):
+                    cap_eff = int(line.split()[1], 16)
+                    CAP_BPF = 1 << 39
+                    return bool(cap_eff & CAP_BPF)
+    except Exception:
+        pass
+    return False
+
+
+def _clear_capability_caches() -> None:
+    """Forget memoized privilege probes so the next check re-runs them."""
+    _which.cache_clear()
+    _dtrace_probe_available.cache_clear()
+    _has_cap_bpf.cache_clear()
+    _load_libpcap.cache_clear()
+
+
+# Bytes of each packet kept by libpcap (link + IP + TCP headers)
+_PCAP_SNAPLEN = 128
+# Kernel capture ring size requested from libpcap
+_PCAP_BUFFER_SIZE = 8 * 1024 * 1024
+# pcap_next_ex() read timeout, bounds how long stop() waits for the loop
+_PCAP_TIMEOUT_MS = 100
+
+# A pcap_t* as returned through a c_void_p restype: its address as an int
+_PcapHandle = int
+# One captured packet: (span_no, ts_sec, ts_usec, caplen, len, header bytes)
+_PacketRow = tuple[int, int, int, int, int, bytes]
+
+
+class _PcapTimeval(ctypes.Structure):
+    # suseconds_t is a 32-bit int on macOS (padded to 8 bytes), a long elsewhere
+    _fields_ = [
+        ("tv_sec", ctypes.c_long),
+        ("tv_usec", ctypes.c_int32 if platform.system() == "Darwin" else ctypes.c_long),
+    ]
+
+
+class _PcapPkthdr(ctypes.Structure):
+    _fields_ = [
+        ("ts", _PcapTimeval),
+        ("caplen", ctypes.c_uint32),
+        ("len", ctypes.c_uint32),
+    ]
+
+
+class _BpfProgram(ctypes.Structure):
+    _fields_ = [("bf_len", ctypes.c_uint), ("bf_insns", ctypes.c_void_p)]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_libpcap() -> ctypes.CDLL | None:
+    """Load libpcap through ctypes, or None if it is not installed."""
+    path = ctypes.util.find_library("pcap")
+    if not path:
+        return None
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None
+
+    handle, c_int, c_char_p = ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p
+    signatures: dict[str, tuple[list[Any], Any]] = {
+        "pcap_create": ([c_char_p, c_char_p], handle),
+        "pcap_set_snaplen": ([handle, c_int], c_int),
+        "pcap_set_promisc": ([handle, c_int], c_int),
+        "pcap_set_timeout": ([handle, c_int], c_int),
+        "pcap_set_buffer_size": ([handle, c_int], c_int),
+        "pcap_activate": ([handle], c_int),
+        "pcap_compile": (
+            [handle, ctypes.POINTER(_BpfProgram), c_char_p, c_int, ctypes.c_uint32],
+            c_int,
+        ),
+        "pcap_setfilter": ([handle, ctypes.POINTER(_BpfProgram)], c_int),
+        "pcap_freecode": ([ctypes.POINTER(_BpfProgram)], None),
+        "pcap_next_ex": (
+            [
+                handle,
+                ctypes.POINTER(ctypes.POINTER(_PcapPkthdr)),
+                ctypes.POINTER(ctypes.c_void_p),
+            ],
+            c_int,
+        ),
+        "pcap_geterr": ([handle], c_char_p),
+        "pcap_close": ([handle], None),
+    }
+    try:
+        for func_name, (argtypes, restype) in signatures.items():
+            func = getattr(lib, func_name)
+            func.argtypes = argtypes
+            func.restype = restype
+    except AttributeError:
+        return None
+    return lib
+
+
+def _open_pcap(lib: ctypes.CDLL, interface: str, filter_expr: str) -> _PcapHandle:
+    """Open and activate a filtered live capture handle."""
+    errbuf = ctypes.create_string_buffer(256)
+    # c_void_p results come back as None for NULL
+    pcap: _PcapHandle | None = lib.pcap_create(interface.encode(), errbuf)
+    if not pcap:
+        raise RuntimeError(f"pcap_create failed: {errbuf.value.decode(errors='replace')}")
+    lib.pcap_set_snaplen(pcap, _PCAP_SNAPLEN)
+    lib.pcap_set_promisc(pcap, 0)
+    lib.pcap_set_timeout(pcap, _PCAP_TIMEOUT_MS)
+    lib.pcap_set_buffer_size(pcap, _PCAP_BUFFER_SIZE)
+
+    program = _BpfProgram()
+    if (
+        lib.pcap_activate(pcap) < 0
+        or lib.pcap_compile(pcap, ctypes.byref(program), filter_expr.encode(), 1, 0)
+        < 0
+    ):
+        error = (lib.pcap_geterr(pcap) or b"").decode(errors="replace")
+        lib.pcap_close(pcap)
+        raise RuntimeError(f"libpcap capture setup failed: {error}")
+    status = lib.pcap_setfilter(pcap, ctypes.byref(program))
+    lib.pcap_freecode(ctypes.byref(program))
+    if status < 0:
+        error = (lib.pcap_geterr(pcap) or b"").decode(errors="replace")
+        lib.pcap_close(pcap)
+        raise RuntimeError(f"pcap_setfilter failed: {error}")
+    return pcap
+
 
 class DTraceMetricExtractor(MetricExtractor):
     """
@@ -42,17 +332,21 @@ class DTraceMetricExtractor(MetricExtractor):
     Simulator mode: Generates synthetic metrics for testing.
     """
 
+    _raw_dicts = True
+
     def __init__(
         self,
         extractor_id: str = "dtrace-metrics",
         mode: ExtractorMode = ExtractorMode.SIMULATOR,
         dtrace_script: str | None = None,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
     ) -> None:
-        super().__init__(extractor_id, mode)
+        super().__init__(extractor_id, mode, max_samples)
         self._dtrace_script = dtrace_script or self._default_script()
-        self._process: subprocess.Popen[str] | None = None
-        self._collector_thread: threading.Thread | None = None
+        self._process: subprocess.Popen[bytes] | None = None
+        self._collector: concurrent.futures.Future[None] | None = None
         self._running = False
+        self._stop_event = asyncio.Event()
 
     @property
     def name(self) -> str:
@@ -73,89 +367,82 @@ class DTraceMetricExtractor(MetricExtractor):
         }
         """
 
-    def can_run_privileged(self) -> bool:
+    @classmethod
+    def can_run_privileged(cls, refresh: bool = False) -> bool:
         """Check if DTrace is available and we have permissions."""
-        if platform.system() not in ("Darwin", "SunOS"):
-            return False
-        if not shutil.which("dtrace"):
-            return False
-        # Check if we have dtrace permissions (root or dtrace group)
-        try:
-            result = subprocess.run(
-                ["dtrace", "-l", "-n", "syscall:::entry"],
-                capture_output=True,
-                timeout=5,
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, OSError):
-            return False
+        if refresh:
+            _clear_capability_caches()
+        return _dtrace_probe_available()
 
     def _run_privileged(self) -> None:
         """Start DTrace collection."""
+        self._stop_event = asyncio.Event()
         self._running = True
         self._process = subprocess.Popen(
             ["dtrace", "-n", self._dtrace_script],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
         )
+        process = self._process
+
+        async def collect() -> None:
+            add_samples = self.add_samples
+            time_ns = time.time_ns
+            labels = {"source": "dtrace"}  # shared by every sample
+            match_row = _DTRACE_ROW_RE.match
+            async for lines in _aiter_line_batches(
+                process.stdout, lambda: self._running  # type: ignore[arg-type]
+            ):
+                # Parse DTrace output and create metrics
+                add_samples(
+                    time_ns(),
+                    labels,
+                    ((f"syscall.{m[1]}", float(m[2])) for m in map(match_row, lines) if m),
+                )
 
-        def collect() -> None:
-            while self._running and self._process:
-                line = self._process.stdout.readline() if self._process.stdout else ""
-                if line:
-                    # Parse DTrace output and create metrics
-                    parts = line.strip().split()
-                    if len(parts) >= 2:
-                        try:
-                            self.add_data(
-                                MetricSample(
-                                    name=f"syscall.{parts[0]}",
-                                    value=float(parts[1]),
-                                    labels={"source": "dtrace"},
-                                )
-                            )
-                        except (ValueError, IndexError):
-                            pass
-
-        self._collector_thread = threading.Thread(target=collect, daemon=True)
-        self._collector_thread.start()
+        self._collector = _spawn(collect())
 
     def _run_simulator(self) -> None:
         """Generate synthetic metrics."""
+        self._stop_event = asyncio.Event()
         self._running = True
 
-        def generate() -> None:
-            syscalls = ["read", "write", "open", "close", "stat", "mmap"]
+        async def generate() -> None:
+            add_samples = self.add_samples
+            time_ns = time.time_ns
+            choices = random.choices
+            labels = {"source": "simulator"}  # shared by every sample
+            names = tuple(
+                f"syscall.{sc}" for sc in ("read", "write", "open", "close", "stat", "mmap")
+            )
+            values = range(10, 1001)
+            next_tick = time.monotonic()
             while self._running:
-                for sc in syscalls:
-                    import random
-
-                    self.add_data(
-                        MetricSample(
-                            name=f"syscall.{sc}",
-                            value=float(random.randint(10, 1000)),
-                            labels={"source": "simulator"},
-                        )
-                    )
-                time.sleep(1)
+                add_samples(
+                    time_ns(), labels, zip(names, choices(values, k=len(names)), strict=True)
+                )
+                next_tick += 1.0
+                await _sleep_until(next_tick, self._stop_event)
 
-        self._collector_thread = threading.Thread(target=generate, daemon=True)
-        self._collector_thread.start()
+        self._collector = _spawn(generate())
 
     def _stop_privileged(self) -> None:
         """Stop DTrace collection."""
         self._running = False
+        _signal(self._stop_event)
         if self._process:
             self._process.terminate()
             self._process.wait(timeout=5)
             self._process = None
+        if self._collector:
+            _join(self._collector)
 
     def _stop_simulator(self) -> None:
         """Stop simulator."""
         self._running = False
-        if self._collector_thread:
-            self._collector_thread.join(timeout=2)
+        _signal(self._stop_event)
+        if self._collector:
+            _join(self._collector)
 
 
 class EBPFMetricExtractor(MetricExtractor):
@@ -168,249 +455,510 @@ class EBPFMetricExtractor(MetricExtractor):
     Note: Requires the 'bcc' package and appropriate capabilities.
     """
 
+    _raw_dicts = True
+
     def __init__(
         self,
         extractor_id: str = "ebpf-metrics",
         mode: ExtractorMode = ExtractorMode.SIMULATOR,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
     ) -> None:
-        super().__init__(extractor_id, mode)
+        super().__init__(extractor_id, mode, max_samples)
         self._bpf: Any = None
-        self._collector_thread: threading.Thread | None = None
+        # Per-syscall counts received since the last emitted sample
+        self._counts: dict[int, int] = {}
+        self._collector: concurrent.futures.Future[None] | None = None
         self._running = False
+        self._stop_event = asyncio.Event()
 
     @property
     def name(self) -> str:
         return "eBPF Metric Extractor"
 
-    def can_run_privileged(self) -> bool:
+    @classmethod
+    def can_run_privileged(cls, refresh: bool = False) -> bool:
         """Check if eBPF/BCC is available."""
+        if refresh:
+            _clear_capability_caches()
         if platform.system() != "Linux":
             return False
         try:
             from bcc import BPF  # noqa: F401
 
             # Check for CAP_BPF or root
-            return os.geteuid() == 0 or self._has_cap_bpf()
+            return os.geteuid() == 0 or _has_cap_bpf()
         except ImportError:
             return False
 
-    def _has_cap_bpf(self) -> bool:
-        """Check if current process has CAP_BPF."""
-        try:
-            # Try to read capabilities
-            with open("/proc/self/status") as f:
-                for line in f:
-                    if line.startswith("CapEff:"):
-                        cap_eff = int(line.split()[1], 16)
-                        CAP_BPF = 1 << 39
-                        return bool(cap_eff & CAP_BPF)
-        except Exception:
-            pass
-        return False
-
     def _run_privileged(self) -> None:
-        """Start eBPF collection."""
+        """
+        Start eBPF collection.
+
+        The probe aggregates syscall counts per CPU in the kernel. A CPU's
+        count for a syscall is pushed to a ring buffer as an ``{id, count}``
+        event only when that syscall fires again at least a second after
+        the previous push. Userspace sums the events and emits them once a
+        second, so each sample covers counts flushed during that second,
+        not calls made during it: a rarely-called syscall shows up late
+        and in bulk. Counts still held in the kernel when the extractor
+        stops are drained by _stop_privileged(), so run totals are exact.
+        """
         from bcc import BPF
 
         bpf_program = """
         #include <uapi/linux/ptrace.h>
 
-        BPF_HASH(syscall_count, u32);
+        struct pending_count {
+            u64 count;
+            u64 last_flush_ns;
+        };
+
+        struct syscall_event {
+            u32 id;
+            u64 count;
+        };
+
+        BPF_PERCPU_HASH(pending, u32, struct pending_count, 1024);
+        BPF_RINGBUF_OUTPUT(events, 8);
 
         TRACEPOINT_PROBE(raw_syscalls, sys_enter) {
             u32 syscall_id = args->id;
-            syscall_count.increment(syscall_id);
+            struct pending_count zero = {};
+            struct pending_count *c = pending.lookup_or_try_init(&syscall_id, &zero);
+            if (!c)
+                return 0;
+            c->count++;
+            u64 now = bpf_ktime_get_ns();
+            if (now - c->last_flush_ns < 1000000000ULL)
+                return 0;
+            struct syscall_event ev = {.id = syscall_id, .count = c->count};
+            events.ringbuf_output(&ev, sizeof(ev), 0);
+            c->count = 0;
+            c->last_flush_ns = now;
             return 0;
         }
         """
 
         self._bpf = BPF(text=bpf_program)
+        self._stop_event = asyncio.Event()
         self._running = True
+        bpf = self._bpf
+        events = bpf["events"]
+        counts = self._counts = {}
+
+        def on_event(ctx: Any, data: Any, size: int) -> None:
+            ev = events.event(data)
+            counts[ev.id] = counts.get(ev.id, 0) + ev.count
+
+        events.open_ring_buffer(on_event)
 
         def collect() -> None:
+            add_samples = self.add_samples
+            time_ns = time.time_ns
+            labels = {"source": "ebpf"}  # shared by every sample
+            next_tick = time.monotonic() + 1.0
             while self._running:
-                time.sleep(1)
-                syscall_count = self._bpf["syscall_count"]
-                for k, v in syscall_count.items():
-                    self.add_data(
-                        MetricSample(
-                            name=f"syscall.id.{k.value}",
-                            value=float(v.value),
-                            labels={"source": "ebpf"},
-                        )
-                    )
-                syscall_count.clear()
+                bpf.ring_buffer_poll(100)
+                if time.monotonic() < next_tick:
+                    continue
+                next_tick += 1.0
+                add_samples(
+                    time_ns(),
+                    labels,
+                    ((f"syscall.id.{sid}", count) for sid, count in counts.items()),
+                )
+                counts.clear()
 
-        self._collector_thread = threading.Thread(target=collect, daemon=True)
-        self._collector_thread.start()
+        # ring_buffer_poll() blocks, so it gets its own daemon thread
+        self._collector = _spawn_blocking(collect, "poet-ebpf")
 
     def _run_simulator(self) -> None:
         """Generate synthetic metrics."""
+        self._stop_event = asyncio.Event()
         self._running = True
 
-        def generate() -> None:
-            import random
-
-            syscall_ids = [0, 1, 2, 3, 4, 5, 9, 10, 11, 12]  # Common syscall IDs
+        async def generate() -> None:
+            add_samples = self.add_samples
+            time_ns = time.time_ns
+            choices = random.choices
+            labels = {"source": "simulator"}  # shared by every sample
+            syscall_ids = (0, 1, 2, 3, 4, 5, 9, 10, 11, 12)  # Common syscall IDs
+            names = tuple(f"syscall.id.{sid}" for sid in syscall_ids)
+            values = range(100, 10001)
+            next_tick = time.monotonic()
             while self._running:
-                for sid in syscall_ids:
-                    self.add_data(
-                        MetricSample(
-                            name=f"syscall.id.{sid}",
-                            value=float(random.randint(100, 10000)),
-                            labels={"source": "simulator"},
-                        )
-                    )
-                time.sleep(1)
+                add_samples(
+                    time_ns(), labels, zip(names, choices(values, k=len(names)), strict=True)
+                )
+                next_tick += 1.0
+                await _sleep_until(next_tick, self._stop_event)
 
-        self._collector_thread = threading.Thread(target=generate, daemon=True)
-        self._collector_thread.start()
+        self._collector = _spawn(generate())
 
     def _stop_privileged(self) -> None:
         """Stop eBPF collection."""
         self._running = False
-        if self._collector_thread:
-            self._collector_thread.join(timeout=2)
-        self._bpf = None
+        _signal(self._stop_event)
+        finished = _join(self._collector) if self._collector else True
+        bpf, self._bpf = self._bpf, None
+        if bpf is None:
+            return
+        if not finished:
+            # The poll thread may still be inside ring_buffer_poll(), which
+            # must not run alongside ring_buffer_consume() or touch _counts
+            raise RuntimeError(
+                "eBPF collector did not stop in time; pending counts were not drained"
+            )
+        self._emit_tail(bpf)
+
+    @staticmethod
+    def _sum_pending(entries: Iterable[tuple[Any, Iterable[Any]]]) -> dict[int, int]:
+        """Sum a per-CPU ``pending`` map's (key, per-CPU values) items by syscall id."""
+        totals: dict[int, int] = {}
+        for key, per_cpu in entries:
+            total = sum(value.count for value in per_cpu)
+            if total:
+                sid = key.value
+                totals[sid] = totals.get(sid, 0) + total
+        return totals
+
+    def _emit_tail(self, bpf: Any) -> None:
+        """Emit counts not yet sampled: unread ring events and unflushed per-CPU counts."""
+        counts = self._counts
+        bpf.ring_buffer_consume()
+        for sid, count in self._sum_pending(bpf["pending"].items()).items():
+            counts[sid] = counts.get(sid, 0) + count
+        if counts:
+            self.add_samples(
+                time.time_ns(),
+                {"source": "ebpf"},
+                ((f"syscall.id.{sid}", count) for sid, count in counts.items()),
+            )
+        counts.clear()
 
     def _stop_simulator(self) -> None:
         """Stop simulator."""
         self._running = False
-        if self._collector_thread:
-            self._collector_thread.join(timeout=2)
+        _signal(self._stop_event)
+        if self._collector:
+            _join(self._collector)
+
+
+# Shared-memory ring written by the LD_PRELOAD intercept library. Layout:
+# a 64-byte header whose first field is the u64 count of records ever
+# written (the producer bumps it atomically after filling a slot), then
+# fixed-size records {u64 ts_ns; u32 fn_id; u32 len; char data[120]}.
+_LDP_HEADER_SIZE = 64
+_LDP_HEAD = struct.Struct("<Q")
+_LDP_RECORD = struct.Struct("<QII120s")
+_LDP_RING_SIZE = 16 << 20
+_LDP_POLL_INTERVAL = 0.05
+# Environment read by the intercept library in the traced process
+_LDP_LIBRARY_ENV = "POET_LDPRELOAD_LIBRARY"
+_LDP_SHM_ENV = "POET_LDPRELOAD_SHM"
+_LDP_FUNCTIONS_ENV = "POET_LDPRELOAD_FUNCTIONS"
+
+
+def _ldp_drain(
+    buf: memoryview, tail: int, capacity: int
+) -> tuple[list[tuple[int, int, int, bytes]], int, int]:
+    """
+    Copy the records published since tail out of the LD_PRELOAD ring.
+
+    Returns the unpacked (ts_ns, fn_id, len, data) records, the new tail
+    and the number of records lost since tail. The producer never waits for
+    the reader, so it may lap us while slots are being copied: head is
+    re-read afterwards, and any record whose slot has since been reused, or
+    is being filled for the next record, is discarded instead of being
+    emitted torn.
+    """
+    (head,) = _LDP_HEAD.unpack_from(buf, 0)
+    # Records older than one lap were overwritten; skip them
+    skipped = max(0, head - capacity - tail)
+    tail += skipped
+    chunks = []
+    while tail < head:
+        slot = tail % capacity
+        count = min(head - tail, capacity - slot)
+        start = _LDP_HEADER_SIZE + slot * _LDP_RECORD.size
+        chunks.append((tail, bytes(buf[start : start + count * _LDP_RECORD.size])))
+        tail += count
+
+    records: list[tuple[int, int, int, bytes]] = []
+    if not chunks:
+        return records, tail, skipped
+    (new_head,) = _LDP_HEAD.unpack_from(buf, 0)
+    # Slot of record new_head - capacity is the one being written next
+    first_valid = new_head - capacity + 1
+    for index, raw in chunks:
+        torn = min(first_valid - index, len(raw) // _LDP_RECORD.size)
+        if torn > 0:
+            raw = raw[torn * _LDP_RECORD.size :]
+            skipped += torn
+        records.extend(_LDP_RECORD.iter_unpack(raw))
+    return records, tail, skipped
 
 
 class LDPreloadLogExtractor(LogExtractor):
     """
     Extracts logs by intercepting library calls via LD_PRELOAD.
 
-    Privileged mode: Injects a shared library to intercept calls.
+    Privileged mode: Injects a shared library to intercept calls. The
+    library writes fixed-size records into a shared-memory ring that is
+    drained without syscalls on the write path; launch the traced process
+    with target_environment().
     Simulator mode: Generates synthetic log entries.
 
     This is useful for intercepting network calls, file operations, etc.
     """
 
+    _raw_dicts = True
+
     def __init__(
         self,
         extractor_id: str = "ldpreload-logs",
         mode: ExtractorMode = ExtractorMode.SIMULATOR,
         target_functions: list[str] | None = None,
+        library_path: str | None = None,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
     ) -> None:
-        super().__init__(extractor_id, mode)
+        super().__init__(extractor_id, mode, max_samples)
         self._target_functions = target_functions or ["connect", "send", "recv"]
-        self._collector_thread: threading.Thread | None = None
+        self._library_path = library_path or os.environ.get(_LDP_LIBRARY_ENV)
+        self._collector: concurrent.futures.Future[None] | None = None
         self._running = False
-        self._log_file: str | None = None
+        self._stop_event = asyncio.Event()
+        self._shm: shared_memory.SharedMemory | None = None
 
     @property
     def name(self) -> str:
         return "LD_PRELOAD Log Extractor"
 
-    def can_run_privileged(self) -> bool:
+    @classmethod
+    def can_run_privileged(cls, refresh: bool = False) -> bool:
         """Check if LD_PRELOAD interception is possible."""
         # LD_PRELOAD works on Linux and macOS (as DYLD_INSERT_LIBRARIES)
         return platform.system() in ("Linux", "Darwin")
 
+    def target_environment(self) -> dict[str, str]:
+        """Environment variables to start a traced process with."""
+        if self._shm is None or not self._library_path:
+            raise RuntimeError("LD_PRELOAD capture is not running")
+        preload_var = "DYLD_INSERT_LIBRARIES" if platform.system() == "Darwin" else "LD_PRELOAD"
+        return {
+            preload_var: self._library_path,
+            _LDP_SHM_ENV: self._shm.name,
+            _LDP_FUNCTIONS_ENV: ",".join(self._target_functions),
+        }
+
     def _run_privileged(self) -> None:
         """
         Start LD_PRELOAD-based logging.
 
-        Note: This would require:
-        1. Compiling a shared library that intercepts target functions
-        2. Setting LD_PRELOAD before starting the target process
-        3. Reading the intercepted data from a pipe/file
-
+        Requires a precompiled intercept library (library_path or
+        $POET_LDPRELOAD_LIBRARY) that records calls into the shared ring.
         For safety, we provide the framework but don't auto-compile.
         """
-        # In a real implementation, this would:
-        # 1. Check if precompiled intercept library exists
-        # 2. Set up communication channel (pipe, shared memory)
-        # 3. Start monitoring
+        if not self._library_path or not os.path.exists(self._library_path):
+            import warnings
 
-        # For now, fall back to simulator with a warning
-        import warnings
+            warnings.warn(
+                "LD_PRELOAD extractor requires precompiled intercept library. "
+                "Falling back to simulator mode."
+            )
+            self._run_simulator()
+            return
+
+        shm = shared_memory.SharedMemory(create=True, size=_LDP_RING_SIZE)
+        buf = shm.buf
+        assert buf is not None  # only None once the segment is closed
+        buf[:_LDP_HEADER_SIZE] = bytes(_LDP_HEADER_SIZE)
+        self._shm = shm
+        self._stop_event = asyncio.Event()
+        self._running = True
 
-        warnings.warn(
-            "LD_PRELOAD extractor requires precompiled intercept library. "
-            "Falling back to simulator mode."
-        )
-        self._run_simulator()
+        async def collect() -> None:
+            add_batch = self.add_batch
+            capacity = (len(buf) - _LDP_HEADER_SIZE) // _LDP_RECORD.size
+            # Per fn_id: (source, attributes), shared by every record
+            functions = [
+                (f"ldpreload.{fn}", {"function": fn}) for fn in self._target_functions
+            ]
+            unknown = ("ldpreload.unknown", {"function": "unknown"})
+            tail = 0
+            while self._running:
+                deadline = time.monotonic() + _LDP_POLL_INTERVAL
+                await _sleep_until(deadline, self._stop_event)
+                records, tail, skipped = _ldp_drain(buf, tail, capacity)
+                if skipped:
+                    # Overwritten by the producer: count them like buffer overflow
+                    with self._data_lock:
+                        self._dropped += skipped
+                batch: list[dict[str, Any]] = []
+                for ts_ns, fn_id, length, data in records:
+                    source, attributes = (
+                        functions[fn_id] if fn_id < len(functions) else unknown
+                    )
+                    batch.append(
+                        {
+                            "timestamp": ts_ns,
+                            "level": "DEBUG",
+                            "message": data[:length].decode("utf-8", "replace"),
+                            "source": source,
+                            "attributes": attributes,
+                        }
+                    )
+                if batch:
+                    add_batch(batch)
+
+        self._collector = _spawn(collect())
 
     def _run_simulator(self) -> None:
         """Generate synthetic log entries."""
+        self._stop_event = asyncio.Event()
         self._running = True
 
-        def generate() -> None:
-            import random
-
-            operations = [
-                ("connect", "Connecting to 10.0.0.1:443"),
-                ("send", "Sent 1024 bytes to socket"),
-                ("recv", "Received 2048 bytes from socket"),
-                ("open", "Opened file /etc/hosts"),
-                ("close", "Closed file descriptor 5"),
-            ]
+        async def generate() -> None:
+            # (message, source, attributes) per intercepted call, built once
+            operations = tuple(
+                (msg, f"ldpreload.{op}", {"function": op, "simulated": True})
+                for op, msg in (
+                    ("connect", "Connecting to 10.0.0.1:443"),
+                    ("send", "Sent 1024 bytes to socket"),
+                    ("recv", "Received 2048 bytes from socket"),
+                    ("open", "Opened file /etc/hosts"),
+                    ("close", "Closed file descriptor 5"),
+                )
+            )
+            add = self.add_data
+            time_ns = time.time_ns
+            choice = random.choice
+            next_tick = time.monotonic()
             while self._running:
-                op, msg = random.choice(operations)
-                self.add_data(
-                    LogEntry(
-                        level="DEBUG",
-                        message=msg,
-                        source=f"ldpreload.{op}",
-                        attributes={"function": op, "simulated": True},
-                    )
+                msg, source, attributes = choice(operations)
+                add(
+                    {
+                        "timestamp": time_ns(),
+                        "level": "DEBUG",
+                        "message": msg,
+                        "source": source,
+                        "attributes": attributes,
+                    }
                 )
-                time.sleep(0.5)
+                next_tick += 0.5
+                await _sleep_until(next_tick, self._stop_event)
 
-        self._collector_thread = threading.Thread(target=generate, daemon=True)
-        self._collector_thread.start()
+        self._collector = _spawn(generate())
 
     def _stop_privileged(self) -> None:
         """Stop LD_PRELOAD collection."""
         self._running = False
+        _signal(self._stop_event)
+        if self._collector:
+            _join(self._collector)
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
 
     def _stop_simulator(self) -> None:
         """Stop simulator."""
         self._running = False
-        if self._collector_thread:
-            self._collector_thread.join(timeout=2)
+        _signal(self._stop_event)
+        if self._collector:
+            _join(self._collector)
+
+    def _take_buffers(self) -> tuple[Iterable[Any], int]:
+        collected, dropped = super()._take_buffers()
+        # Records share their per-function attributes dict with the collector
+        return _detach_shared(collected, "attributes"), dropped
 
 
 class NetworkTraceExtractor(TraceExtractor):
     """
     Extracts network traces using system tools.
 
-    Privileged mode: Uses tcpdump/libpcap for packet capture.
+    Privileged mode: Captures with libpcap (via ctypes) when it is
+    installed, keeping packet headers binary until stop(); otherwise
+    parses tcpdump output.
     Simulator mode: Generates synthetic trace spans.
     """
 
+    _raw_dicts = True
+
     def __init__(
         self,
         extractor_id: str = "network-traces",
         mode: ExtractorMode = ExtractorMode.SIMULATOR,
         interface: str = "any",
         filter_expr: str = "tcp port 80 or tcp port 443",
+        max_samples: int = DEFAULT_MAX_SAMPLES,
     ) -> None:
-        super().__init__(extractor_id, mode)
+        super().__init__(extractor_id, mode, max_samples)
         self._interface = interface
         self._filter_expr = filter_expr
-        self._process: subprocess.Popen[str] | None = None
-        self._collector_thread: threading.Thread | None = None
+        self._process: subprocess.Popen[bytes] | None = None
+        self._collector: concurrent.futures.Future[None] | None = None
         self._running = False
+        self._stop_event = asyncio.Event()
+        self._trace_id = ""
 
     @property
     def name(self) -> str:
         return "Network Trace Extractor"
 
-    def can_run_privileged(self) -> bool:
-        """Check if tcpdump is available with permissions."""
-        if not shutil.which("tcpdump"):
+    @classmethod
+    def can_run_privileged(cls, refresh: bool = False) -> bool:
+        """Check if libpcap or tcpdump is available with permissions."""
+        if refresh:
+            _clear_capability_caches()
+        if _load_libpcap() is None and not _which("tcpdump"):
             return False
         # Would need root or CAP_NET_RAW
         return os.geteuid() == 0
 
+    def _reset_buffers(self) -> None:
+        super()._reset_buffers()
+        # libpcap rows, kept packed until stop(). A run fills either this or
+        # the dict buffer, never both, so max_samples bounds the total.
+        self._packets: deque[_PacketRow] = deque(maxlen=self._max_samples)
+
+    def add_packet(self, row: _PacketRow) -> None:
+        """Add one captured libpcap packet row."""
+        with self._data_lock:
+            if len(self._packets) == self._max_samples:
+                self._dropped += 1
+            self._packets.append(row)
+
+    def _take_buffers(self) -> tuple[Iterable[Any], int]:
+        collected, dropped = super()._take_buffers()
+        packets, self._packets = self._packets, deque(maxlen=self._max_samples)
+        return itertools.chain(collected, map(self._packet_span, packets)), dropped
+
+    def _packet_span(self, row: _PacketRow) -> dict[str, Any]:
+        """Expand a packet row into a span dict with a time_ns() start_time."""
+        span_no, ts_sec, ts_usec, caplen, length, header = row
+        return {
+            "trace_id": self._trace_id,
+            "span_id": f"{span_no:016x}",
+            "parent_span_id": None,
+            "operation_name": "network.packet",
+            "service_name": "libpcap",
+            "start_time": ts_sec * 1_000_000_000 + ts_usec * 1000,
+            "end_time": None,
+            "status": "OK",
+            "attributes": {"caplen": caplen, "len": length, "header": header.hex()},
+        }
+
     def _run_privileged(self) -> None:
         """Start network capture."""
+        self._trace_id = uuid.uuid4().hex
+        lib = _load_libpcap()
+        if lib is not None:
+            self._run_pcap(lib)
+            return
+
+        self._stop_event = asyncio.Event()
         self._running = True
         self._process = subprocess.Popen(
             [
@@ -423,82 +971,141 @@ class NetworkTraceExtractor(TraceExtractor):
             ],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
         )
+        process = self._process
 
-        def collect() -> None:
-            import uuid
-
-            trace_id = uuid.uuid4().hex
+        async def collect() -> None:
+            trace_id = self._trace_id
             span_counter = 0
+            add_batch = self.add_batch
+            time_ns = time.time_ns
+
+            async for lines in _aiter_line_batches(
+                process.stdout, lambda: self._running  # type: ignore[arg-type]
+            ):
+                now = time_ns()
+                first = span_counter + 1
+                raw_lines = [line.strip() for line in lines]
+                span_counter += len(raw_lines)
+                add_batch(
+                    [
+                        {
+                            "trace_id": trace_id,
+                            "span_id": f"{n:016x}",
+                            "parent_span_id": None,
+                            "operation_name": "network.packet",
+                            "service_name": "tcpdump",
+                            "start_time": now,
+                            "end_time": None,
+                            "status": "OK",
+                            "attributes": {"raw": raw},
+                        }
+                        for n, raw in enumerate(raw_lines, first)
+                    ]
+                )
+
+        self._collector = _spawn(collect())
 
-            while self._running and self._process:
-                line = self._process.stdout.readline() if self._process.stdout else ""
-                if line:
+    def _run_pcap(self, lib: ctypes.CDLL) -> None:
+        """Capture with libpcap, storing packet rows through add_packet()."""
+        pcap = _open_pcap(lib, self._interface, self._filter_expr)
+        self._stop_event = asyncio.Event()
+        self._running = True
+
+        def collect() -> None:
+            add_packet = self.add_packet
+            next_ex = lib.pcap_next_ex
+            string_at = ctypes.string_at
+            header = ctypes.POINTER(_PcapPkthdr)()
+            data = ctypes.c_void_p()
+            span_counter = 0
+            try:
+                while self._running:
+                    status = next_ex(pcap, ctypes.byref(header), ctypes.byref(data))
+                    if status == 0:  # read timeout, re-check _running
+                        continue
+                    if status < 0:
+                        break
+                    hdr = header.contents
                     span_counter += 1
-                    self.add_data(
-                        TraceSpan(
-                            trace_id=trace_id,
-                            span_id=f"{span_counter:016x}",
-                            operation_name="network.packet",
-                            service_name="tcpdump",
-                            start_time=datetime.utcnow(),
-                            attributes={"raw": line.strip()},
+                    add_packet(
+                        (
+                            span_counter,
+                            hdr.ts.tv_sec,
+                            hdr.ts.tv_usec,
+                            hdr.caplen,
+                            hdr.len,
+                            string_at(data, hdr.caplen),
                         )
                     )
+            finally:
+                lib.pcap_close(pcap)
 
-        self._collector_thread = threading.Thread(target=collect, daemon=True)
-        self._collector_thread.start()
+        # pcap_next_ex() blocks, so it gets its own daemon thread
+        self._collector = _spawn_blocking(collect, "poet-pcap")
 
     def _run_simulator(self) -> None:
         """Generate synthetic trace spans."""
+        self._stop_event = asyncio.Event()
         self._running = True
 
-        def generate() -> None:
-            import random
-            import uuid
-
+        async def generate() -> None:
             trace_id = uuid.uuid4().hex
             span_counter = 0
-
-            services = ["web", "api", "db", "cache"]
-            operations = ["request", "response", "query", "get", "set"]
+            parent_span_id: str | None = None
+
+            services = ("web", "api", "db", "cache")
+            operations = ("request", "response", "query", "get", "set")
+            # Operation names per service, formatted once
+            operation_names = {
+                svc: tuple(f"{svc}.{op}" for op in operations) for svc in services
+            }
+            add = self.add_data
+            time_ns = time.time_ns
+            randint = random.randint
+            choice = random.choice
+            next_tick = time.monotonic()
 
             while self._running:
                 span_counter += 1
-                svc = random.choice(services)
-                op = random.choice(operations)
-                start = datetime.utcnow()
-
-                self.add_data(
-                    TraceSpan(
-                        trace_id=trace_id,
-                        span_id=f"{span_counter:016x}",
-                        parent_span_id=f"{max(1, span_counter-1):016x}"
-                        if span_counter > 1
-                        else None,
-                        operation_name=f"{svc}.{op}",
-                        service_name=svc,
-                        start_time=start,
-                        end_time=start,
-                        attributes={"simulated": True, "latency_ms": random.randint(1, 100)},
-                    )
+                span_id = f"{span_counter:016x}"
+                svc = choice(services)
+                start = time_ns()
+
+                add(
+                    {
+                        "trace_id": trace_id,
+                        "span_id": span_id,
+                        # Each span is the child of the one before it
+                        "parent_span_id": parent_span_id,
+                        "operation_name": choice(operation_names[svc]),
+                        "service_name": svc,
+                        "start_time": start,
+                        "end_time": start,
+                        "status": "OK",
+                        "attributes": {"simulated": True, "latency_ms": randint(1, 100)},
+                    }
                 )
-                time.sleep(0.2)
+                parent_span_id = span_id
+                next_tick += 0.2
+                await _sleep_until(next_tick, self._stop_event)
 
-        self._collector_thread = threading.Thread(target=generate, daemon=True)
-        self._collector_thread.start()
+        self._collector = _spawn(generate())
 
     def _stop_privileged(self) -> None:
         """Stop network capture."""
         self._running = False
+        _signal(self._stop_event)
         if self._process:
             self._process.terminate()
             self._process.wait(timeout=5)
             self._process = None
+        if self._collector:
+            _join(self._collector)
 
     def _stop_simulator(self) -> None:
         """Stop simulator."""
         self._running = False
-        if self._collector_thread:
-            self._collector_thread.join(timeout=2)
+        _signal(self._stop_event)
+        if self._collector:
+            _join(self._collector)
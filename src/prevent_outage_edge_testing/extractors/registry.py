@@ -10,11 +10,23 @@ Use this to:
 - Create extractor instances with appropriate configuration
 """
 
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
 from typing import Type
 
-from prevent_outage_edge_testing.extractors.base import BaseExtractor, ExtractorResult
+from prevent_outage_edge_testing.extractors.base import (
+    BaseExtractor,
+    ExtractorResult,
+    ExtractorStatus,
+)
 from prevent_outage_edge_testing.models import ExtractorMode
 
+# Upper bound on extractors stopped concurrently by stop_all()
+_MAX_STOP_WORKERS = 32
+# Default stop_all() deadline: above the slowest privileged stop(), which
+# waits up to 5s for its tool process and 2s more for its collector
+_STOP_TIMEOUT = 10.0
+
 
 class ExtractorRegistry:
     """
@@ -67,24 +79,54 @@ class ExtractorRegistry:
         """Get extractor types that can run in privileged mode on this system."""
         capable = []
         for name, cls in self._extractor_types.items():
-            # Create a temporary instance to check capability
             try:
-                temp = cls(extractor_id="capability-check", mode=ExtractorMode.SIMULATOR)
-                if temp.can_run_privileged():
+                if cls.can_run_privileged():
                     capable.append(name)
             except Exception:
                 pass
         return capable
 
-    def stop_all(self) -> list[ExtractorResult]:
-        """Stop all running extractors and return results."""
+    def stop_all(self, timeout: float = _STOP_TIMEOUT) -> list[ExtractorResult]:
+        """
+        Stop all running extractors and return one result per extractor.
+
+        Extractors are stopped concurrently. One whose stop() raised, or is
+        still running after ``timeout`` seconds, gets an ERROR result
+        saying so; a stop() that overran keeps finishing in the background.
+        """
+        if not self._instances:
+            return []
+        extractors = list(self._instances.values())
+        pool = ThreadPoolExecutor(
+            max_workers=min(_MAX_STOP_WORKERS, len(extractors))
+        )
+        try:
+            futures = [pool.submit(ext.stop) for ext in extractors]
+            wait(futures, timeout=timeout)
+        finally:
+            pool.shutdown(wait=False)
+
         results = []
-        for ext in self._instances.values():
-            try:
-                result = ext.stop()
-                results.append(result)
-            except Exception:
-                pass
+        for ext, future in zip(extractors, futures, strict=True):
+            if future.done() and future.exception() is None:
+                results.append(future.result())
+                continue
+            if future.done():
+                error = f"stop() failed: {future.exception()}"
+            else:
+                error = f"stop() did not finish within {timeout}s"
+            now = datetime.utcnow()
+            results.append(
+                ExtractorResult(
+                    extractor_id=ext.extractor_id,
+                    mode=ext.mode,
+                    status=ExtractorStatus.ERROR,
+                    started_at=ext._started_at or now,
+                    ended_at=now,
+                    error=error,
+                    metadata={"name": ext.name, "description": ext.description},
+                )
+            )
         return results
 
     def remove(self, extractor_id: str) -> None:
@@ -24,6 +24,8 @@ from prevent_outage_edge_testing.gates.definitions import (
     FailureModeGate,
     ObservabilityGate,
     ALL_GATES,
+    run_all_gates,
+    run_gate,
 )
 from prevent_outage_edge_testing.gates.runner import GateRunner
 from prevent_outage_edge_testing.gates.reporter import ReportGenerator
@@ -40,6 +42,8 @@ __all__ = [
     "FailureModeGate",
     "ObservabilityGate",
     "ALL_GATES",
+    "run_all_gates",
+    "run_gate",
     "GateRunner",
     "ReportGenerator",
 ]
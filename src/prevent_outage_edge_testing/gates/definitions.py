@@ -10,12 +10,17 @@ Each gate contains multiple checks that validate specific aspects:
 5. Observability Gate - Required signals present
 """
 
+import os
 import subprocess
+import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
+from prevent_outage_edge_testing.core import jsonio
 from prevent_outage_edge_testing.gates.models import (
     Gate,
     GateResult,
@@ -24,43 +29,106 @@ from prevent_outage_edge_testing.gates.models import (
 )
 
 
-def _run_pytest_check(
-    test_pattern: str,
+# (passed, message, details, duration_ms) for one check of a batched run.
+CheckOutcome = tuple[bool, str, dict[str, Any], float]
+
+
+def _run_pytest_checks_batched(
+    checks: list[dict[str, Any]],
     test_dir: Path,
     timeout: int = 60,
-) -> tuple[bool, str, dict[str, Any]]:
-    """Run pytest with a specific pattern and return results."""
-    cmd = [
-        "python", "-m", "pytest",
-        str(test_dir),
-        "-k", test_pattern,
-        "-v", "--tb=short",
-        "-q", "--no-header",
-    ]
-    
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=test_dir.parent if test_dir.exists() else Path.cwd(),
+) -> list[CheckOutcome]:
+    """
+    Run every check of a gate in a single pytest process.
+
+    The gate's pytest plugin evaluates each check's pattern with ``-k``
+    semantics at collection time and reports which checks every test
+    belongs to, so a gate pays interpreter startup and test collection once
+    instead of once per check. Returns one CheckOutcome per check, in order.
+    A check passes when at least one test matched it and none failed;
+    ``duration_ms`` is the summed time of its matching tests.
+    """
+    batch_timeout = timeout * len(checks)
+
+    def all_failed(message: str, details: dict[str, Any]) -> list[CheckOutcome]:
+        # Fresh details per check: gates annotate them in place.
+        return [(False, message, dict(details), 0.0) for _ in checks]
+
+    with tempfile.TemporaryDirectory(prefix="poet-gate-") as tmp:
+        checks_file = Path(tmp) / "checks.json"
+        checks_file.write_bytes(
+            jsonio.dumps({check["id"]: check["test_pattern"] for check in checks})
         )
-        passed = result.returncode == 0
+        report_path = Path(tmp) / "report.json"
+        # The interpreter running POET is the one that can import its plugin
+        cmd = [
+            sys.executable, "-m", "pytest",
+            str(test_dir),
+            "-p", "prevent_outage_edge_testing.gates.pytest_plugin",
+            f"--poet-checks={checks_file}",
+            f"--poet-checks-report={report_path}",
+            "--tb=short",
+            "-q", "--no-header",
+        ]
+
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=batch_timeout,
+                cwd=test_dir.parent if test_dir.exists() else Path.cwd(),
+            )
+        except subprocess.TimeoutExpired:
+            return all_failed("Test timed out", {"timeout": batch_timeout})
+        except FileNotFoundError:
+            return all_failed("pytest not found", {})
+        except Exception as e:
+            return all_failed(str(e), {"error_type": type(e).__name__})
+
         output = result.stdout + result.stderr
-        
-        # Parse test counts from output
-        details = {"output": output[-500:] if len(output) > 500 else output}
-        if "passed" in output:
-            details["tests_found"] = True
-        
-        return passed, output, details
-    except subprocess.TimeoutExpired:
-        return False, "Test timed out", {"timeout": timeout}
-    except FileNotFoundError:
-        return False, "pytest not found", {}
-    except Exception as e:
-        return False, str(e), {"error_type": type(e).__name__}
+        # 0: all passed, 1: some failed, 5: nothing collected. Anything else is
+        # an interrupted or broken run that no single check can be credited for.
+        if result.returncode not in (0, 1, 5) or not report_path.exists():
+            return all_failed(output, {"output": output[-500:]})
+        report = jsonio.loads(report_path.read_bytes())
+
+    results: list[CheckOutcome] = []
+    for check in checks:
+        error = report["invalid"].get(check["id"])
+        if error is not None:
+            results.append((False, error, {"tests_found": False}, 0.0))
+            continue
+
+        counts = {"passed": 0, "failed": 0, "skipped": 0}
+        failed_tests = []
+        duration = 0.0
+        for node_id, test in report["tests"].items():
+            if check["id"] not in test["checks"]:
+                continue
+            counts[test["outcome"]] += 1
+            duration += test["duration"]
+            if test["outcome"] == "failed":
+                failed_tests.append(node_id)
+
+        total = sum(counts.values())
+        if total:
+            message = ", ".join(f"{n} {k}" for k, n in counts.items() if n)
+        else:
+            message = "no tests matched"
+        details: dict[str, Any] = {"tests_found": total > 0, **counts}
+        if failed_tests:
+            details["failed_tests"] = failed_tests
+        passed = total > 0 and not failed_tests
+        results.append((passed, message, details, duration * 1000))
+    return results
+
+
+def _check_outcomes(gate: Gate, test_dir: Path) -> list[Optional[CheckOutcome]]:
+    """Run a gate's checks; each outcome is None when there are no generated tests."""
+    if not test_dir.exists():
+        return [None] * len(gate.checks)
+    return list(_run_pytest_checks_batched(gate.checks, test_dir))
 
 
 @dataclass
@@ -111,10 +179,8 @@ class ContractGate(Gate):
         results = []
         test_dir = context.get("test_dir", Path(".poet/generated_tests"))
         
-        for check in self.checks:
-            check_start = time.perf_counter()
-            
-            if not test_dir.exists():
+        for check, outcome in zip(self.checks, _check_outcomes(self, test_dir), strict=True):
+            if outcome is None:
                 results.append(CheckResult(
                     name=check["name"],
                     status=GateStatus.SKIPPED,
@@ -123,17 +189,14 @@ class ContractGate(Gate):
                 ))
                 continue
             
-            passed, message, details = _run_pytest_check(
-                check["test_pattern"],
-                test_dir,
-            )
+            passed, message, details, check_ms = outcome
             
             results.append(CheckResult(
                 name=check["name"],
                 status=GateStatus.PASSED if passed else GateStatus.FAILED,
                 message=message[:200] if len(message) > 200 else message,
                 details=details,
-                duration_ms=(time.perf_counter() - check_start) * 1000,
+                duration_ms=check_ms,
             ))
         
         failed = any(r.status == GateStatus.FAILED for r in results)
@@ -202,10 +265,8 @@ class CacheCorrectnessGate(Gate):
         results = []
         test_dir = context.get("test_dir", Path(".poet/generated_tests"))
         
-        for check in self.checks:
-            check_start = time.perf_counter()
-            
-            if not test_dir.exists():
+        for check, outcome in zip(self.checks, _check_outcomes(self, test_dir), strict=True):
+            if outcome is None:
                 results.append(CheckResult(
                     name=check["name"],
                     status=GateStatus.SKIPPED,
@@ -214,17 +275,14 @@ class CacheCorrectnessGate(Gate):
                 ))
                 continue
             
-            passed, message, details = _run_pytest_check(
-                check["test_pattern"],
-                test_dir,
-            )
+            passed, message, details, check_ms = outcome
             
             results.append(CheckResult(
                 name=check["name"],
                 status=GateStatus.PASSED if passed else GateStatus.FAILED,
                 message=message[:200] if len(message) > 200 else message,
                 details=details,
-                duration_ms=(time.perf_counter() - check_start) * 1000,
+                duration_ms=check_ms,
             ))
         
         failed = any(r.status == GateStatus.FAILED for r in results)
@@ -297,10 +355,8 @@ class PerfBudgetGate(Gate):
             # TODO: Implement actual baseline comparison
             pass
         
-        for check in self.checks:
-            check_start = time.perf_counter()
-            
-            if not test_dir.exists():
+        for check, outcome in zip(self.checks, _check_outcomes(self, test_dir), strict=True):
+            if outcome is None:
                 results.append(CheckResult(
                     name=check["name"],
                     status=GateStatus.SKIPPED,
@@ -309,10 +365,7 @@ class PerfBudgetGate(Gate):
                 ))
                 continue
             
-            passed, message, details = _run_pytest_check(
-                check["test_pattern"],
-                test_dir,
-            )
+            passed, message, details, check_ms = outcome
             
             # Add threshold info to details
             if "p95" in check["id"]:
@@ -327,7 +380,7 @@ class PerfBudgetGate(Gate):
                 status=GateStatus.PASSED if passed else GateStatus.FAILED,
                 message=message[:200] if len(message) > 200 else message,
                 details=details,
-                duration_ms=(time.perf_counter() - check_start) * 1000,
+                duration_ms=check_ms,
             ))
         
         failed = any(r.status == GateStatus.FAILED for r in results)
@@ -396,10 +449,8 @@ class FailureModeGate(Gate):
         results = []
         test_dir = context.get("test_dir", Path(".poet/generated_tests"))
         
-        for check in self.checks:
-            check_start = time.perf_counter()
-            
-            if not test_dir.exists():
+        for check, outcome in zip(self.checks, _check_outcomes(self, test_dir), strict=True):
+            if outcome is None:
                 results.append(CheckResult(
                     name=check["name"],
                     status=GateStatus.SKIPPED,
@@ -408,17 +459,14 @@ class FailureModeGate(Gate):
                 ))
                 continue
             
-            passed, message, details = _run_pytest_check(
-                check["test_pattern"],
-                test_dir,
-            )
+            passed, message, details, check_ms = outcome
             
             results.append(CheckResult(
                 name=check["name"],
                 status=GateStatus.PASSED if passed else GateStatus.FAILED,
                 message=message[:200] if len(message) > 200 else message,
                 details=details,
-                duration_ms=(time.perf_counter() - check_start) * 1000,
+                duration_ms=check_ms,
             ))
         
         failed = any(r.status == GateStatus.FAILED for r in results)
@@ -487,10 +535,8 @@ class ObservabilityGate(Gate):
         results = []
         test_dir = context.get("test_dir", Path(".poet/generated_tests"))
         
-        for check in self.checks:
-            check_start = time.perf_counter()
-            
-            if not test_dir.exists():
+        for check, outcome in zip(self.checks, _check_outcomes(self, test_dir), strict=True):
+            if outcome is None:
                 results.append(CheckResult(
                     name=check["name"],
                     status=GateStatus.SKIPPED,
@@ -499,17 +545,14 @@ class ObservabilityGate(Gate):
                 ))
                 continue
             
-            passed, message, details = _run_pytest_check(
-                check["test_pattern"],
-                test_dir,
-            )
+            passed, message, details, check_ms = outcome
             
             results.append(CheckResult(
                 name=check["name"],
                 status=GateStatus.PASSED if passed else GateStatus.FAILED,
                 message=message[:200] if len(message) > 200 else message,
                 details=details,
-                duration_ms=(time.perf_counter() - check_start) * 1000,
+                duration_ms=check_ms,
             ))
         
         failed = any(r.status == GateStatus.FAILED for r in results)
@@ -532,3 +575,36 @@ ALL_GATES = [
     FailureModeGate(),
     ObservabilityGate(),
 ]
+
+
+def run_gate(gate: Gate, context: dict[str, Any]) -> GateResult:
+    """Run one gate, turning an unexpected exception into an ERROR result."""
+    try:
+        return gate.run(context)
+    except Exception as e:
+        return GateResult(
+            gate_id=gate.id,
+            gate_name=gate.name,
+            status=GateStatus.ERROR,
+            error=str(e),
+        )
+
+
+def run_all_gates(
+    context: dict[str, Any],
+    gates: Optional[list[Gate]] = None,
+) -> list[GateResult]:
+    """
+    Run gates concurrently and return their results in gate order.
+
+    Gates share no state and spend their time waiting on their own pytest
+    subprocess, so a thread per gate is enough to overlap them; wall-clock
+    drops to the slowest gate instead of the sum. Two cores are left free
+    for the caller. A gate that raises yields an ERROR result.
+    """
+    gates = ALL_GATES if gates is None else gates
+    if not gates:
+        return []
+    workers = min(len(gates), max(1, (os.cpu_count() or 1) - 2))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="poet-gate") as pool:
+        return list(pool.map(lambda gate: run_gate(gate, context), gates))
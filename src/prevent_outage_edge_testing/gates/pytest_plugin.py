@@ -0,0 +1,195 @@
+# src/prevent_outage_edge_testing/gates/pytest_plugin.py
+"""
+pytest plugin that runs all checks of a release gate in one session.
+
+Loaded by the gates with ``-p prevent_outage_edge_testing.gates.pytest_plugin``.
+Each check's ``-k``-style expression is evaluated against every collected item
+with the same rules as ``pytest -k``: a bare word matches, case-insensitively,
+as a substring of the item's test, class and module names, its markers and
+its extra keywords, combined with ``and``, ``or``, ``not`` and parentheses.
+Items matching no check are deselected, and the matching check ids, outcome
+and duration of every selected test are written to a JSON report.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from prevent_outage_edge_testing.core import jsonio
+
+# Same identifier charset as pytest's -k grammar
+_TOKEN_RE = re.compile(r"\s*(?:(\()|(\))|([\w:+\-.\[\]\\/]+))")
+_OPERATORS = ("and", "or", "not")
+
+Matcher = Callable[[str], bool]
+
+
+class KeywordExpression:
+    """
+    A compiled ``-k`` expression.
+
+    Grammar, as in pytest::
+
+        expr     := and_expr ("or" and_expr)*
+        and_expr := not_expr ("and" not_expr)*
+        not_expr := "not" not_expr | "(" expr ")" | ident
+    """
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+        self._tokens = self._tokenize(pattern)
+        self._pos = 0
+        if not self._tokens:
+            self._evaluate: Callable[[Matcher], bool] = lambda matches: True
+            return
+        self._evaluate = self._expr()
+        if self._pos != len(self._tokens):
+            raise ValueError(f"unexpected {self._tokens[self._pos]!r}")
+
+    def evaluate(self, matches: Matcher) -> bool:
+        """Evaluate against a predicate telling whether an identifier matches."""
+        return self._evaluate(matches)
+
+    @staticmethod
+    def _tokenize(pattern: str) -> list[str]:
+        tokens = []
+        pos = 0
+        while pos < len(pattern):
+            if pattern[pos:].isspace():
+                break
+            m = _TOKEN_RE.match(pattern, pos)
+            if m is None:
+                raise ValueError(f"unexpected character at column {pos + 1}")
+            tokens.append(m.group(m.lastindex or 0))
+            pos = m.end()
+        return tokens
+
+    def _peek(self) -> str | None:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+
+    def _take(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise ValueError("unexpected end of expression")
+        self._pos += 1
+        return token
+
+    def _expr(self) -> Callable[[Matcher], bool]:
+        terms = [self._and_expr()]
+        while self._peek() == "or":
+            self._pos += 1
+            terms.append(self._and_expr())
+        return terms[0] if len(terms) == 1 else lambda m: any(t(m) for t in terms)
+
+    def _and_expr(self) -> Callable[[Matcher], bool]:
+        terms = [self._not_expr()]
+        while self._peek() == "and":
+            self._pos += 1
+            terms.append(self._not_expr())
+        return terms[0] if len(terms) == 1 else lambda m: all(t(m) for t in terms)
+
+    def _not_expr(self) -> Callable[[Matcher], bool]:
+        token = self._take()
+        if token == "not":
+            inner = self._not_expr()
+            return lambda m: not inner(m)
+        if token == "(":
+            inner = self._expr()
+            if self._take() != ")":
+                raise ValueError("expected ')'")
+            return inner
+        if token == ")" or token in _OPERATORS:
+            raise ValueError(f"unexpected {token!r}")
+        return lambda m: m(token)
+
+
+def item_matcher(item: pytest.Item) -> Matcher:
+    """Case-insensitive substring matcher over the names ``pytest -k`` sees."""
+    names = {node.name for node in item.listchain() if not isinstance(node, pytest.Session)}
+    names.update(item.listextrakeywords())
+    names.update(mark.name for mark in item.iter_markers())
+    function = getattr(item, "function", None)
+    if function is not None:
+        names.update(function.__dict__)
+    lowered = [name.lower() for name in names]
+    return lambda word: any(word.lower() in name for name in lowered)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("poet", "POET release gates")
+    group.addoption(
+        "--poet-checks",
+        metavar="PATH",
+        help="JSON file mapping check id to keyword expression",
+    )
+    group.addoption(
+        "--poet-checks-report",
+        metavar="PATH",
+        help="Where to write the per-test check report",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    checks_file = config.getoption("poet_checks")
+    if checks_file:
+        config.pluginmanager.register(
+            CheckSelector(Path(checks_file), Path(config.getoption("poet_checks_report"))),
+            "poet-check-selector",
+        )
+
+
+class CheckSelector:
+    """Selects tests per check and records their outcomes."""
+
+    def __init__(self, checks_file: Path, report_path: Path) -> None:
+        self.report_path = report_path
+        self.expressions: dict[str, KeywordExpression] = {}
+        # Check id -> parse error, for expressions pytest would reject
+        self.invalid: dict[str, str] = {}
+        self.tests: dict[str, dict[str, Any]] = {}
+        for check_id, pattern in jsonio.loads(checks_file.read_bytes()).items():
+            try:
+                self.expressions[check_id] = KeywordExpression(pattern)
+            except ValueError as e:
+                self.invalid[check_id] = f"Wrong expression {pattern!r}: {e}"
+
+    def pytest_collection_modifyitems(
+        self, config: pytest.Config, items: list[pytest.Item]
+    ) -> None:
+        selected, deselected = [], []
+        for item in items:
+            matcher = item_matcher(item)
+            check_ids = [
+                check_id
+                for check_id, expression in self.expressions.items()
+                if expression.evaluate(matcher)
+            ]
+            if check_ids:
+                self.tests[item.nodeid] = {
+                    "checks": check_ids,
+                    "outcome": "passed",
+                    "duration": 0.0,
+                }
+                selected.append(item)
+            else:
+                deselected.append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        test = self.tests.get(report.nodeid)
+        if test is None:
+            return
+        test["duration"] += report.duration
+        if report.failed:
+            test["outcome"] = "failed"
+        elif report.skipped and test["outcome"] == "passed":
+            test["outcome"] = "skipped"
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        self.report_path.write_bytes(
+            jsonio.dumps({"tests": self.tests, "invalid": self.invalid})
+        )
@@ -7,11 +7,11 @@ Produces:
 - HTML report at .poet/reports/latest.html
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from prevent_outage_edge_testing.core import jsonio
 from prevent_outage_edge_testing.gates.models import GateReport, GateStatus
 
 
@@ -38,13 +38,12 @@ class ReportGenerator:
         filename = f"{ts}.json"
         filepath = self.output_dir / filename
         
-        with open(filepath, "w") as f:
-            json.dump(report.to_dict(), f, indent=2)
+        payload = jsonio.dumps(report.to_dict(), indent=True)
+        filepath.write_bytes(payload)
         
         # Also save as latest.json
         latest = self.output_dir / "latest.json"
-        with open(latest, "w") as f:
-            json.dump(report.to_dict(), f, indent=2)
+        latest.write_bytes(payload)
         
         return filepath
     
@@ -14,7 +14,11 @@ from prevent_outage_edge_testing.gates.models import (
     GateStatus,
     GateReport,
 )
-from prevent_outage_edge_testing.gates.definitions import ALL_GATES
+from prevent_outage_edge_testing.gates.definitions import (
+    ALL_GATES,
+    run_all_gates,
+    run_gate,
+)
 
 
 class GateRunner:
@@ -32,15 +36,7 @@ class GateRunner:
     
     def run_gate(self, gate: Gate, context: dict[str, Any]) -> GateResult:
         """Run a single gate."""
-        try:
-            return gate.run(context)
-        except Exception as e:
-            return GateResult(
-                gate_id=gate.id,
-                gate_name=gate.name,
-                status=GateStatus.ERROR,
-                error=str(e),
-            )
+        return run_gate(gate, context)
     
     def run_all(
         self,
@@ -72,14 +68,18 @@ class GateRunner:
             "timestamp": timestamp,
         }
         
-        # Run each gate
+        # Gates are independent, so run them together unless fail_fast needs
+        # to stop after the first failure in order.
         results: list[GateResult] = []
-        for gate in gates_to_run:
-            result = self.run_gate(gate, context)
-            results.append(result)
-            
-            if fail_fast and result.status == GateStatus.FAILED:
-                break
+        if not fail_fast:
+            results = run_all_gates(context, gates_to_run)
+        else:
+            for gate in gates_to_run:
+                result = self.run_gate(gate, context)
+                results.append(result)
+                
+                if result.status == GateStatus.FAILED:
+                    break
         
         # Determine overall status
         if any(r.status == GateStatus.ERROR for r in results):
@@ -31,6 +31,7 @@ Usage:
 
 from prevent_outage_edge_testing.learner.analyzer import (
     TestAnalyzer,
+    analyze_many,
     analyze_test_file,
     discover_test_files,
     ParsedTestFile,
@@ -64,6 +65,7 @@ from prevent_outage_edge_testing.learner.pack_advisor import (
 __all__ = [
     # Analyzer
     "TestAnalyzer",
+    "analyze_many",
     "analyze_test_file",
     "discover_test_files",
     "ParsedTestFile",
@@ -6,10 +6,18 @@ Parses pytest test files and extracts structural information without executing c
 """
 
 import ast
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+# Matches the scope kwarg in a fixture decorator, e.g. @pytest.fixture(scope="module")
+_FIXTURE_SCOPE_RE = re.compile(r'scope\s*=\s*["\'](\w+)["\']')
+
+# Below this many files, worker start-up costs more than parallel parsing saves
+_PARALLEL_PARSE_MIN_FILES = 32
 
 
 @dataclass
@@ -185,7 +193,7 @@ class TestAnalyzer(ast.NodeVisitor):
         for dec in decorators:
             if "fixture" in dec.lower():
                 # Try to extract scope
-                scope_match = re.search(r'scope\s*=\s*["\'](\w+)["\']', dec)
+                scope_match = _FIXTURE_SCOPE_RE.search(dec)
                 scope = scope_match.group(1) if scope_match else "function"
                 return True, scope
         return False, "function"
@@ -401,6 +409,41 @@ def analyze_test_file(file_path: Path) -> Optional[ParsedTestFile]:
         return None
 
 
+def analyze_many(
+    file_paths: list[Path],
+    on_done: Optional[Callable[[], None]] = None,
+) -> list[Optional[ParsedTestFile]]:
+    """
+    Analyze a batch of test files, returning results in input order.
+    
+    Large batches are parsed in a process pool (AST parsing is CPU-bound).
+    
+    Args:
+        file_paths: Paths to the test files
+        on_done: Called once per finished file, e.g. to advance a progress bar
+        
+    Returns:
+        One ParsedTestFile (or None) per input path
+    """
+    results: list[Optional[ParsedTestFile]]
+    if len(file_paths) < _PARALLEL_PARSE_MIN_FILES or (os.cpu_count() or 1) < 2:
+        results = []
+        for file_path in file_paths:
+            results.append(analyze_test_file(file_path))
+            if on_done is not None:
+                on_done()
+        return results
+    
+    results = [None] * len(file_paths)
+    with ProcessPoolExecutor() as pool:
+        futures = {pool.submit(analyze_test_file, f): i for i, f in enumerate(file_paths)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            if on_done is not None:
+                on_done()
+    return results
+
+
 def discover_test_files(root_path: Path) -> list[Path]:
     """
     Discover all pytest test files in a directory.
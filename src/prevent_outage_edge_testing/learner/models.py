@@ -7,7 +7,8 @@ These models define the schema for .poet/learned_patterns.json
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from functools import cached_property
+from typing import Any, ClassVar, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -118,6 +119,9 @@ class RiskRule(BaseModel):
     derived_from: list[str] = Field(default_factory=list, description="What patterns led to this rule")
 
 
+_PatternsT = TypeVar("_PatternsT", bound="LearnedPatterns")
+
+
 class LearnedPatterns(BaseModel):
     """Root model for knowledge/learned/{knowledge_id}.json."""
     
@@ -139,6 +143,70 @@ class LearnedPatterns(BaseModel):
     endpoints: list[EndpointPattern] = Field(default_factory=list)
     risk_rules: list[RiskRule] = Field(default_factory=list)
     
+    # Sorted views for display, computed on first access. Assigning any field
+    # (as merge_patterns does) or copying the model drops them; after editing
+    # a list or its items in place, call invalidate_views().
+    _VIEW_ATTRS: ClassVar[tuple[str, ...]] = (
+        "fixtures_by_confidence",
+        "risk_rules_by_confidence",
+        "signals_by_occurrences",
+        "assertion_templates_by_occurrences",
+        "fault_injection_patterns_by_occurrences",
+        "endpoints_by_occurrences",
+    )
+    
+    @cached_property
+    def fixtures_by_confidence(self) -> list[ExtractedFixture]:
+        """Fixtures, most confident first."""
+        return sorted(self.fixtures, key=lambda f: f.confidence, reverse=True)
+    
+    @cached_property
+    def risk_rules_by_confidence(self) -> list[RiskRule]:
+        """Risk rules, most confident first."""
+        return sorted(self.risk_rules, key=lambda r: r.confidence, reverse=True)
+    
+    @cached_property
+    def signals_by_occurrences(self) -> list[Signal]:
+        """Signals, most frequent first."""
+        return sorted(self.signals, key=lambda s: s.occurrences, reverse=True)
+    
+    @cached_property
+    def assertion_templates_by_occurrences(self) -> list[AssertionTemplate]:
+        """Assertion templates, most frequent first."""
+        return sorted(self.assertion_templates, key=lambda t: t.occurrences, reverse=True)
+    
+    @cached_property
+    def fault_injection_patterns_by_occurrences(self) -> list[FaultInjectionPattern]:
+        """Fault injection patterns, most frequent first."""
+        return sorted(self.fault_injection_patterns, key=lambda f: f.occurrences, reverse=True)
+    
+    @cached_property
+    def endpoints_by_occurrences(self) -> list[EndpointPattern]:
+        """Endpoints, most frequent first."""
+        return sorted(self.endpoints, key=lambda e: e.occurrences, reverse=True)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self.invalidate_views()
+    
+    def __copy__(self: _PatternsT) -> _PatternsT:
+        copied = super().__copy__()
+        copied.invalidate_views()
+        return copied
+    
+    def __deepcopy__(
+        self: _PatternsT, memo: Optional[dict[int, Any]] = None
+    ) -> _PatternsT:
+        copied = super().__deepcopy__(memo)
+        copied.invalidate_views()
+        return copied
+    
+    def invalidate_views(self) -> None:
+        """Drop the sorted views so they are rebuilt from the current lists."""
+        for name in self._VIEW_ATTRS:
+            self.__dict__.pop(name, None)
+    
     def get_high_confidence_fixtures(self, min_confidence: float = 0.7) -> list[ExtractedFixture]:
         """Get fixtures with confidence above threshold."""
         return [f for f in self.fixtures if f.confidence >= min_confidence]
@@ -6,7 +6,6 @@ Handles saving and loading of knowledge/learned/${KNOWLEDGE_ID}.json
 """
 
 import hashlib
-import json
 import re
 from datetime import datetime
 from pathlib import Path
@@ -155,11 +154,8 @@ def save_patterns(
     # Update timestamp
     patterns.updated_at = datetime.utcnow()
     
-    # Serialize to JSON
-    data = patterns.model_dump(mode="json")
-    
-    with open(patterns_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
+    # Serialize to JSON (pydantic-core encodes directly, no intermediate dict)
+    patterns_path.write_text(patterns.model_dump_json(indent=2), encoding="utf-8")
     
     return patterns_path
 
@@ -221,18 +217,27 @@ def load_patterns(
         return None
     
     try:
-        with open(patterns_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return LearnedPatterns.model_validate(data)
-    except (json.JSONDecodeError, Exception):
+        return LearnedPatterns.model_validate_json(patterns_path.read_bytes())
+    except Exception:
         return None
 
 
+def _extend_unique(target: list[str], items: list[str]) -> None:
+    """Append items not already in target, in place, keeping first-seen order."""
+    seen = set(target)
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            target.append(item)
+
+
 def merge_patterns(existing: LearnedPatterns, new: LearnedPatterns) -> LearnedPatterns:
     """
     Merge new patterns into existing patterns.
     
     Updates counts and adds new items while preserving existing data.
+    `existing` is updated in place (no re-validation) and returned; items from
+    `new` may be adopted into it as-is.
     
     Args:
         existing: Existing patterns
@@ -242,7 +247,7 @@ def merge_patterns(existing: LearnedPatterns, new: LearnedPatterns) -> LearnedPa
         Merged LearnedPatterns
     """
     # Merge source paths
-    existing.source_paths = list(set(existing.source_paths + new.source_paths))
+    _extend_unique(existing.source_paths, new.source_paths)
     existing.total_files_analyzed = len(existing.source_paths)
     existing.total_test_functions += new.total_test_functions
     existing.total_test_classes += new.total_test_classes
@@ -252,9 +257,7 @@ def merge_patterns(existing: LearnedPatterns, new: LearnedPatterns) -> LearnedPa
     for signal in new.signals:
         if signal.value in existing_signals:
             existing_signals[signal.value].occurrences += signal.occurrences
-            existing_signals[signal.value].source_files = list(
-                set(existing_signals[signal.value].source_files + signal.source_files)
-            )
+            _extend_unique(existing_signals[signal.value].source_files, signal.source_files)
         else:
             existing_signals[signal.value] = signal
     existing.signals = list(existing_signals.values())
@@ -301,9 +304,7 @@ def merge_patterns(existing: LearnedPatterns, new: LearnedPatterns) -> LearnedPa
     for fault in new.fault_injection_patterns:
         if fault.fault_type in existing_faults:
             existing_faults[fault.fault_type].occurrences += fault.occurrences
-            existing_faults[fault.fault_type].source_files = list(
-                set(existing_faults[fault.fault_type].source_files + fault.source_files)
-            )
+            _extend_unique(existing_faults[fault.fault_type].source_files, fault.source_files)
         else:
             existing_faults[fault.fault_type] = fault
     existing.fault_injection_patterns = list(existing_faults.values())
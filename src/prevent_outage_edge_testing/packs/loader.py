@@ -13,6 +13,8 @@ Expected pack structure:
         └── *.*
 """
 
+import os
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import Optional
 
@@ -28,6 +30,36 @@ from prevent_outage_edge_testing.packs.models import (
 
 console = Console()
 
+# Packs parsed in this process, keyed by resolved pack directory, with the
+# source stamp they were parsed at (see _pack_source_stamp). Shared by every
+# PackLoader so repeated loads of unchanged packs skip YAML and validation.
+_pack_cache: dict[Path, tuple[tuple[int, int], KnowledgePack]] = {}
+
+
+def _pack_source_stamp(pack_dir: Path) -> tuple[int, int]:
+    """
+    (newest mtime_ns, file count) over a pack's sources.
+    
+    Covers the pack directory, pack.yaml, and recipes/ and snippets/ with their
+    files, so edits, additions and removals all change the stamp.
+    """
+    latest = pack_dir.stat().st_mtime_ns
+    count = 0
+    for entry in os.scandir(pack_dir):
+        if entry.name == "pack.yaml" or entry.name in ("recipes", "snippets"):
+            latest = max(latest, entry.stat().st_mtime_ns)
+            count += 1
+            if entry.is_dir():
+                for child in os.scandir(entry.path):
+                    latest = max(latest, child.stat().st_mtime_ns)
+                    count += 1
+    return latest, count
+
+
+def clear_pack_cache() -> None:
+    """Forget packs parsed in this process."""
+    _pack_cache.clear()
+
 
 class PackLoader:
     """Loads knowledge packs from filesystem."""
@@ -132,12 +164,31 @@ class PackLoader:
         return None
     
     def _load_from_dir(self, pack_dir: Path) -> Optional[KnowledgePack]:
-        """Load a pack from a directory."""
+        """Load a pack from a directory, reusing an unchanged cached parse."""
         pack_yaml = pack_dir / "pack.yaml"
         
         if not pack_yaml.exists():
             return None
         
+        try:
+            key = pack_dir.resolve()
+            stamp = _pack_source_stamp(pack_dir)
+        except OSError:
+            return self._parse_dir(pack_dir)
+        
+        cached = _pack_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        pack = self._parse_dir(pack_dir)
+        if pack is not None:
+            _pack_cache[key] = (stamp, pack)
+        return pack
+    
+    def _parse_dir(self, pack_dir: Path) -> Optional[KnowledgePack]:
+        """Parse pack.yaml plus file-based recipes and snippets."""
+        pack_yaml = pack_dir / "pack.yaml"
+        
         try:
             with open(pack_yaml) as f:
                 data = yaml.safe_load(f)
@@ -172,8 +223,15 @@ class PackLoader:
             console.print(f"[red]Error loading pack from {pack_dir}: {e}[/red]")
             return None
     
-    def load_all(self) -> list[KnowledgePack]:
-        """Load all packs from search paths."""
+    def load_all(self, patterns: Optional[list[str]] = None) -> list[KnowledgePack]:
+        """
+        Load all packs from search paths.
+        
+        Args:
+            patterns: Optional glob patterns (e.g. ``["fault-*"]``) matched against
+                pack directory names; non-matching packs are skipped before their
+                pack.yaml is read.
+        """
         packs = []
         seen_ids: set[str] = set()
         
@@ -182,6 +240,8 @@ class PackLoader:
                 continue
             
             for item in search_path.iterdir():
+                if patterns and not any(fnmatch(item.name, p) for p in patterns):
+                    continue
                 if item.is_dir() and not item.name.startswith("."):
                     pack = self._load_from_dir(item)
                     if pack and pack.id not in seen_ids:
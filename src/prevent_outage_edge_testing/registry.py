@@ -6,7 +6,10 @@ PackRegistry provides a central store for knowledge packs.
 Supports loading from YAML files, in-memory registration, and semantic search.
 """
 
+import hashlib
 import importlib.resources
+import os
+import pickle
 from pathlib import Path
 from typing import Iterator
 
@@ -29,6 +32,8 @@ class PackRegistry:
 
     def __init__(self) -> None:
         self._packs: dict[str, KnowledgePack] = {}
+        # Pack files (or pack directories) that failed to load so far
+        self._load_failures = 0
 
     def register(self, pack: KnowledgePack) -> None:
         """Register a knowledge pack."""
@@ -107,25 +112,18 @@ class PackRegistry:
                 pack = self.load_from_yaml(yaml_file)
                 packs.append(pack)
             except Exception as e:
+                self._load_failures += 1
                 console.print(f"[red]Failed to load {yaml_file}: {e}[/red]")
         return packs
 
     def load_builtin_packs(self) -> list[KnowledgePack]:
         """Load the built-in knowledge packs shipped with the library."""
         try:
-            packs_path = (
-                importlib.resources.files("prevent_outage_edge_testing") / "packs"
-            )
-            if hasattr(packs_path, "_path"):
-                # For editable installs
-                pack_dir = Path(str(packs_path))
-            else:
-                # Fallback for installed packages
-                with importlib.resources.as_file(packs_path) as p:
-                    pack_dir = p
+            pack_dir = _builtin_packs_dir()
             if pack_dir.exists():
                 return self.load_from_directory(pack_dir)
         except Exception as e:
+            self._load_failures += 1
             console.print(f"[yellow]Could not load built-in packs: {e}[/yellow]")
         return []
 
@@ -139,14 +137,130 @@ class PackRegistry:
         return pack_id in self._packs
 
 
+def _builtin_packs_dir() -> Path:
+    """Resolve the directory holding the built-in pack YAML files."""
+    packs_path = importlib.resources.files("prevent_outage_edge_testing") / "packs"
+    if hasattr(packs_path, "_path"):
+        # For editable installs
+        return Path(str(packs_path))
+    # Fallback for installed packages
+    with importlib.resources.as_file(packs_path) as p:
+        return p
+
+
+# On-disk cache of the resolved built-in packs, shared across CLI invocations
+REGISTRY_CACHE_VERSION = 2
+
+# (file name, size, mtime_ns) of every pack YAML the cache was built from
+SourceManifest = tuple[tuple[str, int, int], ...]
+
+
+def get_registry_cache_path(pack_dir: Path | None = None) -> Path:
+    """
+    Get the path of the pickled built-in pack cache.
+
+    The file name is keyed on the package version and the resolved pack
+    directory, so separate checkouts, venvs and upgrades never share (or
+    unpickle) each other's cache.
+    """
+    from prevent_outage_edge_testing import __version__
+
+    if pack_dir is None:
+        pack_dir = _builtin_packs_dir()
+    dir_key = hashlib.sha256(str(pack_dir.resolve()).encode()).hexdigest()[:16]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    name = f"packs.v{REGISTRY_CACHE_VERSION}-{__version__}-{dir_key}.pkl"
+    return Path(cache_home) / "poet" / name
+
+
+def _packs_source_manifest(pack_dir: Path) -> SourceManifest:
+    """Snapshot (name, size, mtime_ns) of the top-level pack YAML files."""
+    try:
+        entries = []
+        for entry in os.scandir(pack_dir):
+            if entry.name.endswith(".yaml"):
+                st = entry.stat()
+                entries.append((entry.name, st.st_size, st.st_mtime_ns))
+        return tuple(sorted(entries))
+    except OSError:
+        return ()
+
+
+def _read_registry_cache(cache_path: Path) -> tuple[SourceManifest, list[KnowledgePack]] | None:
+    """Read (manifest, packs) from the cache, or None if unusable."""
+    try:
+        with open(cache_path, "rb") as f:
+            manifest, packs = pickle.load(f)
+        return manifest, packs
+    except Exception:
+        return None
+
+
+def _write_registry_cache(
+    cache_path: Path, manifest: SourceManifest, packs: list[KnowledgePack]
+) -> None:
+    """Atomically write the cache; failures are ignored (cache is best-effort)."""
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump((manifest, packs), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _load_builtin_packs_fresh(pack_dir: Path, cache_path: Path) -> list[KnowledgePack]:
+    """
+    Parse the built-in packs from YAML and refresh the on-disk cache.
+
+    A partial load is not cached: the failing files are reparsed (and their
+    errors shown) on every run until they load.
+    """
+    manifest = _packs_source_manifest(pack_dir)
+    registry = PackRegistry()
+    packs = registry.load_builtin_packs()
+    if not registry._load_failures:
+        _write_registry_cache(cache_path, manifest, packs)
+    return packs
+
+
+def _load_builtin_packs_cached() -> list[KnowledgePack]:
+    """
+    Load built-in packs, preferring the on-disk cache.
+
+    The cache is used when its stored manifest equals the current one, so
+    any added, removed, resized or re-timestamped pack file invalidates it.
+    """
+    try:
+        pack_dir = _builtin_packs_dir()
+    except Exception:
+        return PackRegistry().load_builtin_packs()
+
+    cache_path = get_registry_cache_path(pack_dir)
+    cached = _read_registry_cache(cache_path)
+    if cached is None:
+        return _load_builtin_packs_fresh(pack_dir, cache_path)
+
+    manifest, packs = cached
+    if manifest == _packs_source_manifest(pack_dir):
+        return packs
+    return _load_builtin_packs_fresh(pack_dir, cache_path)
+
+
 # Global registry instance
 _global_registry: PackRegistry | None = None
 
 
 def get_global_registry() -> PackRegistry:
-    """Get the global pack registry, creating it if needed."""
+    """
+    Get the global pack registry, creating it if needed.
+
+    Built-in packs are served from an on-disk cache when possible.
+    """
     global _global_registry
     if _global_registry is None:
         _global_registry = PackRegistry()
-        _global_registry.load_builtin_packs()
+        for pack in _load_builtin_packs_cached():
+            _global_registry._packs[pack.id] = pack
     return _global_registry
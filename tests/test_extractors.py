@@ -15,6 +15,7 @@ Run with `pytest -m privileged` on systems with appropriate permissions.
 """
 
 import time
+from datetime import datetime
 
 import pytest
 
@@ -143,6 +144,56 @@ class TestExtractorRegistry:
         extractor_registry.remove("to-remove")
         assert "to-remove" not in extractor_registry.list_instances()
 
+    def test_stop_all_concurrently(self):
+        """Test stop_all stops every instance and keeps registration order."""
+        registry = ExtractorRegistry()
+        registry.register_type("dtrace-metrics", DTraceMetricExtractor)
+        registry.register_type("ebpf-metrics", EBPFMetricExtractor)
+        for name in ("dtrace-metrics", "ebpf-metrics"):
+            registry.create(name, extractor_id=f"stop-{name}").start()
+
+        results = registry.stop_all()
+
+        assert [r.extractor_id for r in results] == [
+            "stop-dtrace-metrics",
+            "stop-ebpf-metrics",
+        ]
+        assert all(r.status == ExtractorStatus.STOPPED for r in results)
+
+    def test_stop_all_reports_failed_and_overdue_stops(self):
+        """Test stop_all returns an ERROR result for stops that raise or overrun."""
+
+        class FailingStop(DTraceMetricExtractor):
+            def stop(self, stream=False):
+                raise RuntimeError("tool vanished")
+
+        class SlowStop(DTraceMetricExtractor):
+            def stop(self, stream=False):
+                time.sleep(0.5)
+                return super().stop(stream)
+
+        registry = ExtractorRegistry()
+        registry.register_type("dtrace-metrics", DTraceMetricExtractor)
+        registry.register_type("failing", FailingStop)
+        registry.register_type("slow", SlowStop)
+        for name in ("dtrace-metrics", "failing", "slow"):
+            registry.create(name, extractor_id=f"stop-{name}").start()
+
+        results = registry.stop_all(timeout=0.2)
+
+        assert [r.extractor_id for r in results] == [
+            "stop-dtrace-metrics",
+            "stop-failing",
+            "stop-slow",
+        ]
+        assert [r.status for r in results] == [
+            ExtractorStatus.STOPPED,
+            ExtractorStatus.ERROR,
+            ExtractorStatus.ERROR,
+        ]
+        assert "tool vanished" in results[1].error
+        assert "did not finish" in results[2].error
+
 
 class TestDTraceMetricExtractor:
     """Tests for DTrace metric extractor."""
@@ -173,6 +224,117 @@ class TestDTraceMetricExtractor:
         for item in result.data:
             assert "name" in item
             assert "value" in item
+        # Dict samples must match the model's dump shape
+        assert result.data[0] == MetricSample(**result.data[0]).model_dump()
+
+    def test_max_samples_drops_oldest(self):
+        """Test the sample buffer keeps only the newest entries."""
+        ext = DTraceMetricExtractor(
+            extractor_id="dtrace-bounded",
+            mode=ExtractorMode.SIMULATOR,
+            max_samples=4,
+        )
+        ext.start()
+        time.sleep(0.3)  # First tick emits six samples
+        result = ext.stop()
+
+        assert len(result.data) == 4
+        assert result.metadata["dropped_count"] >= 2
+
+    def test_packed_and_dict_samples_share_one_cap(self):
+        """Test add_data and add_samples share max_samples and merge by timestamp."""
+        labels = {"source": "test"}
+
+        def sample(name, timestamp):
+            return {"name": name, "value": 0.0, "timestamp": timestamp, "labels": labels}
+
+        ext = DTraceMetricExtractor(extractor_id="dtrace-mixed", max_samples=4)
+        ext.add_samples(10_000, labels, [("a", 1.0), ("b", 2.0)])
+        ext.add_data(sample("c", 15_000))
+        ext.add_samples(20_000, labels, [("d", 4.0), ("e", 5.0)])
+        ext.add_data(sample("f", 25_000))
+        result = ext.stop()
+
+        assert [item["name"] for item in result.data] == ["c", "d", "e", "f"]
+        assert result.metadata["dropped_count"] == 2
+
+        # An older dict sample is the one dropped for newer packed samples
+        ext = DTraceMetricExtractor(extractor_id="dtrace-mixed-old", max_samples=2)
+        ext.add_data(sample("x", 5_000))
+        ext.add_samples(10_000, labels, [("y", 1.0), ("z", 2.0)])
+        result = ext.stop()
+
+        assert [item["name"] for item in result.data] == ["y", "z"]
+        assert result.metadata["dropped_count"] == 1
+
+        # A batch over the cap drops the packed samples and its own oldest items
+        ext = DTraceMetricExtractor(extractor_id="dtrace-mixed-batch", max_samples=4)
+        ext.add_samples(10_000, labels, [("a", 1.0), ("b", 2.0)])
+        stamps = range(20_000, 70_000, 10_000)
+        ext.add_batch([sample(name, ts) for name, ts in zip("cdefg", stamps, strict=True)])
+        result = ext.stop()
+
+        assert [item["name"] for item in result.data] == ["d", "e", "f", "g"]
+        assert result.metadata["dropped_count"] == 3
+
+    def test_streamed_stop(self):
+        """Test stop(stream=True) yields items lazily, once."""
+        ext = DTraceMetricExtractor(
+            extractor_id="dtrace-stream",
+            mode=ExtractorMode.SIMULATOR,
+        )
+        ext.start()
+        time.sleep(0.3)
+        result = ext.stop(stream=True)
+
+        assert result.data == []
+        items = list(result.iter_data())
+        assert len(items) >= 6
+        assert items[0] == MetricSample(**items[0]).model_dump()
+        assert list(result.iter_data()) == []
+
+    def test_prometheus_output(self):
+        """Test samples are rendered as Prometheus text at stop time."""
+        ext = DTraceMetricExtractor(
+            extractor_id="dtrace-prom",
+            mode=ExtractorMode.SIMULATOR,
+        )
+        ext.output_format = "prom"
+        ext.start()
+        time.sleep(0.3)
+        result = ext.stop()
+
+        assert result.data == []
+        lines = result.payload.decode().splitlines()
+        assert len(lines) >= 6
+        assert lines[0].startswith('syscall_read{source="simulator"} ')
+
+    def test_prometheus_output_model_labels(self):
+        """Test each model sample is rendered with its own label set."""
+        ext = DTraceMetricExtractor(extractor_id="dtrace-prom-models")
+        ext.output_format = "prom"
+        for i in range(6):
+            ext.add_data(MetricSample(name="m", value=i, labels={"k": str(i)}))
+
+        lines = ext.stop().payload.decode().splitlines()
+
+        assert [line.rsplit(" ", 1)[0] for line in lines] == [
+            f'm{{k="{i}"}} {float(i)}' for i in range(6)
+        ]
+
+    def test_results_do_not_alias_collector_labels(self):
+        """Test results get their own copy of an interned label set."""
+        ext = DTraceMetricExtractor(extractor_id="dtrace-labels")
+        labels = {"source": "dtrace"}
+        ext.add_samples(1, labels, [("a", 1.0), ("b", 2.0)])
+
+        first = ext.stop()
+        first.data[0]["labels"]["host"] = "h"
+        ext.add_samples(2, labels, [("a", 3.0)])
+        second = ext.stop()
+
+        assert labels == {"source": "dtrace"}
+        assert second.data[0]["labels"] == {"source": "dtrace"}
 
     def test_can_run_privileged(self):
         """Test privileged capability check."""
@@ -205,6 +367,60 @@ class TestEBPFMetricExtractor:
 
         assert len(result.data) > 0
 
+    def test_stop_drains_pending_counts(self):
+        """Test unflushed per-CPU counts and unread events are emitted on stop."""
+        from types import SimpleNamespace
+
+        ext = EBPFMetricExtractor(extractor_id="ebpf-drain")
+
+        def entry(sid, *counts):
+            return SimpleNamespace(value=sid), [SimpleNamespace(count=c) for c in counts]
+
+        pending = [entry(1, 2, 3), entry(7, 0, 4), entry(9, 0, 0)]
+        assert ext._sum_pending(pending) == {1: 5, 7: 4}
+
+        class FakeBPF:
+            def ring_buffer_consume(self):
+                # An event still sitting in the ring buffer
+                ext._counts[1] = ext._counts.get(1, 0) + 10
+
+            def __getitem__(self, name):
+                assert name == "pending"
+                return SimpleNamespace(items=lambda: pending)
+
+        ext.mode = ExtractorMode.PRIVILEGED
+        ext._bpf = FakeBPF()
+        result = ext.stop()
+
+        totals = {s["name"]: s["value"] for s in result.data}
+        assert totals == {"syscall.id.1": 15, "syscall.id.7": 4}
+        assert ext._counts == {}
+
+    def test_stop_skips_drain_while_poll_runs(self, monkeypatch):
+        """Test a collector that overruns the join is not raced by the drain."""
+        import concurrent.futures
+
+        from prevent_outage_edge_testing.extractors import privileged
+
+        monkeypatch.setattr(privileged, "_JOIN_TIMEOUT", 0.01)
+        ext = EBPFMetricExtractor(extractor_id="ebpf-stuck")
+
+        class FakeBPF:
+            def ring_buffer_consume(self):
+                raise AssertionError("drained while the poll thread was running")
+
+        # Still inside ring_buffer_poll(), so it cannot be cancelled
+        collector: concurrent.futures.Future[None] = concurrent.futures.Future()
+        collector.set_running_or_notify_cancel()
+        ext.mode = ExtractorMode.PRIVILEGED
+        ext._bpf = FakeBPF()
+        ext._collector = collector
+        result = ext.stop()
+
+        assert result.status.value == "error"
+        assert "not drained" in result.error
+        assert ext._bpf is None
+
 
 class TestLDPreloadLogExtractor:
     """Tests for LD_PRELOAD log extractor."""
@@ -232,6 +448,103 @@ class TestLDPreloadLogExtractor:
         for item in result.data:
             assert "message" in item
 
+    def test_shared_memory_ring(self, tmp_path):
+        """Test records written to the shared ring become log entries."""
+        import struct
+
+        library = tmp_path / "libintercept.so"
+        library.write_bytes(b"")
+        ext = LDPreloadLogExtractor(
+            extractor_id="ldpreload-shm",
+            mode=ExtractorMode.PRIVILEGED,
+            target_functions=["connect", "send"],
+            library_path=str(library),
+        )
+        if not ext.can_run_privileged():
+            pytest.skip("LD_PRELOAD not supported on this platform")
+        ext.start()
+        env = ext.target_environment()
+        assert env["POET_LDPRELOAD_FUNCTIONS"] == "connect,send"
+
+        # Act as the intercept library: fill two slots, then publish head
+        buf = ext._shm.buf
+        record = struct.Struct("<QII120s")
+        record.pack_into(buf, 64, 1_700_000_000_000_000_000, 0, 8, b"10.0.0.1")
+        record.pack_into(buf, 64 + record.size, 1_700_000_000_000_000_000, 1, 3, b"abc")
+        struct.pack_into("<Q", buf, 0, 2)
+        del buf
+        time.sleep(0.2)
+        result = ext.stop()
+
+        assert [e["message"] for e in result.data] == ["10.0.0.1", "abc"]
+        assert [e["source"] for e in result.data] == ["ldpreload.connect", "ldpreload.send"]
+        assert result.data[0] == LogEntry(**result.data[0]).model_dump()
+
+    def test_results_do_not_alias_collector_attributes(self):
+        """Test per-function attribute dicts are copied into each result."""
+        ext = LDPreloadLogExtractor(extractor_id="ldpreload-attrs")
+        attributes = {"function": "connect"}
+        for message in ("a", "b"):
+            ext.add_data(
+                {"timestamp": 1, "level": "DEBUG", "message": message,
+                 "source": "ldpreload.connect", "attributes": attributes}
+            )
+
+        result = ext.stop()
+        result.data[0]["attributes"]["host"] = "h"
+
+        assert attributes == {"function": "connect"}
+        assert result.data[0]["attributes"] is not attributes
+
+    def test_shared_memory_ring_discards_lapped_records(self, monkeypatch):
+        """Test records the producer overwrote during the copy are dropped."""
+        import struct
+
+        from prevent_outage_edge_testing.extractors import privileged
+
+        record = struct.Struct("<QII120s")
+        capacity = 4
+        buf = memoryview(bytearray(64 + capacity * record.size))
+        for index in range(4):
+            record.pack_into(buf, 64 + index * record.size, index, 0, 1, b"x")
+
+        class HeadReads:
+            """Report head=4 before the copy and head=6 after it."""
+
+            def __init__(self):
+                self.values = iter([4, 6])
+
+            def unpack_from(self, buffer, offset):
+                return (next(self.values),)
+
+        monkeypatch.setattr(privileged, "_LDP_HEAD", HeadReads())
+        records, tail, skipped = privileged._ldp_drain(buf, 0, capacity)
+
+        # Records 0-1 were overwritten by 4-5 and slot 2 is being filled for 6
+        assert tail == 4
+        assert [r[0] for r in records] == [3]
+        assert skipped == 3
+
+    def test_shared_memory_ring_counts_lapped_tail(self):
+        """Test records overwritten before the drain started count as skipped."""
+        import struct
+
+        from prevent_outage_edge_testing.extractors import privileged
+
+        record = struct.Struct("<QII120s")
+        capacity = 4
+        buf = memoryview(bytearray(64 + capacity * record.size))
+        for index in range(6, 10):
+            record.pack_into(buf, 64 + (index % capacity) * record.size, index, 0, 1, b"x")
+        struct.pack_into("<Q", buf, 0, 10)
+
+        records, tail, skipped = privileged._ldp_drain(buf, 0, capacity)
+
+        # 0-5 were overwritten; 6 sits in the slot the producer fills next
+        assert tail == 10
+        assert skipped == 7
+        assert [r[0] for r in records] == [7, 8, 9]
+
 
 class TestNetworkTraceExtractor:
     """Tests for network trace extractor."""
@@ -259,6 +572,59 @@ class TestNetworkTraceExtractor:
         for item in result.data:
             assert "trace_id" in item
             assert "span_id" in item
+        assert result.data[0] == TraceSpan(**result.data[0]).model_dump()
+
+    def test_pcap_packet_serialization(self):
+        """Test packed libpcap packet rows become span dicts at stop time."""
+        ext = NetworkTraceExtractor(extractor_id="network-pcap", max_samples=2)
+        for span_no in (1, 2, 3):
+            ext.add_packet((span_no, 1_700_000_000, 500, 60, 74, b"\x45\x00"))
+        result = ext.stop()
+
+        assert result.metadata["dropped_count"] == 1
+        assert [item["span_id"] for item in result.data] == [f"{2:016x}", f"{3:016x}"]
+        item = result.data[-1]
+        assert item == TraceSpan(**item).model_dump()
+        assert item["start_time"] == datetime(2023, 11, 14, 22, 13, 20, 500)
+        assert item["span_id"] == f"{3:016x}"
+        assert item["attributes"] == {"caplen": 60, "len": 74, "header": "4500"}
+
+    def test_unstopped_blocking_collector_does_not_block_exit(self):
+        """Test a blocking poller left running does not hang interpreter exit."""
+        import subprocess
+        import sys
+
+        code = (
+            "import time\n"
+            "from prevent_outage_edge_testing.extractors.privileged import _spawn_blocking\n"
+            "_spawn_blocking(lambda: time.sleep(60), 'poet-test')\n"
+        )
+        proc = subprocess.run([sys.executable, "-c", code], timeout=30)
+        assert proc.returncode == 0
+
+    def test_line_batches_keep_unterminated_last_line(self):
+        """Test a pipe whose output lacks a final newline loses no line."""
+        import asyncio
+        import subprocess
+        import sys
+
+        from prevent_outage_edge_testing.extractors.privileged import _aiter_line_batches
+
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "import sys; sys.stdout.write('one\\ntwo\\nthree')"],
+            stdout=subprocess.PIPE,
+        )
+
+        async def read_all() -> list[str]:
+            lines = []
+            async for batch in _aiter_line_batches(proc.stdout, lambda: True):
+                lines.extend(batch)
+            return lines
+
+        try:
+            assert asyncio.run(read_all()) == ["one", "two", "three"]
+        finally:
+            proc.wait()
 
 
 class TestGlobalExtractorRegistry:
@@ -0,0 +1,158 @@
+# tests/test_gates.py
+# Tests for release gate definitions.
+
+"""
+Unit tests for release gates.
+
+Tests cover:
+- Running a gate's checks in a single pytest invocation
+- Selecting tests per check with pytest -k semantics
+- Running independent gates concurrently
+"""
+
+from pathlib import Path
+
+import pytest
+
+from prevent_outage_edge_testing.gates import definitions
+from prevent_outage_edge_testing.gates.definitions import (
+    ContractGate,
+    _run_pytest_checks_batched,
+    run_all_gates,
+)
+from prevent_outage_edge_testing.gates.models import Gate, GateStatus
+
+
+class TestBatchedGateRun:
+    """Tests for running all checks of a gate in one pytest process."""
+
+    def test_checks_demultiplexed(self, tmp_path: Path):
+        """Test each check gets its own status from a single run."""
+        test_dir = tmp_path / "generated_tests"
+        test_dir.mkdir()
+        (test_dir / "test_api.py").write_text(
+            "def test_status_code():\n"
+            "    assert True\n"
+            "\n"
+            "def test_content_type_header():\n"
+            "    assert False\n"
+        )
+
+        result = ContractGate().run({"test_dir": test_dir})
+        by_name = {c.name: c for c in result.checks}
+
+        assert by_name["HTTP Status Codes"].status == GateStatus.PASSED
+        assert by_name["HTTP Status Codes"].details["passed"] == 1
+        assert by_name["Required Headers"].status == GateStatus.FAILED
+        assert by_name["Required Headers"].details["failed_tests"]
+        assert by_name["Response Schema"].message == "no tests matched"
+        assert result.status == GateStatus.FAILED
+
+    def test_markers_and_classes_match(self, tmp_path: Path):
+        """Test checks match markers and class names like pytest -k does."""
+        test_dir = tmp_path / "generated_tests"
+        test_dir.mkdir()
+        (test_dir / "test_edge.py").write_text(
+            "import pytest\n"
+            "\n"
+            "class TestRetry:\n"
+            "    def test_one(self):\n"
+            "        assert True\n"
+            "\n"
+            "@pytest.mark.slowpath\n"
+            "def test_two():\n"
+            "    assert True\n"
+        )
+        checks = [
+            {"id": "retry", "test_pattern": "retry and not two"},
+            {"id": "marked", "test_pattern": "slowpath"},
+            {"id": "broken", "test_pattern": "retry or ("},
+            {"id": "nothing", "test_pattern": "circuit"},
+        ]
+
+        retry, marked, broken, nothing = _run_pytest_checks_batched(checks, test_dir)
+
+        assert retry[0]
+        assert retry[2]["passed"] == 1
+        assert marked[0]
+        assert marked[2]["passed"] == 1
+        assert not broken[0]
+        assert "Wrong expression" in broken[1]
+        assert not nothing[0]
+        assert nothing[1] == "no tests matched"
+
+    def test_runs_pytest_with_current_interpreter(self, tmp_path: Path, monkeypatch):
+        """Test pytest runs under POET's interpreter so the plugin is importable."""
+        import sys
+        from types import SimpleNamespace
+
+        commands = []
+
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            return SimpleNamespace(returncode=2, stdout="", stderr="")
+
+        monkeypatch.setattr(definitions.subprocess, "run", fake_run)
+        _run_pytest_checks_batched([{"id": "retry", "test_pattern": "retry"}], tmp_path)
+
+        assert commands[0][:3] == [sys.executable, "-m", "pytest"]
+
+    def test_missing_test_dir_skips(self, tmp_path: Path):
+        """Test all checks are skipped when no generated tests exist."""
+        result = ContractGate().run({"test_dir": tmp_path / "missing"})
+        assert all(c.status == GateStatus.SKIPPED for c in result.checks)
+        assert result.status == GateStatus.PASSED
+
+
+class TestKeywordExpression:
+    """Tests for the plugin's -k expression evaluator."""
+
+    @staticmethod
+    def _matches(pattern: str, *names: str) -> bool:
+        from prevent_outage_edge_testing.gates.pytest_plugin import KeywordExpression
+
+        lowered = [n.lower() for n in names]
+        return KeywordExpression(pattern).evaluate(
+            lambda word: any(word.lower() in n for n in lowered)
+        )
+
+    def test_substring_case_insensitive(self):
+        """Test bare words match as case-insensitive substrings."""
+        assert self._matches("Status", "test_status_code")
+        assert not self._matches("header", "test_status_code")
+
+    def test_operator_precedence(self):
+        """Test not binds tighter than and, and and tighter than or."""
+        names = ("test_retry_one", "TestRetry")
+        assert self._matches("retry and not two", *names)
+        assert self._matches("two or retry and one", *names)
+        assert not self._matches("not retry or two", *names)
+        assert self._matches("not (two or three)", *names)
+
+    def test_empty_matches_everything(self):
+        """Test an empty expression selects every test, as with pytest -k ''."""
+        assert self._matches("  ", "test_anything")
+
+    def test_invalid_expressions(self):
+        """Test malformed expressions are rejected with ValueError."""
+        from prevent_outage_edge_testing.gates.pytest_plugin import KeywordExpression
+
+        for pattern in ("retry or (", "and retry", "retry retry", "a $ b", "(retry))"):
+            with pytest.raises(ValueError, match="expected"):
+                KeywordExpression(pattern)
+
+
+class TestRunAllGates:
+    """Tests for concurrent gate execution."""
+
+    def test_results_in_gate_order(self, tmp_path: Path):
+        """Test results keep gate order and errors become ERROR results."""
+        broken = Gate(id="broken", name="Broken Gate", description="Always raises")
+        gates = [ContractGate(), broken, ContractGate(id="contract-2")]
+
+        results = run_all_gates({"test_dir": tmp_path / "missing"}, gates)
+
+        assert [r.gate_id for r in results] == ["contract", "broken", "contract-2"]
+        assert results[1].status == GateStatus.ERROR
+        assert results[1].error
+        assert results[0].status == GateStatus.PASSED
@@ -17,6 +17,7 @@ import pytest
 
 from prevent_outage_edge_testing.learner.analyzer import (
     TestAnalyzer,
+    analyze_many,
     analyze_test_file,
     discover_test_files,
     ParsedTestFile,
@@ -241,6 +242,57 @@ class TestAnalyzer:
         cache_asserts = [a for a in result.asserts if a.is_cache_check]
         assert len(cache_asserts) > 0
     
+    def test_analyze_many_preserves_order(self, tmp_path):
+        """Test batch analysis returns one result per file, in input order."""
+        files = []
+        for i in range(3):
+            f = tmp_path / f"test_batch_{i}.py"
+            f.write_text(f"def test_case_{i}():\n    assert True\n")
+            files.append(f)
+        done = []
+        
+        results = analyze_many(files, on_done=lambda: done.append(1))
+        
+        assert [r.path for r in results] == files
+        names = [r.functions[0].name for r in results]
+        assert names == ["test_case_0", "test_case_1", "test_case_2"]
+        assert len(done) == 3
+    
+    def test_analyze_many_process_pool_matches_serial(self, tmp_path, monkeypatch):
+        """Test the process-pool path returns the same results as the serial path."""
+        from prevent_outage_edge_testing.learner import analyzer
+        
+        files = []
+        for i in range(4):
+            f = tmp_path / f"test_pool_{i}.py"
+            f.write_text(
+                "import pytest\n"
+                f"@pytest.mark.parametrize('n', [{i}])\n"
+                f"def test_pool_{i}(client, n):\n"
+                "    assert client.get('/').status_code == 200\n"
+            )
+            files.append(f)
+        files.append(tmp_path / "missing.py")
+        serial = analyze_many(files)
+        
+        pools = []
+        
+        class RecordingPool(analyzer.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+        
+        monkeypatch.setattr(analyzer, "_PARALLEL_PARSE_MIN_FILES", 2)
+        monkeypatch.setattr(analyzer.os, "cpu_count", lambda: 2)
+        monkeypatch.setattr(analyzer, "ProcessPoolExecutor", RecordingPool)
+        done = []
+        pooled = analyze_many(files, on_done=lambda: done.append(1))
+        
+        assert len(pools) == 1
+        assert pooled == serial
+        assert pooled[-1] is None
+        assert len(done) == len(files)
+    
     def test_discover_test_files(self, tmp_path):
         """Test file discovery."""
         # Create test directory structure
@@ -626,6 +678,43 @@ class TestLearnedPatternsModel:
         assert len(applicable) == 2
         assert all(r.confidence >= 0.5 for r in applicable)
 
+    def test_sorted_views(self):
+        """Test cached sorted views and that they stay out of the dump."""
+        patterns = LearnedPatterns(
+            fixtures=[
+                ExtractedFixture(name="a", inferred_role=FixtureRole.CLIENT, confidence=0.2),
+                ExtractedFixture(name="b", inferred_role=FixtureRole.CACHE, confidence=0.9),
+                ExtractedFixture(name="c", inferred_role=FixtureRole.UNKNOWN, confidence=0.5),
+            ]
+        )
+
+        names = [f.name for f in patterns.fixtures_by_confidence]
+
+        assert names == ["b", "c", "a"]
+        assert patterns.fixtures_by_confidence is patterns.fixtures_by_confidence
+        assert "fixtures_by_confidence" not in patterns.model_dump()
+
+    def test_sorted_views_invalidated(self):
+        """Test sorted views are rebuilt after assignment, copies and merges."""
+        from prevent_outage_edge_testing.learner.storage import merge_patterns
+
+        def fixture(name, confidence):
+            return ExtractedFixture(
+                name=name, inferred_role=FixtureRole.CLIENT, confidence=confidence
+            )
+
+        patterns = LearnedPatterns(fixtures=[fixture("a", 0.2)])
+        assert [f.name for f in patterns.fixtures_by_confidence] == ["a"]
+
+        patterns.fixtures = [fixture("a", 0.2), fixture("b", 0.9)]
+        assert [f.name for f in patterns.fixtures_by_confidence] == ["b", "a"]
+
+        copied = patterns.model_copy(update={"fixtures": [fixture("c", 0.5)]})
+        assert [f.name for f in copied.fixtures_by_confidence] == ["c"]
+
+        merge_patterns(patterns, LearnedPatterns(fixtures=[fixture("a", 0.95)]))
+        assert [f.name for f in patterns.fixtures_by_confidence] == ["a", "b"]
+
 
 class TestIntegration:
     """Integration tests for the full learning pipeline."""
@@ -671,3 +760,18 @@ class TestIntegration:
         
         assert recommendations.patterns_consulted
         assert len(recommendations.recommendations) > 0
+    
+    def test_piped_show_output_is_tab_safe(self, capsys):
+        """Test piped `learn show` rows flatten tabs/newlines inside cells."""
+        from rich.text import Text
+        
+        from prevent_outage_edge_testing.cli.commands.learn import _print_rows
+        
+        _print_rows(
+            "Fixtures",
+            [("Name", {}), ("Confidence", {})],
+            [("db\tclient", Text("90%\n", style="green"))],
+        )
+        
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == ["# Fixtures", "Name\tConfidence", "db client\t90% "]
@@ -15,6 +15,11 @@ import pytest
 from datetime import datetime
 from pydantic import ValidationError
 
+from prevent_outage_edge_testing.core.knowledge import (
+    KnowledgeIndex,
+    LearnedPattern,
+    PatternType,
+)
 from prevent_outage_edge_testing.models import (
     ExtractorMode,
     FailureMode,
@@ -240,3 +245,48 @@ class TestExtractorMode:
         """Verify extractor mode values."""
         assert ExtractorMode.PRIVILEGED == "privileged"
         assert ExtractorMode.SIMULATOR == "simulator"
+
+
+class TestKnowledgeIndex:
+    """Tests for KnowledgeIndex lookup caches."""
+
+    @staticmethod
+    def _pattern(name, pattern_type=PatternType.MARKER, confidence=0.9):
+        return LearnedPattern(pattern_type=pattern_type, name=name, confidence=confidence)
+
+    def test_lookups_after_add_pattern(self):
+        """Test cached lookups see patterns added with add_pattern."""
+        index = KnowledgeIndex(patterns=[self._pattern("timeout")])
+        assert [p.name for p in index.get_patterns_by_type(PatternType.MARKER)] == ["timeout"]
+        assert len(index.get_high_confidence_patterns()) == 1
+        assert index.get_suggestions_for_failure_mode("cache-miss") == []
+
+        index.add_pattern(self._pattern("cache"))
+        index.add_pattern(self._pattern("retry", PatternType.FIXTURE, confidence=0.2))
+
+        assert [p.name for p in index.get_patterns_by_type(PatternType.MARKER)] == [
+            "timeout",
+            "cache",
+        ]
+        assert [p.name for p in index.get_patterns_by_type(PatternType.FIXTURE)] == ["retry"]
+        assert len(index.get_high_confidence_patterns()) == 2
+        assert index.get_suggestions_for_failure_mode("cache-miss") == ["@pytest.mark.cache"]
+
+    def test_lookups_after_model_copy(self):
+        """Test copies rebuild their lookups instead of sharing the original's."""
+        index = KnowledgeIndex(patterns=[self._pattern("timeout")])
+        assert len(index.get_patterns_by_type(PatternType.MARKER)) == 1
+
+        copied = index.model_copy()
+        copied.add_pattern(self._pattern("cache"))
+        assert len(copied.get_patterns_by_type(PatternType.MARKER)) == 2
+        assert len(index.get_patterns_by_type(PatternType.MARKER)) == 1
+        assert len(index.patterns) == 1
+
+        replaced = index.model_copy(update={"patterns": [self._pattern("retry")]})
+        assert [p.name for p in replaced.get_high_confidence_patterns()] == ["retry"]
+
+        deep = index.model_copy(deep=True)
+        deep.add_pattern(self._pattern("cache"))
+        assert len(deep.get_patterns_by_type(PatternType.MARKER)) == 2
+        assert len(index.get_patterns_by_type(PatternType.MARKER)) == 1
@@ -0,0 +1,182 @@
+# tests/test_obligations.py
+# Tests for the obligations CLI helpers.
+
+"""
+Unit tests for obligation discovery.
+
+Tests cover:
+- Scanning an obligations directory for YAML files with an id
+- The incremental JSON summary index used by `poet obligations list`
+- Looking up one obligation by id without parsing non-matching files
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from prevent_outage_edge_testing.cli.commands import obligations
+
+
+@pytest.fixture
+def obligations_dir(tmp_path: Path) -> Path:
+    """A private obligations directory with two valid obligations."""
+    root = tmp_path / "obligations"
+    (root / "cache").mkdir(parents=True)
+    (root / "cache" / "key.yaml").write_text(
+        "id: cache.key\ntitle: Cache key\nrisk: high\nsafe_in_prod: true\n"
+    )
+    (root / "routing.yaml").write_text(
+        "id: routing.retry\ntitle: Retry routing\nrisk: low\nsafe_in_prod: false\n"
+    )
+    return root
+
+
+class TestFindAllObligations:
+    """Tests for scanning every obligation file."""
+
+    def test_skips_files_without_mapping_id(self, obligations_dir: Path):
+        """Test scalar, id-less and unparseable YAML files are skipped."""
+        (obligations_dir / "note.yaml").write_text("provides guidance\n")
+        (obligations_dir / "no_id.yaml").write_text("title: Missing id\n")
+        (obligations_dir / "broken.yaml").write_text("id: [unterminated\n")
+
+        found = obligations.find_all_obligations(obligations_dir)
+
+        assert [oid for oid, _, _ in found] == ["cache.key", "routing.retry"]
+
+
+class TestFindObligationById:
+    """Tests for the exact-id lookup used by `poet obligations show`."""
+
+    @pytest.fixture
+    def parsed(self, monkeypatch) -> list[bytes]:
+        """Raw documents handed to the YAML parser during the test."""
+        calls: list[bytes] = []
+        original = obligations._load_yaml
+
+        def tracking(stream: bytes):
+            calls.append(stream)
+            return original(stream)
+
+        monkeypatch.setattr(obligations, "_load_yaml", tracking)
+        return calls
+
+    def test_other_ids_skipped_without_parse(self, obligations_dir: Path, parsed: list[bytes]):
+        """Test only the file whose id line matches is parsed."""
+        found = obligations.find_obligation_by_id(obligations_dir, "routing.retry")
+
+        assert found is not None
+        path, data = found
+        assert path.name == "routing.yaml"
+        assert data["title"] == "Retry routing"
+        assert parsed == [path.read_bytes()]
+
+    def test_quoted_and_commented_id_lines(self, obligations_dir: Path, parsed: list[bytes]):
+        """Test quoted ids and trailing comments are recognized on the id line."""
+        (obligations_dir / "quoted.yaml").write_text(
+            'id: "cache.ttl"  # time to live\ntitle: Cache TTL\n'
+        )
+
+        found = obligations.find_obligation_by_id(obligations_dir, "cache.ttl")
+
+        assert found is not None
+        assert found[0].name == "quoted.yaml"
+        assert len(parsed) == 1
+
+    def test_unrecognized_id_line_parsed(self, obligations_dir: Path, parsed: list[bytes]):
+        """Test files without a plain top-level id line fall back to a full parse."""
+        (obligations_dir / "flow.yaml").write_text("{id: cdn.purge, title: Purge}\n")
+
+        found = obligations.find_obligation_by_id(obligations_dir, "cdn.purge")
+
+        assert found is not None
+        assert found[1]["title"] == "Purge"
+
+    def test_missing_id(self, obligations_dir: Path, parsed: list[bytes]):
+        """Test an unknown id returns None without parsing any recognized file."""
+        assert obligations.find_obligation_by_id(obligations_dir, "dns.ttl") is None
+        assert parsed == []
+
+
+class TestObligationsIndex:
+    """Tests for the persistent obligations summary index."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache_home(self, tmp_path: Path, monkeypatch):
+        """Keep the index away from the real ~/.cache/poet."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    @pytest.fixture
+    def parsed(self, monkeypatch) -> list[str]:
+        """Names of the obligation files parsed during the test."""
+        calls: list[str] = []
+        original = obligations.load_obligation
+
+        def tracking(filepath: Path):
+            calls.append(filepath.name)
+            return original(filepath)
+
+        monkeypatch.setattr(obligations, "load_obligation", tracking)
+        return calls
+
+    def test_first_build(self, obligations_dir: Path, parsed: list[str]):
+        """Test the first load parses every file and writes the index."""
+        found = obligations.load_obligations_index(obligations_dir)
+
+        assert [(oid, data) for oid, _, data in found] == [
+            ("cache.key", {"id": "cache.key", "title": "Cache key", "risk": "high",
+                           "safe_in_prod": True}),
+            ("routing.retry", {"id": "routing.retry", "title": "Retry routing",
+                               "risk": "low", "safe_in_prod": False}),
+        ]
+        assert sorted(parsed) == ["key.yaml", "routing.yaml"]
+        assert obligations.get_obligations_index_path(obligations_dir).exists()
+
+    def test_unchanged_files_not_reparsed(self, obligations_dir: Path, parsed: list[str]):
+        """Test a second load serves every summary from the index."""
+        obligations.load_obligations_index(obligations_dir)
+        parsed.clear()
+
+        found = obligations.load_obligations_index(obligations_dir)
+
+        assert [oid for oid, _, _ in found] == ["cache.key", "routing.retry"]
+        assert parsed == []
+
+    def test_edited_file_reparsed(self, obligations_dir: Path, parsed: list[str]):
+        """Test only a file with a new mtime is parsed again."""
+        obligations.load_obligations_index(obligations_dir)
+        parsed.clear()
+        edited = obligations_dir / "routing.yaml"
+        st = edited.stat()
+        edited.write_text("id: routing.retry\ntitle: Retry budget\nrisk: high\n")
+        os.utime(edited, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        found = obligations.load_obligations_index(obligations_dir)
+        titles = {oid: data["title"] for oid, _, data in found}
+
+        assert parsed == ["routing.yaml"]
+        assert titles["routing.retry"] == "Retry budget"
+
+    def test_deleted_file_removed(self, obligations_dir: Path, parsed: list[str]):
+        """Test a deleted file disappears from the results and the index."""
+        obligations.load_obligations_index(obligations_dir)
+        (obligations_dir / "routing.yaml").unlink()
+
+        found = obligations.load_obligations_index(obligations_dir)
+
+        assert [oid for oid, _, _ in found] == ["cache.key"]
+        index = obligations.get_obligations_index_path(obligations_dir).read_text()
+        assert "routing.yaml" not in index
+
+    def test_invalid_files_skipped(self, obligations_dir: Path, parsed: list[str]):
+        """Test unparseable and id-less files are skipped but remembered."""
+        (obligations_dir / "broken.yaml").write_text("id: [unterminated\n")
+        (obligations_dir / "no_id.yaml").write_text("title: Missing id\n")
+        obligations.load_obligations_index(obligations_dir)
+        parsed.clear()
+
+        found = obligations.load_obligations_index(obligations_dir)
+
+        assert [oid for oid, _, _ in found] == ["cache.key", "routing.retry"]
+        assert parsed == []
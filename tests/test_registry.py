@@ -18,6 +18,12 @@ from prevent_outage_edge_testing.models import KnowledgePack, Severity
 from prevent_outage_edge_testing.registry import PackRegistry, get_global_registry
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path, monkeypatch):
+    """Keep every registry test away from the real ~/.cache/poet."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
 class TestPackRegistry:
     """Tests for PackRegistry class."""
 
@@ -129,3 +135,205 @@ class TestGlobalRegistry:
         reg1 = get_global_registry()
         reg2 = get_global_registry()
         assert reg1 is reg2
+
+
+class TestRegistryCache:
+    """Tests for the on-disk built-in pack cache."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, monkeypatch):
+        """Reset the global registry (the cache dir is already isolated)."""
+        import prevent_outage_edge_testing.registry as registry_module
+
+        monkeypatch.setattr(registry_module, "_global_registry", None)
+        return registry_module
+
+    @pytest.fixture
+    def local_packs(self, isolated_cache, tmp_path, monkeypatch):
+        """Serve the built-in packs from a private copy that tests may edit."""
+        import shutil
+
+        pack_dir = tmp_path / "packs"
+        shutil.copytree(isolated_cache._builtin_packs_dir(), pack_dir)
+        monkeypatch.setattr(isolated_cache, "_builtin_packs_dir", lambda: pack_dir)
+        return pack_dir
+
+    def test_cache_written_on_first_load(self, isolated_cache):
+        """Test that loading the global registry populates the cache."""
+        from prevent_outage_edge_testing.registry import get_registry_cache_path
+
+        registry = get_global_registry()
+        assert get_registry_cache_path().exists()
+        assert len(registry) > 0
+
+    def test_cache_reused(self, isolated_cache, monkeypatch):
+        """Test that a fresh cache is served without reparsing YAML."""
+        expected = get_global_registry().list_ids()
+        monkeypatch.setattr(isolated_cache, "_global_registry", None)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML should not be reparsed")
+
+        monkeypatch.setattr(PackRegistry, "load_builtin_packs", fail)
+        assert get_global_registry().list_ids() == expected
+
+    def test_cache_keyed_on_pack_dir_and_version(self, isolated_cache, tmp_path, monkeypatch):
+        """Test that other checkouts and package versions use other cache files."""
+        import prevent_outage_edge_testing
+
+        path = isolated_cache.get_registry_cache_path(tmp_path / "a")
+        assert path != isolated_cache.get_registry_cache_path(tmp_path / "b")
+        monkeypatch.setattr(prevent_outage_edge_testing, "__version__", "9.9.9")
+        assert path != isolated_cache.get_registry_cache_path(tmp_path / "a")
+
+    def test_cache_invalidated_by_older_mtime(self, isolated_cache, local_packs, monkeypatch):
+        """Test that a changed pack file invalidates the cache even if its mtime went back."""
+        import os
+
+        get_global_registry()
+        pack_file = next(local_packs.glob("*.yaml"))
+        st = pack_file.stat()
+        pack_file.write_text(pack_file.read_text() + "\n")
+        os.utime(pack_file, ns=(st.st_atime_ns, st.st_mtime_ns - 10**9))
+
+        monkeypatch.setattr(isolated_cache, "_global_registry", None)
+        reparsed = []
+        original = PackRegistry.load_builtin_packs
+
+        def tracking(self):
+            reparsed.append(True)
+            return original(self)
+
+        monkeypatch.setattr(PackRegistry, "load_builtin_packs", tracking)
+        get_global_registry()
+        assert reparsed
+
+    def test_partial_load_not_cached(self, isolated_cache, local_packs):
+        """Test that a pack file failing to load keeps the pack set out of the cache."""
+        from prevent_outage_edge_testing.registry import get_registry_cache_path
+
+        (local_packs / "broken.yaml").write_text("id: [unterminated\n")
+        registry = get_global_registry()
+
+        assert len(registry) > 0
+        assert not get_registry_cache_path().exists()
+
+    def test_cache_write_failure_cleans_up(self, isolated_cache, tmp_path):
+        """Test that an unpicklable payload leaves neither cache nor temp file."""
+        cache_path = tmp_path / "poet" / "packs.pkl"
+        isolated_cache._write_registry_cache(cache_path, (), [lambda: None])
+        assert list((tmp_path / "poet").iterdir()) == []
+
+
+class TestPackLoader:
+    """Tests for loading packs from disk."""
+
+    @pytest.fixture
+    def loader(self):
+        """Loader over the repository's packs directory."""
+        from prevent_outage_edge_testing.packs.loader import PackLoader
+
+        return PackLoader([Path(__file__).parent.parent / "packs"])
+
+    def test_load_all_without_patterns(self, loader):
+        """Test every pack is loaded when no patterns are given."""
+        ids = sorted(p.id for p in loader.load_all())
+        assert ids == [
+            "edge-http-cache-correctness",
+            "edge-latency-regression-observability",
+            "fault-injection-io",
+        ]
+
+    def test_load_all_exact_ids(self, loader):
+        """Test exact pack ids select just those packs (as with --packs a,b)."""
+        packs = loader.load_all(["fault-injection-io", "edge-http-cache-correctness"])
+        assert sorted(p.id for p in packs) == ["edge-http-cache-correctness", "fault-injection-io"]
+
+    def test_load_all_glob(self, loader):
+        """Test glob patterns select packs by directory name."""
+        packs = loader.load_all(["edge-*"])
+        assert sorted(p.id for p in packs) == [
+            "edge-http-cache-correctness",
+            "edge-latency-regression-observability",
+        ]
+
+    def test_load_all_no_match(self, loader):
+        """Test a pattern matching no pack loads nothing."""
+        assert loader.load_all(["no-such-pack*"]) == []
+
+
+class TestPackLoaderCache:
+    """Tests for the process-wide cache of parsed packs."""
+
+    @pytest.fixture
+    def pack_dir(self, tmp_path):
+        """A private copy of one repository pack that tests may edit."""
+        import shutil
+
+        from prevent_outage_edge_testing.packs.loader import clear_pack_cache
+
+        source = Path(__file__).parent.parent / "packs" / "fault-injection-io"
+        target = tmp_path / "packs" / "fault-injection-io"
+        shutil.copytree(source, target, ignore=shutil.ignore_patterns("__pycache__"))
+        clear_pack_cache()
+        yield target
+        clear_pack_cache()
+
+    @staticmethod
+    def _bump_mtime(path):
+        """Move a file's mtime forward so coarse timestamps still change."""
+        import os
+
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    def test_unchanged_pack_reused(self, pack_dir):
+        """Test a second load of an unchanged pack returns the cached object."""
+        from prevent_outage_edge_testing.packs.loader import PackLoader
+
+        first = PackLoader([pack_dir.parent]).load_pack(pack_dir.name)
+        assert first is not None
+        assert PackLoader([pack_dir.parent]).load_pack(pack_dir.name) is first
+
+    def test_edited_pack_yaml_reparsed(self, pack_dir):
+        """Test editing pack.yaml makes the next load parse the pack again."""
+        from prevent_outage_edge_testing.packs.loader import PackLoader
+
+        loader = PackLoader([pack_dir.parent])
+        first = loader.load_pack(pack_dir.name)
+        pack_yaml = pack_dir / "pack.yaml"
+        pack_yaml.write_text(
+            pack_yaml.read_text().replace(
+                "name: Fault Injection for I/O Operations", "name: Edited Pack"
+            )
+        )
+        self._bump_mtime(pack_yaml)
+
+        second = loader.load_pack(pack_dir.name)
+        assert second is not first
+        assert second.name == "Edited Pack"
+
+    def test_added_recipe_reparsed(self, pack_dir):
+        """Test adding a recipe file makes the next load pick it up."""
+        from prevent_outage_edge_testing.packs.loader import PackLoader
+
+        loader = PackLoader([pack_dir.parent])
+        first = loader.load_pack(pack_dir.name)
+        assert "new-recipe" not in {r.id for r in first.recipes}
+        (pack_dir / "recipes" / "new-recipe.md").write_text("# New Recipe\n")
+        self._bump_mtime(pack_dir / "recipes")
+
+        second = loader.load_pack(pack_dir.name)
+        assert "new-recipe" in {r.id for r in second.recipes}
+
+    def test_clear_pack_cache(self, pack_dir):
+        """Test clear_pack_cache forces the next load to parse again."""
+        from prevent_outage_edge_testing.packs.loader import PackLoader, clear_pack_cache
+
+        loader = PackLoader([pack_dir.parent])
+        first = loader.load_pack(pack_dir.name)
+        clear_pack_cache()
+
+        second = loader.load_pack(pack_dir.name)
+        assert second is not first
+        assert second.id == first.id